@@ -162,3 +162,72 @@ CORS_ALLOW_CREDENTIALS = True
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY")
 SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET") 
+
+# Succession Engine - Compiled legislation snapshot
+# Seconds after which a worker recompiles the snapshot even without a signal
+# (changes made by another process). None = only signal-based invalidation.
+LEGISLATION_SNAPSHOT_TTL = float(os.getenv('LEGISLATION_SNAPSHOT_TTL')) if os.getenv('LEGISLATION_SNAPSHOT_TTL') else None
+# Legislation artifact (python manage.py export_legislation) used as the active
+# legislation instead of the database, e.g. for workers without DB access
+LEGISLATION_ARTIFACT = os.getenv('LEGISLATION_ARTIFACT') or None
+
+# Succession Engine - Async simulate endpoint (/api/v1/simulate/async/, served by config.asgi)
+# Simulations run in a bounded pool ('thread' or 'process' backend) of
+# SIMULATION_ASYNC_WORKERS (0 = CPU count); beyond SIMULATION_ASYNC_MAX_PENDING
+# waiting simulations, requests get 503 with Retry-After (seconds)
+SIMULATION_ASYNC_BACKEND = os.getenv('SIMULATION_ASYNC_BACKEND', 'thread')
+SIMULATION_ASYNC_WORKERS = int(os.getenv('SIMULATION_ASYNC_WORKERS', '0'))
+SIMULATION_ASYNC_MAX_PENDING = int(os.getenv('SIMULATION_ASYNC_MAX_PENDING', '16'))
+SIMULATION_ASYNC_RETRY_AFTER = int(os.getenv('SIMULATION_ASYNC_RETRY_AFTER', '1'))
+
+# Succession Engine - Batch simulation endpoint (/api/v1/simulate/batch/)
+SIMULATION_BATCH_MAX_SIZE = int(os.getenv('SIMULATION_BATCH_MAX_SIZE', '50'))
+
+# Succession Engine - Sensitivity sweep endpoint (/api/v1/simulate/sweep/), max points per sweep
+SIMULATION_SWEEP_MAX_STEPS = int(os.getenv('SIMULATION_SWEEP_MAX_STEPS', '200'))
+
+# Succession Engine - Legislation comparison endpoint (/api/v1/simulate/legislations/), max legislations per call
+SIMULATION_COMPARISON_MAX_LEGISLATIONS = int(os.getenv('SIMULATION_COMPARISON_MAX_LEGISLATIONS', '10'))
+
+# Succession Engine - Donation optimizer endpoint (/api/v1/simulate/donation-plan/), max search time (s)
+SIMULATION_OPTIMIZER_MAX_SECONDS = float(os.getenv('SIMULATION_OPTIMIZER_MAX_SECONDS', '10'))
+
+# Succession Engine - Simulation jobs (/api/v1/simulate/*/jobs/, run by python manage.py simulation_worker)
+# Batch inputs computed between two progress reports, max inputs per batch job,
+# max optimizer search time (s), seconds without heartbeat after which a running
+# job is queued again (keep above the optimizer time), runs before giving up and
+# seconds between two polls of an idle worker
+SIMULATION_JOB_CHUNK_SIZE = int(os.getenv('SIMULATION_JOB_CHUNK_SIZE', '50'))
+SIMULATION_JOB_MAX_INPUTS = int(os.getenv('SIMULATION_JOB_MAX_INPUTS', '10000'))
+SIMULATION_JOB_OPTIMIZER_MAX_SECONDS = float(os.getenv('SIMULATION_JOB_OPTIMIZER_MAX_SECONDS', '300'))
+SIMULATION_JOB_STALE_SECONDS = float(os.getenv('SIMULATION_JOB_STALE_SECONDS', '900'))
+SIMULATION_JOB_MAX_ATTEMPTS = int(os.getenv('SIMULATION_JOB_MAX_ATTEMPTS', '3'))
+SIMULATION_JOB_POLL_INTERVAL = float(os.getenv('SIMULATION_JOB_POLL_INTERVAL', '2'))
+
+# Succession Engine - Parallel simulation executor (batch endpoint, simulate_batch command)
+# Worker processes (0 = CPU count) and inputs sent to a worker at once
+SIMULATION_EXECUTOR_WORKERS = int(os.getenv('SIMULATION_EXECUTOR_WORKERS', '0'))
+SIMULATION_EXECUTOR_CHUNKSIZE = int(os.getenv('SIMULATION_EXECUTOR_CHUNKSIZE', '4'))
+
+# Succession Engine - Stage cache (liquidation / reconstitution memoization)
+# Max entries of the in-process LRU (0 = disabled)
+SIMULATION_STAGE_CACHE_SIZE = int(os.getenv('SIMULATION_STAGE_CACHE_SIZE', '256'))
+# Total size of the serialised stage inputs behind the cached outputs, per worker process (4 MiB)
+SIMULATION_STAGE_CACHE_MAX_BYTES = int(os.getenv('SIMULATION_STAGE_CACHE_MAX_BYTES', str(4 * 1024 * 1024)))
+
+# Succession Engine - Trusted ingestion (internal callers): API keys (X-Api-Key header,
+# comma-separated) whose /api/v1/simulate/ requests skip the DRF parse/render round trips.
+# The /api/v1/internal/simulate/ route is always trusted: expose it on the internal network only.
+SIMULATION_TRUSTED_API_KEYS = [key for key in os.getenv('SIMULATION_TRUSTED_API_KEYS', '').split(',') if key]
+
+# Succession Engine - Result cache for /api/v1/simulate/ ("lru", "django" or "" to disable)
+SIMULATION_RESULT_CACHE_BACKEND = os.getenv('SIMULATION_RESULT_CACHE_BACKEND', 'lru')
+SIMULATION_RESULT_CACHE_SIZE = int(os.getenv('SIMULATION_RESULT_CACHE_SIZE', '512'))
+# Total size of the serialised results kept by the "lru" backend, per worker process (64 MiB)
+SIMULATION_RESULT_CACHE_MAX_BYTES = int(os.getenv('SIMULATION_RESULT_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+SIMULATION_RESULT_CACHE_ALIAS = os.getenv('SIMULATION_RESULT_CACHE_ALIAS', 'default')
+SIMULATION_RESULT_CACHE_TIMEOUT = int(os.getenv('SIMULATION_RESULT_CACHE_TIMEOUT', '3600'))
+
+# Succession Engine - JSON encoder of /api/v1/simulate/ responses: "pydantic" (model_dump_json)
+# or "orjson" (model_dump + orjson.dumps, requires the orjson package)
+SIMULATION_JSON_ENCODER = os.getenv('SIMULATION_JSON_ENCODER', 'pydantic')
@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.db.models import Count
-from .models import Legislation, TaxBracket, Allowance, UsufructScale, SimulationScenario, Donation
+from .models import (
+    Legislation, TaxBracket, Allowance, UsufructScale, SimulationScenario, SimulationResult, SimulationJob, Donation
+)
 
 class TaxBracketInline(admin.TabularInline):
     model = TaxBracket
@@ -219,6 +221,22 @@ class SimulationScenarioAdmin(admin.ModelAdmin):
         return obj.description or "-"
     description_short.short_description = "Description"
 
+
+@admin.register(SimulationResult)
+class SimulationResultAdmin(admin.ModelAdmin):
+    list_display = ('scenario', 'legislation', 'status', 'total_estate_value', 'total_tax_amount', 'computed_at')
+    list_filter = ('legislation', 'status')
+    search_fields = ('scenario__name',)
+    ordering = ('-computed_at',)
+    readonly_fields = ('legislation_fingerprint', 'computed_at')
+
+@admin.register(SimulationJob)
+class SimulationJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'status', 'progress_done', 'progress_total', 'worker', 'created_at', 'finished_at')
+    list_filter = ('kind', 'status')
+    ordering = ('-created_at',)
+    readonly_fields = ('created_at', 'started_at', 'heartbeat_at', 'finished_at', 'legislation_fingerprint')
+
 # Personnalisation du site admin
 admin.site.site_header = "🏛️ Succession Engine - Administration"
 admin.site.site_title = "Succession Engine Admin"
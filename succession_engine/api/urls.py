@@ -1,9 +1,25 @@
 
 from django.urls import path
 from succession_engine.api import views
+from succession_engine.services.jobs import JOB_BATCH, JOB_DONATION_PLAN
 
 urlpatterns = [
     path('scenarios/', views.ScenarioListView.as_view(), name='scenario-list'),
+    path('scenarios/results/', views.ScenarioResultsStreamView.as_view(), name='scenario-results-stream'),
     path('simulate/', views.SimulateSuccessionView.as_view(), name='simulate'),
+    path('simulate/async/', views.SimulateSuccessionAsyncView.as_view(), name='simulate-async'),
+    path('internal/simulate/', views.SimulateSuccessionView.as_view(trusted_ingestion=True), name='simulate-trusted'),
+    path('simulate/batch/', views.SimulateBatchView.as_view(), name='simulate-batch'),
+    path('simulate/spouse-options/', views.CompareSpouseOptionsView.as_view(), name='simulate-spouse-options'),
+    path('simulate/sweep/', views.SimulateSweepView.as_view(), name='simulate-sweep'),
+    path('simulate/legislations/', views.CompareLegislationsView.as_view(), name='simulate-legislations'),
+    path('simulate/donation-plan/', views.OptimizeDonationsView.as_view(), name='simulate-donation-plan'),
+    path('simulate/batch/jobs/', views.SubmitSimulationJobView.as_view(kind=JOB_BATCH), name='simulate-batch-job'),
+    path(
+        'simulate/donation-plan/jobs/', views.SubmitSimulationJobView.as_view(kind=JOB_DONATION_PLAN),
+        name='simulate-donation-plan-job'
+    ),
+    path('simulate/jobs/<uuid:job_id>/', views.SimulationJobView.as_view(), name='simulation-job'),
+    path('simulate/jobs/<uuid:job_id>/result/', views.SimulationJobResultView.as_view(), name='simulation-job-result'),
     path('golden-scenarios/', views.GoldenScenariosView.as_view(), name='golden-scenarios'),
 ]
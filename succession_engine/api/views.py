@@ -1,15 +1,119 @@
+import hmac
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.views import APIView
 from rest_framework.generics import ListCreateAPIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 from pydantic import ValidationError
 
-from succession_engine.schemas import SimulationInput, SuccessionOutput
+from succession_engine.schemas import (
+    SimulationInput, SuccessionOutput, SpouseOptionsInput, SpouseOptionsComparison, DetailLevel,
+    SweepInput, SweepResult, DonationPlanInput, DonationPlanResult,
+    LegislationComparisonInput, LegislationComparison
+)
 from succession_engine.core.calculator import SuccessionCalculator
-from succession_engine.models import SimulationScenario
+from succession_engine.core.executor import get_simulation_executor
+from succession_engine.core.optimizer import DonationOptimizer
+from succession_engine.models import SimulationJob, SimulationScenario
 from succession_engine.api.serializers import SimulationScenarioSerializer
+from succession_engine.services.legislation import get_legislation_snapshot, get_legislation_snapshot_by_id
+from succession_engine.services.result_cache import get_result_cache, result_cache_key, raw_result_cache_key
+from succession_engine.services.json_output import dump_result
+from succession_engine.services.offload import SimulationOverloaded, get_simulation_offloader
+from succession_engine.services.jobs import JOB_BATCH, stream_batch_result, submit_job, validate_batch_item
+from succession_engine.services.scenario_stream import (
+    stream_scenario_results, DEFAULT_STREAM_CHUNK_SIZE, NDJSON_CONTENT_TYPE
+)
+
+# Default maximum number of inputs accepted by the batch endpoint
+DEFAULT_BATCH_MAX_SIZE = 50
+
+# Default maximum number of points of a sensitivity sweep
+DEFAULT_SWEEP_MAX_STEPS = 200
+
+# Default maximum search time of the donation optimizer (seconds)
+DEFAULT_OPTIMIZER_MAX_SECONDS = 10.0
+
+# Default maximum number of legislations compared in one call
+DEFAULT_COMPARISON_MAX_LEGISLATIONS = 10
+
+DETAIL_LEVEL_PARAMETERS = [
+    OpenApiParameter(
+        name="detail_level", type=str, enum=[level.value for level in DetailLevel],
+        description="'summary' = fast mode: global_metrics and heirs_breakdown only (no steps, alerts, explanations)"
+    ),
+    OpenApiParameter(name="explain", type=bool, description="explain=false is a shortcut for detail_level=summary"),
+]
+
+LEGISLATION_PARAMETER = OpenApiParameter(
+    name="legislation", type=int, description="Legislation id to apply (default: the active one)"
+)
+
+
+def query_params(request):
+    """Query string of a DRF Request or of a plain Django HttpRequest (async views)."""
+    return getattr(request, "query_params", request.GET)
+
+
+def get_detail_level(request) -> DetailLevel:
+    """
+    Read the detail level from the query string (?detail_level=full|summary or ?explain=false).
+
+    Raises:
+        ValueError: unknown detail_level
+    """
+    params = query_params(request)
+    explain = params.get("explain")
+    if explain is not None and explain.lower() in ("0", "false", "no"):
+        return DetailLevel.SUMMARY
+    return DetailLevel(params.get("detail_level", DetailLevel.FULL.value))
+
+
+def get_legislation(request):
+    """
+    Legislation snapshot requested with ?legislation=<id>, the active one by default.
+
+    Raises:
+        ValueError: invalid or unknown legislation id
+    """
+    legislation_id = query_params(request).get("legislation")
+    if not legislation_id:
+        return get_legislation_snapshot()
+    return get_legislation_snapshot_by_id(int(legislation_id))
+
+
+TRUSTED_API_KEY_HEADER = "X-Api-Key"
+
+
+def is_trusted_request(request, view=None) -> bool:
+    """
+    Trusted ingestion: the route is declared trusted (as_view(trusted_ingestion=True))
+    or the X-Api-Key header is one of SIMULATION_TRUSTED_API_KEYS.
+    """
+    if getattr(view, "trusted_ingestion", False):
+        return True
+    api_key = request.headers.get(TRUSTED_API_KEY_HEADER)
+    if not api_key:
+        return False
+    return any(
+        hmac.compare_digest(api_key.encode(), trusted_key.encode())
+        for trusted_key in getattr(settings, "SIMULATION_TRUSTED_API_KEYS", [])
+    )
+
+
+def json_bytes_response(content, status_code: int = status.HTTP_200_OK, headers=None) -> HttpResponse:
+    """Already serialised JSON (bytes/str) returned as is, without the DRF renderer."""
+    return HttpResponse(content, status=status_code, content_type="application/json", headers=headers)
+
 
 class ScenarioListView(ListCreateAPIView):
     """
@@ -19,16 +123,77 @@ class ScenarioListView(ListCreateAPIView):
     serializer_class = SimulationScenarioSerializer
     permission_classes = [AllowAny]
 
+def get_int_param(request, name: str, default=None, minimum: int = 0):
+    """
+    Integer query parameter (?name=...), default when absent.
+
+    Raises:
+        ValueError: not an integer or below minimum
+    """
+    raw = request.query_params.get(name)
+    if raw is None or raw == "":
+        return default
+    value = int(raw)
+    if value < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return value
+
+
+class ScenarioResultsStreamView(APIView):
+    """
+    API View streaming the results of the saved scenarios as NDJSON.
+
+    One line per scenario, in scenario id order, computed while the response
+    is sent (bounded memory whatever the number of scenarios). An interrupted
+    stream resumes with ?after=<last scenario_id received>.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        responses={200: dict},
+        parameters=DETAIL_LEVEL_PARAMETERS + [
+            OpenApiParameter(name="after", type=int, description="Resume cursor: last scenario_id already received"),
+            OpenApiParameter(name="limit", type=int, description="Maximum number of scenarios"),
+            OpenApiParameter(name="chunk_size", type=int, description="Scenarios fetched from the database at once"),
+        ],
+        summary="Stream the results of the saved scenarios (NDJSON)",
+        description="Re-computes every saved scenario and streams one JSON result per line (application/x-ndjson)."
+    )
+    def get(self, request):
+        try:
+            detail_level = get_detail_level(request)
+            after = get_int_param(request, "after", 0)
+            limit = get_int_param(request, "limit")
+            chunk_size = get_int_param(request, "chunk_size", DEFAULT_STREAM_CHUNK_SIZE, minimum=1)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        lines = stream_scenario_results(
+            after=after, limit=limit, chunk_size=chunk_size,
+            detail_level=detail_level, legislation=get_legislation_snapshot()
+        )
+        return StreamingHttpResponse(lines, content_type=NDJSON_CONTENT_TYPE)
+
+
 class SimulateSuccessionView(APIView):
     """
     API View to handle succession calculation requests.
     Accepts input data, triggers the orchestrator, and returns the calculation result.
+
+    The result is serialised once to JSON bytes (explanations added during
+    serialisation, see services.json_output) and returned without the DRF renderer.
+
+    Trusted ingestion (internal route or trusted API key, see is_trusted_request):
+    the raw JSON body is parsed and validated in one pydantic-core pass (no DRF
+    parsing into Python dicts) and the result cache is keyed on the raw body.
     """
     permission_classes = [AllowAny]
+    trusted_ingestion = False
     
     @extend_schema(
         request=SimulationInput,
         responses={200: SuccessionOutput},
+        parameters=DETAIL_LEVEL_PARAMETERS + [LEGISLATION_PARAMETER],
         summary="Simulate a succession",
         description="Calculates the succession details (assets, rights, duties) based on the provided simulation input."
     )
@@ -36,34 +201,465 @@ class SimulateSuccessionView(APIView):
         """
         Handles POST requests for succession calculation.
         """
+        trusted = is_trusted_request(request, self)
         try:
             # 1. Validate Input with Pydantic
             # We use the Pydantic model directly to validate the JSON payload
-            simulation_input = SimulationInput(**request.data)
+            detail_level = get_detail_level(request)
+            legislation = get_legislation(request)
+            if trusted:
+                simulation_input = SimulationInput.model_validate_json(request.body)
+            else:
+                simulation_input = SimulationInput(**request.data)
         except ValidationError as e:
             # Return 400 if validation fails
             return Response({"errors": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
              return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+        # 2. Serve identical simulations from the result cache (same input,
+        #    same legislation version, same day): no calculation, no explainer
+        result_cache = get_result_cache()
+        cache_key = None
+        if result_cache is not None:
+            if trusted:
+                cache_key = raw_result_cache_key(request.body, legislation, detail_level)
+            else:
+                cache_key = result_cache_key(simulation_input, legislation, detail_level)
+            cached_result = result_cache.get(cache_key)
+            if cached_result is not None:
+                return json_bytes_response(cached_result, headers={"X-Result-Cache": "HIT"})
+
         try:
-            # 2. Run Calculation
-            calculator = SuccessionCalculator()
-            result = calculator.run(simulation_input)
+            # 3. Run Calculation
+            calculator = SuccessionCalculator(legislation=legislation)
+            result = calculator.run(simulation_input, detail_level=detail_level)
+            
+            # 4. Serialise once, enriched with explanations from rule dictionary (decoupled presentation)
+            content = dump_result(result, detail_level)
             
-            # 3. Enrich with explanations from rule dictionary (decoupled presentation)
-            from succession_engine.services.explainer import explainer
-            result_dict = result.model_dump()
-            enriched_result = explainer.enrich_output(result_dict)
+            headers = None
+            if cache_key is not None:
+                result_cache.set(cache_key, content)
+                headers = {"X-Result-Cache": "MISS"}
             
-            # 4. Return Enriched Result
-            return Response(enriched_result, status=status.HTTP_200_OK)
+            # 5. Return Enriched Result
+            return json_bytes_response(content, headers=headers)
             
         except Exception as e:
             # Handle unexpected errors during calculation
             return Response({"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@method_decorator(csrf_exempt, name="dispatch")
+class SimulateSuccessionAsyncView(View):
+    """
+    Async variant of SimulateSuccessionView for ASGI servers (config.asgi).
+
+    Same input, query parameters and output. The raw JSON body is validated
+    in one pydantic-core pass and the calculation runs off the event loop in
+    the bounded SimulationOffloader pool: a slow simulation never blocks other
+    clients, and beyond SIMULATION_ASYNC_WORKERS running plus
+    SIMULATION_ASYNC_MAX_PENDING waiting simulations the request is refused
+    at once with 503 and Retry-After.
+    """
+    http_method_names = ["post", "options"]
+
+    async def post(self, request):
+        try:
+            detail_level = get_detail_level(request)
+            # First use may compile the snapshot from the database
+            legislation = await sync_to_async(get_legislation)(request)
+            simulation_input = SimulationInput.model_validate_json(request.body)
+        except ValidationError as e:
+            return json_bytes_response(
+                b'{"errors":' + e.json().encode() + b'}', status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        result_cache = get_result_cache()
+        cache_key = None
+        if result_cache is not None:
+            cache_key = result_cache_key(simulation_input, legislation, detail_level)
+            cached_result = await result_cache.aget(cache_key)
+            if cached_result is not None:
+                return json_bytes_response(cached_result, headers={"X-Result-Cache": "HIT"})
+
+        try:
+            content = await get_simulation_offloader().submit(simulation_input, legislation, detail_level)
+        except SimulationOverloaded as e:
+            return JsonResponse(
+                {"error": "Simulation capacity reached, retry later", "details": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(getattr(settings, "SIMULATION_ASYNC_RETRY_AFTER", 1))}
+            )
+        except Exception as e:
+            return JsonResponse(
+                {"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        headers = None
+        if cache_key is not None:
+            await result_cache.aset(cache_key, content)
+            headers = {"X-Result-Cache": "MISS"}
+        return json_bytes_response(content, headers=headers)
+
+
+class SimulateBatchView(APIView):
+    """
+    API View to run many simulations in a single request.
+    
+    Accepts a JSON array of SimulationInput (or {"inputs": [...]}), validates
+    every item in one pass, runs the valid ones on the process-wide
+    SimulationExecutor (warm workers holding the compiled legislation snapshot,
+    in-process until they are warm) and returns per-item results or errors in
+    input order.
+    """
+    permission_classes = [AllowAny]
+    
+    @extend_schema(
+        request=dict,
+        responses={200: dict},
+        parameters=DETAIL_LEVEL_PARAMETERS,
+        summary="Simulate a batch of successions",
+        description=(
+            "Accepts an array of simulation inputs (max SIMULATION_BATCH_MAX_SIZE) and returns, "
+            "in the same order, either the enriched result or the validation/calculation errors of each item."
+        )
+    )
+    def post(self, request):
+        """
+        Handles POST requests for batch succession calculation.
+        """
+        try:
+            detail_level = get_detail_level(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        payload = request.data
+        items = payload.get("inputs") if isinstance(payload, dict) else payload
+        if not isinstance(items, list):
+            return Response(
+                {"error": "Expected a JSON array of simulation inputs (or {\"inputs\": [...]})."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        max_size = getattr(settings, 'SIMULATION_BATCH_MAX_SIZE', DEFAULT_BATCH_MAX_SIZE)
+        if len(items) > max_size:
+            return Response(
+                {"error": f"Batch too large: {len(items)} inputs (max {max_size})."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+        
+        # 1. Validate all inputs in one pass
+        parsed = [validate_batch_item(item) for item in items]
+        
+        # 2. Run valid inputs on the shared executor (one legislation snapshot for the whole batch)
+        valid_indexes = [index for index, (simulation_input, _) in enumerate(parsed) if simulation_input is not None]
+        executor = get_simulation_executor()
+        outcomes = dict(zip(
+            valid_indexes, executor.map([parsed[index][0] for index in valid_indexes], detail_level=detail_level)
+        ))
+        
+        results = []
+        for index, (_, error) in enumerate(parsed):
+            outcome = outcomes[index] if error is None else {"status": "error", **error}
+            results.append({"index": index, **outcome})
+        
+        succeeded = sum(1 for r in results if r["status"] == "ok")
+        return Response({
+            "count": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }, status=status.HTTP_200_OK)
+
+
+class CompareSpouseOptionsView(APIView):
+    """
+    API View to compare the surviving spouse options (Art. 757 / 1094-1 CC).
+    
+    Liquidation and reconstitution are computed once; only devolution and
+    taxation are re-run per option. Returns the results side by side with
+    per-heir deltas against the first option.
+    """
+    permission_classes = [AllowAny]
+    
+    @extend_schema(
+        request=SpouseOptionsInput,
+        responses={200: SpouseOptionsComparison},
+        summary="Compare spouse options",
+        description="Runs the simulation for each spouse option (usufruct, 1/4 full ownership, disposable quota) and compares the results per heir."
+    )
+    def post(self, request):
+        """
+        Handles POST requests for spouse option comparison.
+        """
+        try:
+            comparison_input = SpouseOptionsInput(**request.data)
+        except ValidationError as e:
+            return Response({"errors": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        calculator = SuccessionCalculator()
+        try:
+            comparison = calculator.compare_spouse_options(
+                comparison_input.simulation, comparison_input.options
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # Serialise once, option results enriched with explanations from the rule dictionary
+        return json_bytes_response(dump_result(comparison, DetailLevel.FULL))
+
+
+class CompareLegislationsView(APIView):
+    """
+    API View to evaluate one simulation under several legislations side by side
+    (e.g. current finance law vs a draft), without changing the active legislation.
+
+    Steps 1-3 are shared, only the taxation is re-run per legislation. Returns
+    the results with total and per-heir tax deltas against the first legislation.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        request=LegislationComparisonInput,
+        responses={200: LegislationComparison},
+        parameters=DETAIL_LEVEL_PARAMETERS,
+        summary="Compare legislations",
+        description=(
+            "Runs the simulation under each legislation of legislation_ids "
+            "(max SIMULATION_COMPARISON_MAX_LEGISLATIONS) and returns a diff table against the first one."
+        )
+    )
+    def post(self, request):
+        """
+        Handles POST requests for legislation comparison.
+        """
+        try:
+            detail_level = get_detail_level(request)
+            comparison_input = LegislationComparisonInput(**request.data)
+        except ValidationError as e:
+            return Response({"errors": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        max_legislations = getattr(
+            settings, 'SIMULATION_COMPARISON_MAX_LEGISLATIONS', DEFAULT_COMPARISON_MAX_LEGISLATIONS
+        )
+        if len(comparison_input.legislation_ids) > max_legislations:
+            return Response(
+                {"error": f"Too many legislations: {len(comparison_input.legislation_ids)} (max {max_legislations})."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            legislations = [
+                get_legislation_snapshot_by_id(legislation_id)
+                for legislation_id in comparison_input.legislation_ids
+            ]
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            comparison = SuccessionCalculator().compare_legislations(
+                comparison_input.simulation, legislations, detail_level=detail_level
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return json_bytes_response(dump_result(comparison, detail_level))
+
+
+class SimulateSweepView(APIView):
+    """
+    API View for sensitivity sweeps: duties as a function of one value.
+    
+    Varies an asset value, a donation value or a debt amount from start to
+    stop and returns the total tax and each heir's tax / net share per point.
+    Points run in fast mode; the liquidation is shared when assets are not swept.
+    """
+    permission_classes = [AllowAny]
+    
+    @extend_schema(
+        request=SweepInput,
+        responses={200: SweepResult},
+        summary="Sensitivity sweep",
+        description=(
+            "Runs the simulation for `steps` values of one numeric field (max SIMULATION_SWEEP_MAX_STEPS) "
+            "and returns the series of total tax and per-heir net shares."
+        )
+    )
+    def post(self, request):
+        """
+        Handles POST requests for sensitivity sweeps.
+        """
+        try:
+            sweep_input = SweepInput(**request.data)
+        except ValidationError as e:
+            return Response({"errors": e.errors(include_url=False, include_context=False)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        max_steps = getattr(settings, 'SIMULATION_SWEEP_MAX_STEPS', DEFAULT_SWEEP_MAX_STEPS)
+        if sweep_input.steps > max_steps:
+            return Response(
+                {"error": f"Sweep too large: {sweep_input.steps} points (max {max_steps})."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        calculator = SuccessionCalculator()
+        try:
+            result = calculator.sweep(
+                sweep_input.simulation, sweep_input.target, sweep_input.target_id, sweep_input.values()
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(result.model_dump(), status=status.HTTP_200_OK)
+
+
+class OptimizeDonationsView(APIView):
+    """
+    API View for donation planning: searches donation amounts and dates per
+    heir that minimise donation + succession duties (see core.optimizer).
+    """
+    permission_classes = [AllowAny]
+    
+    @extend_schema(
+        request=DonationPlanInput,
+        responses={200: DonationPlanResult},
+        summary="Optimise a donation schedule",
+        description=(
+            "Returns the best donation schedules found within time_budget_seconds "
+            "(capped by SIMULATION_OPTIMIZER_MAX_SECONDS), with their duties and savings."
+        )
+    )
+    def post(self, request):
+        """
+        Handles POST requests for donation planning.
+        """
+        try:
+            plan_input = DonationPlanInput(**request.data)
+        except ValidationError as e:
+            return Response({"errors": e.errors(include_url=False, include_context=False)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        max_seconds = getattr(settings, 'SIMULATION_OPTIMIZER_MAX_SECONDS', DEFAULT_OPTIMIZER_MAX_SECONDS)
+        if plan_input.time_budget_seconds > max_seconds:
+            plan_input = plan_input.model_copy(update={"time_budget_seconds": max_seconds})
+
+        try:
+            result = DonationOptimizer(plan_input).optimize()
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": "Calculation failed", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(result.model_dump(), status=status.HTTP_200_OK)
+
+
+def job_status(request, job: SimulationJob) -> dict:
+    """Public state of a SimulationJob (poll endpoint body)."""
+    return {
+        "id": str(job.pk),
+        "kind": job.kind,
+        "status": job.status,
+        "progress": {"done": job.progress_done, "total": job.progress_total},
+        "error": job.error or None,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "result_url": request.build_absolute_uri(reverse("simulation-job-result", args=[job.pk])),
+    }
+
+
+class SubmitSimulationJobView(APIView):
+    """
+    API View queueing a long simulation as a SimulationJob (see services.jobs).
+
+    Same body and query parameters as the synchronous endpoint of the job kind
+    (as_view(kind=...)): batch inputs or donation plan. The simulation_worker
+    command runs the job; poll it at the Location URL.
+    """
+    permission_classes = [AllowAny]
+    kind = JOB_BATCH
+
+    @extend_schema(
+        request=dict,
+        responses={202: dict},
+        parameters=DETAIL_LEVEL_PARAMETERS + [LEGISLATION_PARAMETER],
+        summary="Queue a simulation job",
+        description=(
+            "Stores the job and returns 202 with its id, progress and result URL; "
+            "a simulation_worker process computes it."
+        )
+    )
+    def post(self, request):
+        """
+        Handles POST requests queueing a job.
+        """
+        try:
+            detail_level = get_detail_level(request)
+            legislation_id = get_int_param(request, "legislation", minimum=1)
+            job = submit_job(self.kind, request.data, detail_level, legislation_id)
+        except ValidationError as e:
+            return Response({"errors": e.errors(include_url=False, include_context=False)}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            job_status(request, job), status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("simulation-job", args=[job.pk])}
+        )
+
+
+class SimulationJobView(APIView):
+    """
+    API View polling a SimulationJob: status and progress.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(responses={200: dict}, summary="Get a simulation job status")
+    def get(self, request, job_id):
+        job = SimulationJob.objects.defer("input_data", "result").filter(pk=job_id).first()
+        if job is None:
+            return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job_status(request, job), status=status.HTTP_200_OK)
+
+
+class SimulationJobResultView(APIView):
+    """
+    API View returning the result of a finished SimulationJob
+    (409 with the job status while it is queued, running or failed).
+
+    Batch results are streamed from the chunks saved by the worker (same body
+    as /api/v1/simulate/batch/), never loaded whole in memory.
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(responses={200: dict, 409: dict}, summary="Get a simulation job result")
+    def get(self, request, job_id):
+        job = SimulationJob.objects.defer("input_data").filter(pk=job_id).first()
+        if job is None:
+            return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        if job.status != 'done':
+            return Response(job_status(request, job), status=status.HTTP_409_CONFLICT)
+        if job.kind == JOB_BATCH:
+            return StreamingHttpResponse(stream_batch_result(job), content_type="application/json")
+        return Response(job.result, status=status.HTTP_200_OK)
+
+
 class GoldenScenariosView(APIView):
     """
     API View to serve golden scenarios for testing.
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SuccessionEngineConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'succession_engine'
+
+    def ready(self):
+        from succession_engine.services.provider import DjangoProvider, set_engine_provider
+        from succession_engine.signals import connect_legislation_signals
+        set_engine_provider(DjangoProvider())
+        connect_legislation_signals()
@@ -41,6 +41,20 @@ LIFE_INSURANCE_ALLOWANCE_AFTER_70 = 30_500.0    # Abattement global tous bénéf
 # Usufruct Valuation (Maximum age in barème fiscal - Art. 669 CGI)
 MAX_USUFRUCT_AGE = 120  # Au-delà de 91 ans : 10%
 
+# Barème fiscal de l'usufruit (Art. 669 I CGI), used if the legislation has no scale
+# (max_age exclusive, usufruct rate)
+DEFAULT_USUFRUCT_SCALE = (
+    (21, 0.90),   # < 21 ans
+    (31, 0.80),   # 21-30 ans
+    (41, 0.70),   # 31-40 ans
+    (51, 0.60),   # 41-50 ans
+    (61, 0.50),   # 51-60 ans
+    (71, 0.40),   # 61-70 ans
+    (81, 0.30),   # 71-80 ans
+    (91, 0.20),   # 81-90 ans
+    (999, 0.10),  # > 91 ans
+)
+
 # Default values
 DEFAULT_RESERVE_FRACTION = 0.0  # Pas de réserve si ni enfants ni parents
 
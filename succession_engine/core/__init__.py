@@ -6,25 +6,39 @@ This module provides the main calculation logic:
 - Liquidation: Matrimonial regime handling
 - Estate: Estate reconstitution
 - Devolution: Heir shares and legal reserve
+- Index: Per-run lookups (assets, members, donations) shared by the steps
+- Executor: Parallel execution of simulation batches
+- Optimizer: Donation schedule search driving the calculator
 """
 
 from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.core.index import SimulationIndex, MemberIndex
 from succession_engine.core.liquidation import MatrimonialLiquidator
-from succession_engine.core.estate import get_reportable_donations, reconstitute_estate
+from succession_engine.core.estate import ReportableDonation, get_reportable_donations, reconstitute_estate
 from succession_engine.core.devolution import (
+    BequestAllocation,
     calculate_legal_reserve,
     process_specific_bequests,
     HeirShareCalculator,
     check_excessive_liberalities
 )
+from succession_engine.core.executor import SimulationExecutor, get_simulation_executor
+from succession_engine.core.optimizer import DonationOptimizer
 
 __all__ = [
     'SuccessionCalculator',
+    'SimulationIndex',
+    'MemberIndex',
     'MatrimonialLiquidator',
+    'ReportableDonation',
     'get_reportable_donations',
     'reconstitute_estate',
     'calculate_legal_reserve',
+    'BequestAllocation',
     'process_specific_bequests',
     'HeirShareCalculator',
     'check_excessive_liberalities',
+    'SimulationExecutor',
+    'get_simulation_executor',
+    'DonationOptimizer',
 ]
@@ -7,9 +7,20 @@ class AlertManager:
     Permet de créer des alertes structurées pour l'utilisateur (guidage) et le notaire (vigilance).
     """
 
-    def __init__(self):
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled: False en mode rapide (DetailLevel.SUMMARY) : aucune alerte n'est construite
+        """
+        self.enabled = enabled
         self.alerts: List[Alert] = []
 
+    def fork(self) -> 'AlertManager':
+        """Copie indépendante (les alertes déjà émises ne sont jamais modifiées, elles sont partagées)."""
+        clone = AlertManager(enabled=self.enabled)
+        clone.alerts = list(self.alerts)
+        return clone
+
     def add(
         self,
         severity: AlertSeverity,
@@ -19,6 +30,8 @@ class AlertManager:
         details: Optional[str] = None
     ):
         """Ajoute une alerte structurée."""
+        if not self.enabled:
+            return
         self.alerts.append(Alert(
             severity=severity,
             audience=audience,
@@ -0,0 +1,183 @@
+"""
+Stage cache - Memoization of pipeline stage outputs by content hash.
+
+Interactive clients re-POST the whole SimulationInput after every edit, while
+usually a single field changes. Each cached stage is keyed by a canonical hash
+of the inputs it actually reads, so unchanged stages are reused across
+requests:
+
+- Liquidation: assets, regime, marriage date, matrimonial advantages
+  (+ members when advantages apply, for the action en retranchement)
+- Reconstitution / droit de retour: liquidation key, donations, debts,
+  members, residence country, heir warnings
+
+Devolution and taxation depend on the wishes and the legislation and are
+not cached here (see the result cache for whole-response caching).
+
+Cached values are never handed out directly: callers get a fork (own tracer
+and alerts), the cached copy stays pristine.
+
+Entries are bounded by count and by weight: a stage output (liquidator,
+tracer, index) grows with the inputs it was computed from, so each entry
+weighs the size of its serialised stage inputs and the cache keeps their
+total under SIMULATION_STAGE_CACHE_MAX_BYTES.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from succession_engine.services.provider import get_engine_provider
+
+# Default number of entries kept by the process-wide stage cache
+DEFAULT_STAGE_CACHE_SIZE = 256
+# Default total weight (serialised stage input bytes) of the stage cache (4 MiB)
+DEFAULT_STAGE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Canonical JSON-compatible form of stage inputs (models, enums, dates, containers)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode='json')
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    return value
+
+
+def _canonical_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if isinstance(value, BaseModel):
+        # Serialised by pydantic-core in field declaration order: independent of
+        # the key order of the client payload.
+        return value.model_dump_json().encode('utf-8')
+    if isinstance(value, (list, tuple)) and value and all(isinstance(v, BaseModel) for v in value):
+        return b'[' + b','.join(_canonical_bytes(v) for v in value) + b']'
+    return json.dumps(
+        _to_jsonable(value), sort_keys=True, separators=(',', ':'),
+        ensure_ascii=False, default=str
+    ).encode('utf-8')
+
+
+def canonical_hash(*parts: Any) -> str:
+    """
+    SHA-256 of the canonical serialisation of parts.
+
+    Key order and whitespace of the original payload do not matter, so two
+    inputs with the same content always produce the same key. Prefer passing
+    one model_dump_json(include=...) string over many sub-models: a single
+    pydantic-core call is much cheaper than one per item.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(_canonical_bytes(part))
+        digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache bounded by a number of entries and by
+    the total weight of the entries (None = no weight bound).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_STAGE_CACHE_SIZE, max_weight: Optional[int] = None):
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.total_weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it most recently used) or default."""
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, weight: int = 1) -> None:
+        """Store a value, evicting the least recently used entries beyond maxsize / max_weight."""
+        if self.maxsize <= 0 or (self.max_weight is not None and weight > self.max_weight):
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.total_weight -= previous[1]
+            self._data[key] = (value, weight)
+            self.total_weight += weight
+            while len(self._data) > self.maxsize or (
+                self.max_weight is not None and self.total_weight > self.max_weight
+            ):
+                _, (_, evicted_weight) = self._data.popitem(last=False)
+                self.total_weight -= evicted_weight
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.total_weight -= previous[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_weight = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+
+# --- Process-wide stage cache ---
+
+_stage_cache: Optional[LRUCache] = None
+_stage_cache_lock = threading.Lock()
+
+
+def get_stage_cache() -> Optional[LRUCache]:
+    """
+    Return the process-wide stage cache, sized by SIMULATION_STAGE_CACHE_SIZE
+    and SIMULATION_STAGE_CACHE_MAX_BYTES.
+
+    Returns None when the setting is 0 (stage caching disabled).
+    """
+    global _stage_cache
+    if _stage_cache is None:
+        provider = get_engine_provider()
+        maxsize = provider.setting('SIMULATION_STAGE_CACHE_SIZE', DEFAULT_STAGE_CACHE_SIZE)
+        max_weight = provider.setting('SIMULATION_STAGE_CACHE_MAX_BYTES', DEFAULT_STAGE_CACHE_MAX_BYTES)
+        with _stage_cache_lock:
+            if _stage_cache is None:
+                _stage_cache = LRUCache(maxsize=maxsize, max_weight=max_weight)
+    return _stage_cache if _stage_cache.maxsize > 0 else None
+
+
+def reset_stage_cache() -> None:
+    """Drop the process-wide stage cache (it is rebuilt from settings on next use)."""
+    global _stage_cache
+    with _stage_cache_lock:
+        _stage_cache = None
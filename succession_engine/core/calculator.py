@@ -11,19 +11,36 @@ Pipeline:
 4. Calcul de la fiscalité (Art. 750+ CGI)
 """
 
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 
 from succession_engine.schemas import (
     SimulationInput, SuccessionOutput, GlobalMetrics,
     HeirBreakdown, HeirRelation, CalculationStep, AssetBreakdown,
-    SpouseDetails, FamilyContext, LiquidationDetails
+    SpouseDetails, FamilyContext, LiquidationDetails,
+    Wishes, SpouseChoice, SpouseChoiceType,
+    SpouseOptionResult, SpouseOptionsComparison, HeirOptionComparison,
+    DetailLevel, SuccessionSummaryOutput,
+    SweepTarget, SweepResult, HeirSweepSeries,
+    LegislationResult, LegislationComparison, HeirLegislationComparison,
+    AssetOrigin, AdoptionType, ReceivedAsset, ExplanationKey,
+    OwnershipMode, LifeInsuranceBeneficiary, LifeInsuranceContractType
 )
 from datetime import date
 from succession_engine.rules.fiscal import FiscalCalculator
+from succession_engine.rules.fiscal_vectorized import calculate_inheritance_taxes
+from succession_engine.rules.usufruct import UsufructValuator
+from succession_engine.rules.life_insurance import LifeInsuranceCalculator
+from succession_engine.services.legislation import LegislationSnapshot, get_legislation_snapshot
+from succession_engine.core.cache import canonical_hash, get_stage_cache
+from succession_engine.core.index import SimulationIndex, MemberIndex, group_by
 from succession_engine.core.liquidation import MatrimonialLiquidator
-from succession_engine.core.estate import get_reportable_donations, reconstitute_estate, get_donations_for_reunion_fictive
+from succession_engine.core.tracer import BusinessLogicTracer
+from succession_engine.core.estate import (
+    ReportableDonation, get_reportable_donations, reconstitute_estate, get_donations_for_reunion_fictive
+)
 from succession_engine.core.devolution import (
-    calculate_legal_reserve, process_specific_bequests,
+    BequestAllocation, calculate_legal_reserve, process_specific_bequests,
     HeirShareCalculator, check_excessive_liberalities,
     calculate_droit_de_retour
 )
@@ -32,54 +49,387 @@ from succession_engine.core.devolution import (
 from succession_engine.core.alerts import AlertManager
 from succession_engine.schemas import AlertAudience, AlertCategory, AlertSeverity
 
+# SimulationInput fields read by each cached stage (stage cache keys).
+# Members only matter to the liquidation through matrimonial advantages.
+LIQUIDATION_INPUT_FIELDS = frozenset({
+    'matrimonial_regime', 'marriage_date', 'assets', 'matrimonial_advantages'
+})
+RECONSTITUTION_INPUT_FIELDS = frozenset({
+    'donations', 'debts', 'members', 'residence_country', 'heir_warnings'
+})
+
+
+@dataclass
+class PreparedEstate:
+    """
+    Outputs of steps 1-2 (liquidation, reconstitution, droit de retour).
+
+    They do not depend on the wishes, so several devolution/taxation variants
+    can be run from one PreparedEstate (see fork()). The index (lookups over
+    the input) is built here and reused by steps 3-4.
+    """
+    liquidator: MatrimonialLiquidator
+    net_assets: float
+    reportable_donations: List
+    reportable_donations_value: float
+    net_succession_assets: float
+    alert_manager: AlertManager
+    tracer: Optional['BusinessLogicTracer']
+    index: SimulationIndex
+
+    def fork(self) -> 'PreparedEstate':
+        """Copy with its own tracer and alerts (liquidation results and index are shared, read-only)."""
+        return replace(
+            self,
+            alert_manager=self.alert_manager.fork(),
+            tracer=self.tracer.fork() if self.tracer else None
+        )
+
+
+@dataclass
+class LiquidatedEstate:
+    """Outputs of step 1 (liquidation), reusable across reconstitution variants."""
+    liquidator: MatrimonialLiquidator
+    net_assets: float
+    tracer: Optional['BusinessLogicTracer']
+
+    def fork(self) -> 'LiquidatedEstate':
+        """Copy with its own tracer (the liquidator is shared, read-only)."""
+        return replace(self, tracer=self.tracer.fork() if self.tracer else None)
+
+
+@dataclass
+class DevolvedEstate:
+    """
+    Outputs of step 3 (devolution), reusable across taxation variants.
+
+    The devolution only reads the legislation through its usufruct scale, so
+    it can be shared by legislations with the same scale (see
+    compare_legislations); fork() before each taxation.
+    """
+    prepared: PreparedEstate
+    share_calculator: HeirShareCalculator
+    heir_shares: Dict[str, float]
+    reunion_value: float
+    legal_reserve: float
+    disposable_quota: float
+    specific_bequests_info: List
+
+    def fork(self) -> 'DevolvedEstate':
+        """Copy with its own tracer and alerts (shares and share calculator are shared, read-only)."""
+        return replace(self, prepared=self.prepared.fork())
+
+
 class SuccessionCalculator:
     """
     Main orchestrator for the succession calculation pipeline.
     """
 
-    def run(self, input_data: SimulationInput) -> SuccessionOutput:
+    def __init__(self, legislation: LegislationSnapshot = None, use_stage_cache: bool = True):
+        """
+        Args:
+            legislation: Compiled legislation to use. If None, the cached
+                active snapshot is resolved at the start of each run.
+            use_stage_cache: Reuse liquidation/reconstitution outputs of
+                identical stage inputs (process-wide LRU, see core.cache)
+        """
+        self.legislation = legislation
+        self.stage_cache = get_stage_cache() if use_stage_cache else None
+
+    def run(
+        self, input_data: SimulationInput, detail_level: DetailLevel = DetailLevel.FULL
+    ) -> Union[SuccessionOutput, SuccessionSummaryOutput]:
         """
         Execute the complete succession calculation.
+
+        Args:
+            input_data: Simulation input
+            detail_level: FULL (default) builds the pedagogical trace, alerts and
+                explanation keys. SUMMARY is the fast mode for batch/optimisation
+                callers: no tracer, no alerts, and a SuccessionSummaryOutput
+                (global_metrics + heirs_breakdown) with the same figures.
         """
+        legislation = self.legislation or get_legislation_snapshot()
+        explain = detail_level == DetailLevel.FULL
+        prepared = self.prepare_estate(input_data, explain=explain)
+        return self.complete(input_data, prepared, legislation=legislation, detail_level=detail_level)
 
-        alert_manager = AlertManager()
-        
-        # Initialize Tracer for Explicability (Phase 9)
-        from succession_engine.core.tracer import BusinessLogicTracer
-        tracer = BusinessLogicTracer()
+    def compare_spouse_options(
+        self, input_data: SimulationInput, options: List[SpouseChoiceType] = None
+    ) -> SpouseOptionsComparison:
+        """
+        Compare the surviving spouse options (Art. 757 / 1094-1 CC) side by side.
+
+        Steps 1-2 (liquidation, reconstitution, droit de retour) do not depend
+        on the option: they run once, then only devolution and taxation are
+        run per option on a fork of the prepared estate.
+
+        Args:
+            input_data: Simulation input (its spouse_choice, if any, is ignored)
+            options: Options to compare (default: USUFRUCT, QUARTER_OWNERSHIP,
+                and DISPOSABLE_QUOTA when has_spouse_donation is set)
+
+        Raises:
+            ValueError: if there is no spouse among the members
+        """
+        if not any(h.relationship == HeirRelation.SPOUSE for h in input_data.members):
+            raise ValueError("La comparaison des options nécessite un conjoint survivant.")
+
+        wishes = input_data.wishes or Wishes()
+        if not options:
+            options = [SpouseChoiceType.USUFRUCT, SpouseChoiceType.QUARTER_OWNERSHIP]
+            if wishes.has_spouse_donation:
+                options.append(SpouseChoiceType.DISPOSABLE_QUOTA)
+
+        legislation = self.legislation or get_legislation_snapshot()
+        prepared = self.prepare_estate(input_data)
+
+        option_results = []
+        for option in options:
+            variant_input = input_data.model_copy(update={
+                "wishes": wishes.model_copy(update={"spouse_choice": SpouseChoice(choice=option)})
+            })
+            result = self.complete(variant_input, prepared.fork(), legislation=legislation)
+            option_results.append(SpouseOptionResult(
+                option=option,
+                total_tax_amount=result.global_metrics.total_tax_amount,
+                total_net_value=sum(h.net_share_value for h in result.heirs_breakdown),
+                result=result
+            ))
+
+        return SpouseOptionsComparison(
+            reference_option=options[0],
+            options=option_results,
+            heirs_comparison=self._build_heirs_comparison(option_results)
+        )
+
+    def sweep(
+        self, input_data: SimulationInput, target: SweepTarget, target_id: str, values: Sequence[float]
+    ) -> SweepResult:
+        """
+        Sensitivity sweep: total tax and per-heir net shares as one numeric
+        field (asset value, donation value, debt amount) varies.
+
+        Every point runs in fast mode (no tracer, alerts or explanations).
+        Donation and debt sweeps leave the assets untouched: the liquidation
+        runs once and only steps 2-4 are re-run per point. Reserve, usufruct,
+        reduction and allowances are not linear in the swept value, so the
+        later steps are always recomputed; only the tax scale is applied
+        afterwards, to each heir's net taxable bases of all points at once
+        (rules.fiscal_vectorized).
+
+        Raises:
+            ValueError: if target_id does not match any asset/donation/debt
+        """
+        variants = [self._sweep_variant(input_data, target, target_id, value) for value in values]
+        legislation = self.legislation or get_legislation_snapshot()
+
+        liquidated = None
+        if target != SweepTarget.ASSET_VALUE:
+            liquidated = self._liquidate(input_data, explain=False)
+
+        results = []
+        for variant in variants:
+            # Stage cache bypassed: one-off variants would only evict useful entries
+            variant_liquidated = liquidated.fork() if liquidated else self._liquidate(variant, explain=False)
+            prepared = self._reconstitute(variant, variant_liquidated, explain=False)
+            devolved = self._devolve(variant, prepared, legislation)
+            results.append(self._tax(variant, devolved, legislation, DetailLevel.SUMMARY, apply_scale=False))
+
+        # Tax scale: one vectorized pass per heir over all points
+        heir_taxes = {}
+        for member in input_data.members:
+            rows = [next(h for h in result.heirs_breakdown if h.id == member.id) for result in results]
+            relationship = FiscalCalculator.tax_relationship(
+                member.relationship,
+                member.adoption_type == AdoptionType.SIMPLE,
+                member.has_received_continuous_care
+            )
+            taxes = calculate_inheritance_taxes(
+                [row.taxable_base for row in rows], relationship, legislation
+            ).taxes.tolist()
+            heir_taxes[member.id] = (rows, taxes)
+
+        # Same summation order as the scalar path: heirs first, then life insurance
+        total_tax_amount = []
+        for point, result in enumerate(results):
+            heirs_tax = 0.0
+            for heir in result.heirs_breakdown:
+                heirs_tax += heir_taxes[heir.id][1][point]
+            total_tax_amount.append(heirs_tax + result.global_metrics.total_tax_amount)
+
+        heirs = []
+        for member in input_data.members:
+            rows, taxes = heir_taxes[member.id]
+            heirs.append(HeirSweepSeries(
+                id=member.id,
+                name=rows[0].name if rows else member.id,
+                relationship=member.relationship,
+                tax_amount=taxes,
+                net_share_value=[row.net_share_value - tax for row, tax in zip(rows, taxes)]
+            ))
+
+        return SweepResult(
+            target=target,
+            target_id=target_id,
+            values=list(values),
+            total_estate_value=[result.global_metrics.total_estate_value for result in results],
+            total_tax_amount=total_tax_amount,
+            heirs=heirs
+        )
+
+    def compare_legislations(
+        self, input_data: SimulationInput, legislations: Sequence[LegislationSnapshot],
+        detail_level: DetailLevel = DetailLevel.FULL
+    ) -> LegislationComparison:
+        """
+        Evaluate one input under several legislations side by side (e.g. the
+        current finance law vs a draft), without changing the active one.
+
+        Steps 1-2 do not depend on the legislation and run once. Step 3 only
+        reads the usufruct scale: it runs once per distinct scale. Only the
+        taxation (step 4) runs per legislation. The first legislation is the
+        reference of the deltas.
+
+        Raises:
+            ValueError: if no legislation is given
+        """
+        if not legislations:
+            raise ValueError("Au moins une législation est nécessaire.")
+
+        prepared = self.prepare_estate(input_data, explain=detail_level == DetailLevel.FULL)
+        devolved_by_scale: Dict[Tuple[float, ...], DevolvedEstate] = {}
+        legislation_results = []
+        for legislation in legislations:
+            devolved = devolved_by_scale.get(legislation.usufruct_rates)
+            if devolved is None:
+                devolved = self._devolve(input_data, prepared.fork(), legislation)
+                devolved_by_scale[legislation.usufruct_rates] = devolved
+            result = self._tax(input_data, devolved.fork(), legislation, detail_level)
+            legislation_results.append(LegislationResult(
+                legislation_id=legislation.legislation_id,
+                name=legislation.name,
+                year=legislation.year,
+                fingerprint=legislation.fingerprint,
+                total_tax_amount=result.global_metrics.total_tax_amount,
+                total_net_value=sum(h.net_share_value for h in result.heirs_breakdown),
+                result=result
+            ))
+
+        reference_tax = legislation_results[0].total_tax_amount
+        return LegislationComparison(
+            reference_legislation_id=legislation_results[0].legislation_id,
+            legislations=legislation_results,
+            total_tax_delta={
+                str(r.legislation_id): r.total_tax_amount - reference_tax for r in legislation_results
+            },
+            heirs_comparison=self._build_heirs_legislation_comparison(legislation_results)
+        )
+
+    @staticmethod
+    def _sweep_variant(input_data: SimulationInput, target: SweepTarget, target_id: str, value: float) -> SimulationInput:
+        """Copy of input_data with the swept field set to value."""
+        field_name, attribute, label = {
+            SweepTarget.ASSET_VALUE: ("assets", "estimated_value", "Actif"),
+            SweepTarget.DONATION_VALUE: ("donations", "current_estimated_value", "Donation"),
+            SweepTarget.DEBT_AMOUNT: ("debts", "amount", "Dette"),
+        }[target]
+        items = getattr(input_data, field_name)
+        if not any(item.id == target_id for item in items):
+            raise ValueError(f"{label} introuvable : {target_id}")
+        return input_data.model_copy(update={
+            field_name: [
+                item.model_copy(update={attribute: value}) if item.id == target_id else item
+                for item in items
+            ]
+        })
+
+    def prepare_estate(self, input_data: SimulationInput, explain: bool = True) -> PreparedEstate:
+        """
+        STEPS 1-2: liquidation, reconstitution and droit de retour.
+
+        These steps do not depend on the wishes; the returned PreparedEstate
+        can be forked to run several devolution variants. With the stage
+        cache, each step is reused when its own inputs are unchanged.
+
+        Args:
+            explain: False skips the tracer and alerts (fast mode)
+        """
+        cache = self.stage_cache
+        if cache is None:
+            return self._reconstitute(input_data, self._liquidate(input_data, explain), explain)
+
+        liquidation_fields = LIQUIDATION_INPUT_FIELDS
+        if input_data.matrimonial_advantages:
+            liquidation_fields = liquidation_fields | {'members'}
+        liquidation_inputs = input_data.model_dump_json(include=liquidation_fields, exclude_defaults=True)
+        reconstitution_inputs = input_data.model_dump_json(include=RECONSTITUTION_INPUT_FIELDS, exclude_defaults=True)
+        liquidation_key = canonical_hash("liquidation", explain, liquidation_inputs)
+        estate_key = canonical_hash("reconstitution", explain, liquidation_key, reconstitution_inputs)
+
+        # Entries weigh the size of the inputs their outputs were built from
+        prepared = cache.get(estate_key)
+        if prepared is None:
+            liquidated = cache.get(liquidation_key)
+            if liquidated is None:
+                liquidated = self._liquidate(input_data, explain)
+                cache.set(liquidation_key, liquidated, weight=len(liquidation_inputs))
+            prepared = self._reconstitute(input_data, liquidated.fork(), explain)
+            cache.set(estate_key, prepared, weight=len(liquidation_inputs) + len(reconstitution_inputs))
+        return prepared.fork()
+
+    def _liquidate(self, input_data: SimulationInput, explain: bool = True) -> LiquidatedEstate:
+        """STEP 1: Liquidation du régime matrimonial."""
+        # Initialize Tracer for Explicability (Phase 9), skipped in fast mode
+        tracer = None
+        if explain:
+            tracer = BusinessLogicTracer()
         
-        # Initialize liquidator and share calculator
+        # Initialize liquidator
         liquidator = MatrimonialLiquidator()
-        share_calculator = HeirShareCalculator()
 
-        # STEP 1: Liquidation du régime matrimonial
         net_assets = liquidator.liquidate(input_data, tracer=tracer)
+        return LiquidatedEstate(liquidator=liquidator, net_assets=net_assets, tracer=tracer)
+
+    def _reconstitute(
+        self, input_data: SimulationInput, liquidated: LiquidatedEstate, explain: bool = True
+    ) -> PreparedEstate:
+        """STEP 2: Reconstitution de la masse, alerts and droit de retour (consumes liquidated)."""
+        alert_manager = AlertManager(enabled=explain)
+        liquidator = liquidated.liquidator
+        net_assets = liquidated.net_assets
+        tracer = liquidated.tracer
         
         # STEP 2: Reconstitution de la masse
-        tracer.start_step_pedagogical(2, "RECONSTITUTION")
-        tracer.record_calculation(
-            description="Reconstitution de la Masse de Calcul (MC)",
-            formula="MC = Actif Net + Donations Rapportables - Dettes"
-        )
+        if tracer:
+            tracer.start_step_pedagogical(2, "RECONSTITUTION")
+            tracer.record_calculation(
+                description="Reconstitution de la Masse de Calcul (MC)",
+                formula="MC = Actif Net + Donations Rapportables - Dettes"
+            )
         
         reportable_donations, reportable_donations_value = get_reportable_donations(input_data.donations)
+        index = SimulationIndex.build(input_data, reportable_donations)
         
-        tracer.add_input("Actif Brut", net_assets)
-        if reportable_donations_value > 0:
-            tracer.add_input("Donations Rapportables", reportable_donations_value)
-            tracer.add_decision("INFO", f"{len(reportable_donations)} donation(s) rapportée(s)", f"Montant: {reportable_donations_value:,.2f}€")
+        if tracer:
+            tracer.add_input("Actif Brut", net_assets)
+            if reportable_donations_value > 0:
+                tracer.add_input("Donations Rapportables", reportable_donations_value)
+                tracer.add_decision("INFO", f"{len(reportable_donations)} donation(s) rapportée(s)", f"Montant: {reportable_donations_value:,.2f}€")
 
         net_succession_assets, total_debts, debt_warnings = reconstitute_estate(
-            net_assets, reportable_donations_value, input_data.debts, input_data.assets
+            net_assets, reportable_donations_value, input_data.debts, input_data.assets, index=index,
+            explain=explain
         )
         
-        if total_debts > 0:
-            tracer.add_decision("INFO", "Déduction du Passif", f"Dettes déductibles: -{total_debts:,.2f}€")
-            for dw in debt_warnings:
-                tracer.add_decision("WARNING", "Alerte Dette", dw)
-        
-        tracer.add_output("Masse Successorale", net_succession_assets)
-        tracer.end_step(f"Masse recalculée: {net_succession_assets:,.2f}€")
+        if tracer:
+            if total_debts > 0:
+                tracer.add_decision("INFO", "Déduction du Passif", f"Dettes déductibles: -{total_debts:,.2f}€")
+                for dw in debt_warnings:
+                    tracer.add_decision("WARNING", "Alerte Dette", dw)
+            
+            tracer.add_output("Masse Successorale", net_succession_assets)
+            tracer.end_step(f"Masse recalculée: {net_succession_assets:,.2f}€")
         
         # Phase 11: International Warnings
         self._generate_international_warnings(input_data, alert_manager)
@@ -100,7 +450,8 @@ class SuccessionCalculator:
         # Phase 16: Droit de Retour (Art 738-2 CC)
         # Check if assets return to parents before reserve calculation
         return_amounts, total_return, return_warnings = calculate_droit_de_retour(
-            input_data.assets, input_data.members, net_succession_assets
+            input_data.assets, input_data.members, net_succession_assets, members=index.members,
+            explain=explain
         )
         if total_return > 0:
             net_succession_assets -= total_return
@@ -108,12 +459,48 @@ class SuccessionCalculator:
                 for rw in return_warnings:
                     alert_manager.add_legal_warning(rw, audience=AlertAudience.NOTARY)
             
-            tracer.record_calculation(
-                description="Application Droit de Retour (Art. 738-2 CC)",
-                formula="Masse = Masse - Retour Légal"
-            )
-            tracer.add_sub_step(f"Les biens reçus par donation d'ascendants retournent à ces derniers.")
-            tracer.add_insight("WARNING", f"Droit de retour exercé: {total_return:,.2f}€ retirés de la masse.")
+            if tracer:
+                tracer.record_calculation(
+                    description="Application Droit de Retour (Art. 738-2 CC)",
+                    formula="Masse = Masse - Retour Légal"
+                )
+                tracer.add_sub_step(f"Les biens reçus par donation d'ascendants retournent à ces derniers.")
+                tracer.add_insight("WARNING", f"Droit de retour exercé: {total_return:,.2f}€ retirés de la masse.")
+
+        return PreparedEstate(
+            liquidator=liquidator,
+            net_assets=net_assets,
+            reportable_donations=reportable_donations,
+            reportable_donations_value=reportable_donations_value,
+            net_succession_assets=net_succession_assets,
+            alert_manager=alert_manager,
+            tracer=tracer,
+            index=index
+        )
+
+    def complete(
+        self, input_data: SimulationInput, prepared: PreparedEstate,
+        legislation: LegislationSnapshot = None,
+        detail_level: DetailLevel = DetailLevel.FULL
+    ) -> Union[SuccessionOutput, SuccessionSummaryOutput]:
+        """
+        STEPS 3-4: devolution and taxation on a prepared estate (consumes it,
+        use prepared.fork() to run several variants).
+        """
+        legislation = legislation or self.legislation or get_legislation_snapshot()
+        devolved = self._devolve(input_data, prepared, legislation)
+        return self._tax(input_data, devolved, legislation, detail_level)
+
+    def _devolve(
+        self, input_data: SimulationInput, prepared: PreparedEstate, legislation: LegislationSnapshot
+    ) -> DevolvedEstate:
+        """STEP 3: Détermination de la dévolution (consumes prepared)."""
+        reportable_donations_value = prepared.reportable_donations_value
+        net_succession_assets = prepared.net_succession_assets
+        alert_manager = prepared.alert_manager
+        tracer = prepared.tracer
+        index = prepared.index
+        share_calculator = HeirShareCalculator(legislation=legislation)
 
         # STEP 3: Détermination de la dévolution (Réserve & Quotité)
         heirs = input_data.members
@@ -130,7 +517,7 @@ class SuccessionCalculator:
         if tracer:
             tracer.add_decision("INFO", "Masse Art. 922 CC", f"Masse de calcul de la réserve : {mass_art_922:,.2f}€ (incluant Donations-Partages)")
 
-        reserve_fraction, reserve_description = calculate_legal_reserve(heirs)
+        reserve_fraction, reserve_description = calculate_legal_reserve(heirs, members=index.members)
         legal_reserve = mass_art_922 * reserve_fraction
         disposable_quota = mass_art_922 - legal_reserve
         
@@ -142,15 +529,15 @@ class SuccessionCalculator:
         
         # Handle specific bequests
         specific_bequests_info, bequests_total_value, bequest_warnings = process_specific_bequests(
-            input_data.assets, input_data.wishes, heirs
+            input_data.assets, input_data.wishes, heirs, index=index
         )
         
         # Fix 4: Add bequest trace showing who receives what
         if tracer and specific_bequests_info:
             for bequest in specific_bequests_info:
                 tracer.add_sub_step(
-                    f"📜 Leg particulier: {bequest['asset_name']} → {bequest['beneficiary_id']} "
-                    f"({bequest['share_percentage']:.0f}% = {bequest['value']:,.0f} €)"
+                    f"📜 Leg particulier: {bequest.asset_name} → {bequest.beneficiary_id} "
+                    f"({bequest.share_percentage:.0f}% = {bequest.value:,.0f} €)"
                 )
         
         # Add bequest over-allocation warnings
@@ -158,7 +545,9 @@ class SuccessionCalculator:
             alert_manager.add(AlertSeverity.WARNING, AlertAudience.USER, AlertCategory.LEGAL, bw)
         
         # Calculate heir shares (Instrumented)
-        heir_shares = share_calculator.calculate(heirs, input_data.wishes, net_succession_assets, tracer=tracer)
+        heir_shares = share_calculator.calculate(
+            heirs, input_data.wishes, net_succession_assets, tracer=tracer, members=index.members
+        )
         
         # Fix 5: Add usufruit/nue-propriété specifics to tracer
         if tracer and share_calculator.spouse_has_usufruct:
@@ -174,61 +563,116 @@ class SuccessionCalculator:
         # We compare ALL donations (reunion_value) + Bequests vs QD
         excessive_lib_warnings = check_excessive_liberalities(
             reunion_value, bequests_total_value,
-            disposable_quota, legal_reserve, reserve_fraction
+            disposable_quota, legal_reserve, reserve_fraction,
+            explain=alert_manager.enabled
         )
         for elw in excessive_lib_warnings:
             alert_manager.add(AlertSeverity.CRITICAL, AlertAudience.USER, AlertCategory.LEGAL, elw)
 
+        return DevolvedEstate(
+            prepared=prepared,
+            share_calculator=share_calculator,
+            heir_shares=heir_shares,
+            reunion_value=reunion_value,
+            legal_reserve=legal_reserve,
+            disposable_quota=disposable_quota,
+            specific_bequests_info=specific_bequests_info
+        )
+
+    def _tax(
+        self, input_data: SimulationInput, devolved: DevolvedEstate, legislation: LegislationSnapshot,
+        detail_level: DetailLevel = DetailLevel.FULL, apply_scale: bool = True
+    ) -> Union[SuccessionOutput, SuccessionSummaryOutput]:
+        """
+        STEP 4: Calcul de la fiscalité and output (consumes devolved).
+
+        apply_scale=False leaves the heirs untaxed (tax_amount 0, taxable_base
+        after allowances): sweep() taxes all its points at once afterwards.
+        """
+        explain = detail_level == DetailLevel.FULL
+        prepared = devolved.prepared
+        liquidator = prepared.liquidator
+        net_assets = prepared.net_assets
+        reportable_donations = prepared.reportable_donations
+        net_succession_assets = prepared.net_succession_assets
+        alert_manager = prepared.alert_manager
+        tracer = prepared.tracer
+        index = prepared.index
+        share_calculator = devolved.share_calculator
+        heir_shares = devolved.heir_shares
+        legal_reserve = devolved.legal_reserve
+        disposable_quota = devolved.disposable_quota
+        specific_bequests_info = devolved.specific_bequests_info
+
         # Phase 10: Early Calculation of Life Insurance for 757 B Reintegration
         # (Must be done before Taxation Step 4 to inject taxable base addbacks)
         av_tax_990i, av_757b_addbacks, _ = self._calculate_life_insurance_taxation(
-            liquidator.life_insurance_assets, heirs, alert_manager, tracer=tracer
+            liquidator.life_insurance_assets, index.members, alert_manager, tracer=tracer,
+            legislation=legislation
         )
         if av_757b_addbacks and tracer:
              total_757b = sum(av_757b_addbacks.values())
              tracer.add_decision("INFO", "Assurance-Vie 757B", f"Réintégration de primes > 70 ans dans la succession: {total_757b:,.2f}€")
 
         # STEP 4: Calculate taxation and build heir breakdown
-        tracer.start_step_pedagogical(4, "FISCAL")
-        tracer.record_calculation(
-            description="Calcul individuel des droits de succession",
-            formula="Droits = (Base Taxable - Abattement) x Taux"
-        )
+        if tracer:
+            tracer.start_step_pedagogical(4, "FISCAL")
+            tracer.record_calculation(
+                description="Calcul individuel des droits de succession",
+                formula="Droits = (Base Taxable - Abattement) x Taux"
+            )
         
         # Phase 10: Calculate Global Professional Exemption (Dutreil / Rural)
         # Note: We assume exemptions are shared pro-rata to heir shares for simplicity.
         # Ideally, we should track which asset goes to whom, but simplified devolution assumes universality.
         total_professional_exemption = self._calculate_global_exemption(input_data.assets)
-        if total_professional_exemption > 0:
+        if total_professional_exemption > 0 and tracer:
             tracer.add_decision("INFO", "Exonération Professionnelle", f"Montant total exonéré: {total_professional_exemption:,.2f}€")
         
-        spouse_heir = next((h for h in heirs if h.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]), None)
+        spouse_heir = index.members.spouse
         spouse_id = spouse_heir.id if spouse_heir else None
 
         heirs_breakdown, total_tax = self._calculate_taxation_and_breakdown(
-            heirs, heir_shares, net_succession_assets,
-            reportable_donations, specific_bequests_info,
+            index, heir_shares, net_succession_assets,
+            specific_bequests_info,
             total_professional_exemption,
             spouse_id=spouse_id,
             usufruct_value=share_calculator.usufruct_value if share_calculator.spouse_has_usufruct else 0.0,
             has_usufruct=share_calculator.spouse_has_usufruct,
             heir_757b_addbacks=av_757b_addbacks,
-            tracer=tracer
+            tracer=tracer,
+            legislation=legislation,
+            explain=explain,
+            apply_scale=apply_scale
         )
         
         
         # Heir blocks are now populated via add_heir_block in _calculate_taxation_and_breakdown
-        tracer.add_output("Droits Totaux", total_tax)
+        if tracer:
+            tracer.add_output("Droits Totaux", total_tax)
 
         # STEP 5: Add Life Insurance Tax Summary to Tracer
-        if liquidator.life_insurance_assets and tracer:
-            tracer.add_output("Droits Assurance-Vie Total (990 I)", av_tax_990i)
+        if liquidator.life_insurance_assets:
+            if tracer:
+                tracer.add_output("Droits Assurance-Vie Total (990 I)", av_tax_990i)
             # Detailed steps are already logged by LifeInsuranceCalculator called in Phase 10
             
             life_insurance_total_tax = av_tax_990i
         else:
             life_insurance_total_tax = 0.0
 
+        # Fast mode: figures only
+        if not explain:
+            return SuccessionSummaryOutput(
+                global_metrics=GlobalMetrics(
+                    total_estate_value=net_succession_assets,
+                    legal_reserve_value=legal_reserve,
+                    disposable_quota_value=disposable_quota,
+                    total_tax_amount=total_tax + life_insurance_total_tax
+                ),
+                heirs_breakdown=heirs_breakdown
+            )
+
         # Build asset breakdown with donations
         assets_breakdown = self._build_assets_breakdown(
             input_data.assets, specific_bequests_info, reportable_donations
@@ -244,11 +688,11 @@ class SuccessionCalculator:
 
         # Build SpouseDetails if spouse present
         spouse_details = self._build_spouse_details(
-            heirs, share_calculator, input_data.wishes
+            index.members, share_calculator, input_data.wishes
         )
         
         # Build FamilyContext
-        family_context = self._build_family_context(heirs, share_calculator)
+        family_context = self._build_family_context(index.members, share_calculator)
         
         # Build LiquidationDetails
         liquidation_details_obj = self._build_liquidation_details(
@@ -269,10 +713,62 @@ class SuccessionCalculator:
             liquidation_details=liquidation_details_obj,
             alerts=final_alerts,
             warnings=legacy_warnings,
-            calculation_steps=tracer.get_steps(),
+            calculation_steps=tracer.get_steps() if tracer else [],
             assets_breakdown=assets_breakdown
         )
 
+    def _build_heirs_comparison(self, option_results: List[SpouseOptionResult]) -> List[HeirOptionComparison]:
+        """Per-heir net share and tax for each option, with deltas vs the first (reference) option."""
+        reference = {h.id: h for h in option_results[0].result.heirs_breakdown}
+        comparison = []
+        for heir in option_results[0].result.heirs_breakdown:
+            net_share_value, tax_amount, net_share_delta = {}, {}, {}
+            for option_result in option_results:
+                option_heir = next((h for h in option_result.result.heirs_breakdown if h.id == heir.id), None)
+                net = option_heir.net_share_value if option_heir else 0.0
+                key = option_result.option.value
+                net_share_value[key] = net
+                tax_amount[key] = option_heir.tax_amount if option_heir else 0.0
+                net_share_delta[key] = net - reference[heir.id].net_share_value
+            comparison.append(HeirOptionComparison(
+                id=heir.id,
+                name=heir.name,
+                relationship=heir.relationship,
+                net_share_value=net_share_value,
+                tax_amount=tax_amount,
+                net_share_delta=net_share_delta
+            ))
+        return comparison
+
+    def _build_heirs_legislation_comparison(
+        self, legislation_results: List[LegislationResult]
+    ) -> List[HeirLegislationComparison]:
+        """Per-heir tax and net share under each legislation, with tax deltas vs the first (reference) one."""
+        heirs_by_legislation = [
+            {h.id: h for h in legislation_result.result.heirs_breakdown}
+            for legislation_result in legislation_results
+        ]
+        reference = heirs_by_legislation[0]
+        comparison = []
+        for heir in legislation_results[0].result.heirs_breakdown:
+            tax_amount, net_share_value, tax_delta = {}, {}, {}
+            for legislation_result, heirs in zip(legislation_results, heirs_by_legislation):
+                legislation_heir = heirs.get(heir.id)
+                key = str(legislation_result.legislation_id)
+                tax = legislation_heir.tax_amount if legislation_heir else 0.0
+                tax_amount[key] = tax
+                net_share_value[key] = legislation_heir.net_share_value if legislation_heir else 0.0
+                tax_delta[key] = tax - reference[heir.id].tax_amount
+            comparison.append(HeirLegislationComparison(
+                id=heir.id,
+                name=heir.name,
+                relationship=heir.relationship,
+                tax_amount=tax_amount,
+                net_share_value=net_share_value,
+                tax_delta=tax_delta
+            ))
+        return comparison
+
     def _generate_international_warnings(self, input_data: SimulationInput, alert_manager: AlertManager):
         """Generate warnings for international context (Phase 11)."""
         if getattr(input_data, 'residence_country', 'FR') != 'FR':
@@ -295,7 +791,6 @@ class SuccessionCalculator:
         """Generate warnings for date and regime consistency (Phase 9)."""
         community_regimes = ["COMMUNITY_LEGAL", "COMMUNITY_UNIVERSAL", "COMMUNITY_REDUCED_TO_ACQUESTS"]
         if input_data.matrimonial_regime.value in community_regimes and input_data.marriage_date:
-            from succession_engine.schemas import AssetOrigin
             for asset in input_data.assets:
                 if asset.acquisition_date:
                     is_before_marriage = asset.acquisition_date < input_data.marriage_date
@@ -326,34 +821,42 @@ class SuccessionCalculator:
 
     def _calculate_taxation_and_breakdown(
         self,
-        heirs: List,
+        index: SimulationIndex,
         heir_shares: Dict[str, float],
         net_succession_assets: float,
-        reportable_donations: List[Dict],
-        specific_bequests_info: List[Dict],
+        specific_bequests_info: List[BequestAllocation],
         total_professional_exemption: float = 0.0,
         spouse_id: str = None,
         usufruct_value: float = 0.0,
         has_usufruct: bool = False,
         heir_757b_addbacks: Dict[str, float] = None,
-        tracer: 'BusinessLogicTracer' = None
+        tracer: 'BusinessLogicTracer' = None,
+        legislation: LegislationSnapshot = None,
+        explain: bool = True,
+        apply_scale: bool = True
     ) -> Tuple[List[HeirBreakdown], float]:
         """
-        Calculate taxation for each heir and build complete breakdown.
-        Includes 757 B reintegration.
+        Calculate taxation for each heir (members of the index) and build
+        complete breakdown. Includes 757 B reintegration. explain=False skips
+        the explanation keys.
         """
         heirs_breakdown = []
         total_tax = 0.0
         heir_757b_addbacks = heir_757b_addbacks or {}
+        bequests_by_heir = group_by(specific_bequests_info, lambda b: b.beneficiary_id)
+        bequests_value_by_heir = {
+            heir_id: sum(b.value for b in bequests) for heir_id, bequests in bequests_by_heir.items()
+        }
+        num_children = len(index.members.of(HeirRelation.CHILD))
         
         # Calculate total value of specific bequests (charged to estate)
-        bequests_total_value_sum = sum(b['value'] for b in specific_bequests_info)
+        bequests_total_value_sum = sum(b.value for b in specific_bequests_info)
         
         # Determine distributable residue for legal heirs
         # Legal shares apply to the residue (Active Assets - Liabilities - Specific Bequests)
         distributable_residue = max(0.0, net_succession_assets - bequests_total_value_sum)
 
-        for heir in heirs:
+        for heir in index.members:
             # Base share from devolution
             share_percent = heir_shares.get(heir.id, 0)
             gross_share = distributable_residue * share_percent
@@ -368,8 +871,8 @@ class SuccessionCalculator:
                     gross_share -= usufruct_value * share_percent
             
             # IMPUTATION: Deduct prior donations from heir's share (Art. 843 CC)
-            heir_donations = [d for d in reportable_donations if d['beneficiary_id'] == heir.id]
-            donations_to_deduct = sum(d['value'] for d in heir_donations)
+            donation_totals = index.donation_totals_of(heir.id)
+            donations_to_deduct = donation_totals.value
             net_hereditary_share = max(0, gross_share - donations_to_deduct)
             
             # Deduct Professional Exemption (Pro-rata share)
@@ -377,8 +880,8 @@ class SuccessionCalculator:
             heir_exemption_share = total_professional_exemption * share_percent
             
             # Add specific bequests (legs particuliers)
-            heir_bequests = [b for b in specific_bequests_info if b['beneficiary_id'] == heir.id]
-            bequests_value = sum(b['value'] for b in heir_bequests)
+            heir_bequests = bequests_by_heir.get(heir.id, [])
+            bequests_value = bequests_value_by_heir.get(heir.id, 0)
             
             # Total to receive (Civil Value)
             total_civil_value = net_hereditary_share + bequests_value
@@ -396,13 +899,9 @@ class SuccessionCalculator:
             actual_percentage = (total_civil_value / net_succession_assets * 100) if net_succession_assets > 0 else 0
             
             # Calculate 15-year recall: allowance already used by prior declared donations (Art. 784 CGI)
-            prior_allowance_used = sum(
-                d['value'] for d in reportable_donations 
-                if d['beneficiary_id'] == heir.id and d.get('is_declared_to_tax', False)
-            )
+            prior_allowance_used = donation_totals.declared_value
             
             is_disabled = getattr(heir, 'is_disabled', False)
-            from succession_engine.schemas import AdoptionType
             adoption_type = getattr(heir, 'adoption_type', None)
             is_adopted_simple = adoption_type == AdoptionType.SIMPLE
             has_continuous_care = getattr(heir, 'has_received_continuous_care', False)
@@ -414,7 +913,9 @@ class SuccessionCalculator:
                 prior_allowance_used=prior_allowance_used,
                 is_adopted_simple=is_adopted_simple,
                 has_continuous_care=has_continuous_care,
-                tracer=None  # Disable internal tracing - we use add_heir_block instead
+                tracer=None,  # Disable internal tracing - we use add_heir_block instead
+                legislation=legislation,
+                apply_scale=apply_scale
             )
             total_tax += tax
             
@@ -442,13 +943,12 @@ class SuccessionCalculator:
                 )
             
             # Build received_assets list from specific bequests
-            from succession_engine.schemas import ReceivedAsset, ExplanationKey
             received_assets = [
                 ReceivedAsset(
-                    asset_id=b['asset_id'],
-                    asset_name=b.get('asset_name', b['asset_id']),
-                    share_percentage=b.get('share_percentage', 100.0),
-                    value=b['value']
+                    asset_id=b.asset_id,
+                    asset_name=b.asset_name,
+                    share_percentage=b.share_percentage,
+                    value=b.value
                 )
                 for b in heir_bequests
             ]
@@ -456,60 +956,62 @@ class SuccessionCalculator:
             # Build explanation keys for this heir
             heir_explanation_keys = []
             
-            # Explain share source
-            if heir.relationship == HeirRelation.CHILD:
-                num_children = len([h for h in heirs if h.relationship == HeirRelation.CHILD])
-                heir_explanation_keys.append(ExplanationKey(
-                    key="SHARE_CHILDREN_EQUAL",
-                    context={"num_children": num_children}
-                ))
-            elif heir.relationship == HeirRelation.SPOUSE:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="SHARE_SPOUSE",
-                    context={"share_percent": actual_percentage}
-                ))
-            elif heir.relationship == HeirRelation.GRANDCHILD and heir.represented_heir_id:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="SHARE_REPRESENTATION",
-                    context={"represented_id": heir.represented_heir_id}
-                ))
-            elif heir.relationship == HeirRelation.SIBLING:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="SHARE_SIBLINGS",
-                    context={"share_percent": actual_percentage}
-                ))
-            
-            # Explain abatement
-            if tax_details.allowance_amount > 0:
+            # Skipped in fast mode (explain=False)
+            if explain:
+                # Explain share source
                 if heir.relationship == HeirRelation.CHILD:
                     heir_explanation_keys.append(ExplanationKey(
-                        key="ABATEMENT_CHILD_100K",
-                        context={"amount": tax_details.allowance_amount}
+                        key="SHARE_CHILDREN_EQUAL",
+                        context={"num_children": num_children}
+                    ))
+                elif heir.relationship == HeirRelation.SPOUSE:
+                    heir_explanation_keys.append(ExplanationKey(
+                        key="SHARE_SPOUSE",
+                        context={"share_percent": actual_percentage}
+                    ))
+                elif heir.relationship == HeirRelation.GRANDCHILD and heir.represented_heir_id:
+                    heir_explanation_keys.append(ExplanationKey(
+                        key="SHARE_REPRESENTATION",
+                        context={"represented_id": heir.represented_heir_id}
                     ))
                 elif heir.relationship == HeirRelation.SIBLING:
                     heir_explanation_keys.append(ExplanationKey(
-                        key="ABATEMENT_SIBLING_15K",
-                        context={"amount": tax_details.allowance_amount}
+                        key="SHARE_SIBLINGS",
+                        context={"share_percent": actual_percentage}
                     ))
-            
-            if is_disabled:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="ABATEMENT_DISABILITY_159K",
-                    context={}
-                ))
-            
-            if prior_allowance_used > 0:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="ABATEMENT_CONSUMED_15Y",
-                    context={"amount_used": prior_allowance_used}
-                ))
-            
-            # Explain tax exemption for spouse
-            if heir.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]:
-                heir_explanation_keys.append(ExplanationKey(
-                    key="TAX_SPOUSE_EXEMPT",
-                    context={}
-                ))
+
+                # Explain abatement
+                if tax_details.allowance_amount > 0:
+                    if heir.relationship == HeirRelation.CHILD:
+                        heir_explanation_keys.append(ExplanationKey(
+                            key="ABATEMENT_CHILD_100K",
+                            context={"amount": tax_details.allowance_amount}
+                        ))
+                    elif heir.relationship == HeirRelation.SIBLING:
+                        heir_explanation_keys.append(ExplanationKey(
+                            key="ABATEMENT_SIBLING_15K",
+                            context={"amount": tax_details.allowance_amount}
+                        ))
+
+                if is_disabled:
+                    heir_explanation_keys.append(ExplanationKey(
+                        key="ABATEMENT_DISABILITY_159K",
+                        context={}
+                    ))
+
+                if prior_allowance_used > 0:
+                    heir_explanation_keys.append(ExplanationKey(
+                        key="ABATEMENT_CONSUMED_15Y",
+                        context={"amount_used": prior_allowance_used}
+                    ))
+
+                # Explain tax exemption for spouse
+                if heir.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]:
+                    heir_explanation_keys.append(ExplanationKey(
+                        key="TAX_SPOUSE_EXEMPT",
+                        context={}
+                    ))
+
             
             # Build heir breakdown
             heirs_breakdown.append(HeirBreakdown(
@@ -533,9 +1035,10 @@ class SuccessionCalculator:
     def _calculate_life_insurance_taxation(
         self,
         life_insurance_assets: List,
-        heirs: List,
+        members: MemberIndex,
         alert_manager: AlertManager,
-        tracer=None
+        tracer=None,
+        legislation: LegislationSnapshot = None
     ) -> Tuple[float, Dict[str, float], List[Dict]]:
         """
         Calculate Life Insurance Taxation (Art. 990 I & 757 B CGI).
@@ -547,8 +1050,6 @@ class SuccessionCalculator:
         if not life_insurance_assets:
             return 0.0, {}, []
         
-        from succession_engine.rules.life_insurance import LifeInsuranceCalculator
-        
         life_insurance_total_tax_990i = 0.0
         heir_757b_addbacks = {}
         trace_info = []
@@ -560,9 +1061,8 @@ class SuccessionCalculator:
                 beneficiaries = li_asset.life_insurance_beneficiaries
             else:
                 # Legacy fallback
-                beneficiary_id = getattr(li_asset, 'beneficiary_id', heirs[0].id if heirs else None)
+                beneficiary_id = getattr(li_asset, 'beneficiary_id', members.members[0].id if members.members else None)
                 if beneficiary_id:
-                     from succession_engine.schemas import LifeInsuranceBeneficiary, OwnershipMode
                      beneficiaries.append(
                          LifeInsuranceBeneficiary(
                              beneficiary_id=beneficiary_id,
@@ -572,31 +1072,21 @@ class SuccessionCalculator:
                      )
 
             # Pre-scan for Usufructuary to determine rate (Art 669 CGI)
-            from succession_engine.schemas import OwnershipMode
             usufruct_rate = 1.0 # Default 100% if no dismemberment
             usufruct_beneficiary = next((b for b in beneficiaries if b.ownership_type == OwnershipMode.USUFRUCT), None)
             
             if usufruct_beneficiary:
                 # Find age of this beneficiary
-                u_heir = next((h for h in heirs if h.id == usufruct_beneficiary.beneficiary_id), None)
+                u_heir = members.get(usufruct_beneficiary.beneficiary_id)
                 if u_heir and u_heir.birth_date:
                     age = date.today().year - u_heir.birth_date.year
-                    # Simple fiscal scale (Art 669 CGI)
-                    if age < 21: usufruct_rate = 0.9
-                    elif age < 31: usufruct_rate = 0.8
-                    elif age < 41: usufruct_rate = 0.7
-                    elif age < 51: usufruct_rate = 0.6
-                    elif age < 61: usufruct_rate = 0.5
-                    elif age < 71: usufruct_rate = 0.4
-                    elif age < 81: usufruct_rate = 0.3
-                    elif age < 91: usufruct_rate = 0.2
-                    else: usufruct_rate = 0.1
+                    # Fiscal scale (Art 669 CGI) - same precomputed table as devolution
+                    usufruct_rate = UsufructValuator.get_usufruct_rate(age, legislation)
                     
                     if tracer:
                          tracer.add_decision("INFO", f"Démembrement AV {li_asset.id}", f"Usufruitier {u_heir.id} ({age} ans) -> Taux {usufruct_rate*100:.0f}%")
 
             # Phase 15: Gestion des contrats spécifiques
-            from succession_engine.schemas import LifeInsuranceContractType
             contract_type = getattr(li_asset, 'life_insurance_contract_type', LifeInsuranceContractType.STANDARD)
             
             premiums_before_70 = li_asset.premiums_before_70 or 0.0
@@ -618,14 +1108,13 @@ class SuccessionCalculator:
 
             # Process each beneficiary
             for ben_info in beneficiaries:
-                beneficiary = next((h for h in heirs if h.id == ben_info.beneficiary_id), None)
+                beneficiary = members.get(ben_info.beneficiary_id)
                 if not beneficiary:
                     continue
                 
                 share_fraction = ben_info.share_percent / 100.0
                 
                 # Adjust share for dismemberment
-                from succession_engine.schemas import OwnershipMode
                 if ben_info.ownership_type == OwnershipMode.USUFRUCT:
                     share_fraction *= usufruct_rate
                 elif ben_info.ownership_type == OwnershipMode.BARE_OWNERSHIP:
@@ -695,8 +1184,8 @@ class SuccessionCalculator:
     def _build_assets_breakdown(
         self,
         assets: List,
-        specific_bequests_info: List[Dict],
-        reportable_donations: List[Dict]
+        specific_bequests_info: List[BequestAllocation],
+        reportable_donations: List[ReportableDonation]
     ) -> List[AssetBreakdown]:
         """
         Build complete asset breakdown including real assets and virtual donation assets.
@@ -705,6 +1194,7 @@ class SuccessionCalculator:
             List of AssetBreakdown with notes about ownership, bequests, etc.
         """
         assets_breakdown = []
+        bequests_by_asset = group_by(specific_bequests_info, lambda b: b.asset_id)
         
         # Real assets
         for asset in assets:
@@ -715,10 +1205,10 @@ class SuccessionCalculator:
                 notes.append("Bien commun au couple")
             
             # Check if asset is part of a specific bequest
-            asset_bequests = [b for b in specific_bequests_info if b['asset_id'] == asset.id]
+            asset_bequests = bequests_by_asset.get(asset.id, [])
             if asset_bequests:
                 for bequest in asset_bequests:
-                    notes.append(f"🎁 Légué à {bequest['beneficiary_name']} ({bequest['share_percentage']:.0f}%)")
+                    notes.append(f"🎁 Légué à {bequest.beneficiary_name} ({bequest.share_percentage:.0f}%)")
             
             assets_breakdown.append(AssetBreakdown(
                 asset_id=asset.id,
@@ -731,25 +1221,22 @@ class SuccessionCalculator:
         # Add donations as "virtual assets" for visibility
         for donation_info in reportable_donations:
             assets_breakdown.append(AssetBreakdown(
-                asset_id=f"donation_{donation_info.get('beneficiary_id', 'unknown')}",
-                asset_value=donation_info['value'],
+                asset_id=f"donation_{donation_info.beneficiary_id}",
+                asset_value=donation_info.value,
                 ownership_mode="N/A",
                 asset_origin="DONATION",
                 notes=[
-                    f"📜 Donation du {donation_info['donation_date']} à {donation_info['beneficiary_name']}",
-                    f"Type: {donation_info['type']}",
+                    f"📜 Donation du {donation_info.donation_date} à {donation_info.beneficiary_name}",
+                    f"Type: {donation_info.type}",
                     "Rapportée à la masse successorale"
                 ]
             ))
         
         return assets_breakdown
 
-    def _build_spouse_details(self, heirs: List, share_calculator, wishes) -> SpouseDetails:
+    def _build_spouse_details(self, members: MemberIndex, share_calculator, wishes) -> SpouseDetails:
         """Build SpouseDetails if spouse is present."""
-        spouse = next(
-            (h for h in heirs if h.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]),
-            None
-        )
+        spouse = members.spouse
         
         if not spouse:
             return None
@@ -766,17 +1253,11 @@ class SuccessionCalculator:
             choice_made=choice_made
         )
 
-    def _build_family_context(self, heirs: List, share_calculator) -> FamilyContext:
-        """Build FamilyContext from heirs list."""
-        spouse = next(
-            (h for h in heirs if h.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]),
-            None
-        )
-        children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
-        grandchildren_representing = [
-            h for h in heirs 
-            if h.relationship == HeirRelation.GRANDCHILD and h.represented_heir_id
-        ]
+    def _build_family_context(self, members: MemberIndex, share_calculator) -> FamilyContext:
+        """Build FamilyContext from the members index."""
+        spouse = members.spouse
+        children = members.of(HeirRelation.CHILD)
+        grandchildren_representing = [h for h in members.of(HeirRelation.GRANDCHILD) if h.represented_heir_id]
         
         spouse_age = None
         if spouse and spouse.birth_date:
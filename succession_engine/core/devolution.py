@@ -11,14 +11,18 @@ Responsibilities:
 - Handle representation (Art. 751+ CC)
 """
 
+from dataclasses import dataclass
 from typing import List, Dict, Tuple
 from datetime import date
 
-from succession_engine.schemas import HeirRelation
+from succession_engine.schemas import HeirRelation, SpouseChoiceType
+from succession_engine.rules.usufruct import UsufructValuator
+from succession_engine.rules.fente import FenteDevolution
 from succession_engine.constants import RESERVE_CHILDREN, RESERVE_PARENTS, DEFAULT_RESERVE_FRACTION
+from succession_engine.core.index import MemberIndex, SimulationIndex, index_by_id
 
 
-def calculate_legal_reserve(heirs: List) -> Tuple[float, str]:
+def calculate_legal_reserve(heirs: List, members: MemberIndex = None) -> Tuple[float, str]:
     """
     Calculate legal reserve (réserve héréditaire) according to French law.
     
@@ -33,12 +37,14 @@ def calculate_legal_reserve(heirs: List) -> Tuple[float, str]:
     
     Args:
         heirs: List of FamilyMember objects
+        members: Index of the same heirs (built from heirs if omitted)
         
     Returns:
         Tuple of (reserve_fraction, description)
     """
-    children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
-    grandchildren = [h for h in heirs if h.relationship == HeirRelation.GRANDCHILD]
+    members = members or MemberIndex(heirs)
+    children = members.of(HeirRelation.CHILD)
+    represented_ids = {gc.represented_heir_id for gc in members.of(HeirRelation.GRANDCHILD)}
     
     # Filter children for reserve (Art. 913 CC):
     # Renouncing child does NOT count, unless represented.
@@ -49,8 +55,7 @@ def calculate_legal_reserve(heirs: List) -> Tuple[float, str]:
             counting_children.append(child)
         else:
             # Check if represented by a grandchild
-            is_represented = any(gc.represented_heir_id == child.id for gc in grandchildren)
-            if is_represented:
+            if child.id in represented_ids:
                 counting_children.append(child)
                 
     num_children = len(counting_children)
@@ -65,7 +70,7 @@ def calculate_legal_reserve(heirs: List) -> Tuple[float, str]:
             return RESERVE_CHILDREN[3], f"{num_children} enfants (ou représentés) : réserve de 3/4"
     else:
         # Reserve for ascendants (Art. 914-1 CC)
-        parents = [h for h in heirs if h.relationship == HeirRelation.PARENT]
+        parents = members.of(HeirRelation.PARENT)
         active_parents = [
             p for p in parents 
             if getattr(p, 'acceptance_option', 'PURE_SIMPLE') != 'RENUNCIATION'
@@ -80,7 +85,20 @@ def calculate_legal_reserve(heirs: List) -> Tuple[float, str]:
             return DEFAULT_RESERVE_FRACTION, "Aucun descendant ni ascendant réservataire"
 
 
-def process_specific_bequests(assets: List, wishes, heirs: List) -> Tuple[List[Dict], float, List[str]]:
+@dataclass(slots=True)
+class BequestAllocation:
+    """Share of an asset going to a beneficiary through a specific bequest (legs particulier)."""
+    asset_id: str
+    asset_name: str
+    beneficiary_id: str
+    beneficiary_name: str
+    value: float
+    share_percentage: float
+
+
+def process_specific_bequests(
+    assets: List, wishes, heirs: List, index: SimulationIndex = None
+) -> Tuple[List[BequestAllocation], float, List[str]]:
     """
     Process specific bequests (legs particuliers) from testament.
     
@@ -88,9 +106,10 @@ def process_specific_bequests(assets: List, wishes, heirs: List) -> Tuple[List[D
         assets: List of Asset objects
         wishes: Wishes object containing bequests
         heirs: List of FamilyMember objects
+        index: Per-run lookups (assets / heirs by id), built from the lists if omitted
         
     Returns:
-        Tuple of (list of bequest info dicts, total bequests value, list of warnings)
+        Tuple of (list of BequestAllocation, total bequests value, list of warnings)
     """
     specific_bequests_info = []
     bequests_total_value = 0.0
@@ -100,22 +119,24 @@ def process_specific_bequests(assets: List, wishes, heirs: List) -> Tuple[List[D
     asset_allocation = {}
     
     if wishes and wishes.specific_bequests:
+        assets_by_id = index.assets_by_id if index else index_by_id(assets)
+        heirs_by_id = index.members.by_id if index else index_by_id(heirs)
         for bequest in wishes.specific_bequests:
-            asset = next((a for a in assets if a.id == bequest.asset_id), None)
+            asset = assets_by_id.get(bequest.asset_id)
             if asset:
-                beneficiary = next((h for h in heirs if h.id == bequest.beneficiary_id), None)
+                beneficiary = heirs_by_id.get(bequest.beneficiary_id)
                 if beneficiary:
                     share = bequest.share_percentage / 100.0
                     value = asset.estimated_value * share
                     bequests_total_value += value
-                    specific_bequests_info.append({
-                        'asset_id': bequest.asset_id,
-                        'asset_name': bequest.asset_id,  # Use ID as name for now
-                        'beneficiary_id': bequest.beneficiary_id,
-                        'beneficiary_name': f"Héritier {bequest.beneficiary_id}",
-                        'value': value,
-                        'share_percentage': bequest.share_percentage
-                    })
+                    specific_bequests_info.append(BequestAllocation(
+                        asset_id=bequest.asset_id,
+                        asset_name=bequest.asset_id,  # Use ID as name for now
+                        beneficiary_id=bequest.beneficiary_id,
+                        beneficiary_name=f"Héritier {bequest.beneficiary_id}",
+                        value=value,
+                        share_percentage=bequest.share_percentage
+                    ))
                     
                     # Track allocation
                     if bequest.asset_id not in asset_allocation:
@@ -144,8 +165,15 @@ class HeirShareCalculator:
     - Equal distribution by default
     """
     
-    def __init__(self):
-        """Initialize calculator with tracking fields."""
+    def __init__(self, legislation=None):
+        """
+        Initialize calculator with tracking fields.
+        
+        Args:
+            legislation: Compiled LegislationSnapshot for usufruct valuation
+                         (default: cached active snapshot)
+        """
+        self.legislation = legislation
         self.spouse_has_usufruct = False
         self.usufruct_value = 0.0
         self.usufruct_rate = 0.0
@@ -178,9 +206,15 @@ class HeirShareCalculator:
         }
     
     
-    def calculate(self, heirs: List, wishes, net_succession_assets: float, tracer: 'BusinessLogicTracer' = None) -> Dict[str, float]:
+    def calculate(
+        self, heirs: List, wishes, net_succession_assets: float, tracer: 'BusinessLogicTracer' = None,
+        members: MemberIndex = None
+    ) -> Dict[str, float]:
         """
         Calculate share percentage for each heir with optional tracing.
+
+        members: index of the same heirs (e.g. SimulationIndex.members),
+        reused when nobody renounced.
         """
         heir_shares = {}
         
@@ -216,13 +250,15 @@ class HeirShareCalculator:
         
         # Use active_heirs for calculation from here
         heirs = active_heirs
+        if members is None or renounced_heirs:
+            members = MemberIndex(heirs)
         
         # Build representation map
         representation_map = self._build_representation_map(heirs)
         
         # Check for spouse and stepchildren
-        spouse = self._find_spouse(heirs)
-        children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
+        spouse = members.spouse
+        children = members.of(HeirRelation.CHILD)
         self.has_stepchildren = any(
             not getattr(child, 'is_from_current_union', True) for child in children
         )
@@ -235,7 +271,7 @@ class HeirShareCalculator:
                     why=f"Le conjoint a choisi l'option: {wishes.spouse_choice.choice}"
                 )
             heir_shares = self._apply_spouse_choice(
-                heirs, wishes, spouse, net_succession_assets, representation_map
+                members, wishes, spouse, net_succession_assets, representation_map
             )
         elif wishes and hasattr(wishes, 'custom_shares') and wishes.custom_shares:
             if tracer: tracer.explain(what="Application Testament", why="Répartition personnalisée selon testament.")
@@ -246,7 +282,7 @@ class HeirShareCalculator:
                     what="Dévolution Légale par défaut", 
                     why="Application des règles du Code Civil (Ordre et Degrés) en l'absence de testament ou d'option spécifique."
                 )
-            heir_shares = self._apply_default_distribution(heirs, representation_map)
+            heir_shares = self._apply_default_distribution(members, representation_map)
         
         # Merge renounced shares (0%) with calculated shares
         heir_shares.update(renounced_shares)
@@ -269,23 +305,15 @@ class HeirShareCalculator:
                 representation_map[heir.represented_heir_id].append(heir)
         return representation_map
     
-    def _find_spouse(self, heirs: List):
-        """Find spouse or partner in heirs list."""
-        return next(
-            (h for h in heirs if h.relationship in [HeirRelation.SPOUSE, HeirRelation.PARTNER]),
-            None
-        )
-    
     def _apply_spouse_choice(
-        self, heirs: List, wishes, spouse, net_succession_assets: float,
+        self, members: MemberIndex, wishes, spouse, net_succession_assets: float,
         representation_map: Dict[str, List]
     ) -> Dict[str, float]:
         """Apply spouse choice (Art. 757 CC options)."""
-        from succession_engine.schemas import SpouseChoiceType
         
         heir_shares = {}
         choice = wishes.spouse_choice.choice
-        children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
+        children = members.of(HeirRelation.CHILD)
         
         if choice == SpouseChoiceType.USUFRUCT:
             self.add_applied_rule("RULE_SPOUSE_OPTION_USUFRUCT")
@@ -295,7 +323,7 @@ class HeirShareCalculator:
                 "Le conjoint a opté pour l'usufruit"
             )
             heir_shares = self._apply_usufruct_option(
-                heirs, spouse, net_succession_assets, representation_map
+                members, spouse, net_succession_assets, representation_map
             )
         elif choice == SpouseChoiceType.QUARTER_OWNERSHIP:
             self.add_applied_rule("RULE_SPOUSE_OPTION_QUARTER")
@@ -312,14 +340,14 @@ class HeirShareCalculator:
         return heir_shares
     
     def _apply_usufruct_option(
-        self, heirs: List, spouse, net_succession_assets: float,
+        self, members: MemberIndex, spouse, net_succession_assets: float,
         representation_map: Dict[str, List]
     ) -> Dict[str, float]:
         """Apply usufruct option (Art. 757 CC)."""
         heir_shares = {}
         heir_shares[spouse.id] = 0.0  # Usufruit (pas de part en PP)
         
-        children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
+        children = members.of(HeirRelation.CHILD)
         
         # Handle representation: count souches
         souches = set()
@@ -348,12 +376,11 @@ class HeirShareCalculator:
         
         # Calculate fiscal valuation
         try:
-            from succession_engine.rules.usufruct import UsufructValuator
-            
             usufruct_val, bare_ownership_val, usufruct_rate = UsufructValuator.calculate_value(
                 net_succession_assets,
                 spouse.birth_date,
-                date.today()
+                date.today(),
+                legislation=self.legislation
             )
             self.usufruct_value = usufruct_val
             self.bare_ownership_value = bare_ownership_val
@@ -417,7 +444,7 @@ class HeirShareCalculator:
         return heir_shares
     
     def _apply_default_distribution(
-        self, heirs: List, representation_map: Dict[str, List], tracer=None
+        self, members: MemberIndex, representation_map: Dict[str, List], tracer=None
     ) -> Dict[str, float]:
         """
         Apply default legal distribution.
@@ -429,24 +456,19 @@ class HeirShareCalculator:
         - Other combinations: equal distribution
         """
         heir_shares = {}
+        heirs = members.members
         
         # Check for spouse-only case (Art. 757-2 CC)
-        spouse = self._find_spouse(heirs)
-        children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
-        grandchildren = [
-            h for h in heirs 
-            if h.relationship == HeirRelation.GRANDCHILD and h.represented_heir_id
-        ]
-        great_grandchildren = [
-            h for h in heirs
-            if h.relationship == HeirRelation.GREAT_GRANDCHILD and h.represented_heir_id
-        ]
-        parents = [h for h in heirs if h.relationship == HeirRelation.PARENT]
+        spouse = members.spouse
+        children = members.of(HeirRelation.CHILD)
+        grandchildren = [h for h in members.of(HeirRelation.GRANDCHILD) if h.represented_heir_id]
+        great_grandchildren = [h for h in members.of(HeirRelation.GREAT_GRANDCHILD) if h.represented_heir_id]
+        parents = members.of(HeirRelation.PARENT)
         
         # Spouse alone: 100% in full ownership (Art. 757-2 CC)
         if spouse and len(children) == 0 and len(grandchildren) == 0 and len(parents) == 0:
             # Check if only spouse (no siblings either)
-            siblings = [h for h in heirs if h.relationship == HeirRelation.SIBLING]
+            siblings = members.of(HeirRelation.SIBLING)
             if len(siblings) == 0:
                 # Spouse is sole heir
                 heir_shares[spouse.id] = 1.0
@@ -535,11 +557,11 @@ class HeirShareCalculator:
                     
                     # Manual distribution for siblings
                     sib_souches = {}
-                    for sib in [h for h in heirs if h.relationship == HeirRelation.SIBLING]:
+                    for sib in members.of(HeirRelation.SIBLING):
                         sib_souches[sib.id] = [sib]
                     
                     # Nephews representing
-                    nephews = [h for h in heirs if h.relationship == HeirRelation.NEPHEW_NIECE]
+                    nephews = members.of(HeirRelation.NEPHEW_NIECE)
                     for neph in nephews:
                         if neph.represented_heir_id:
                             if neph.represented_heir_id not in sib_souches:
@@ -566,7 +588,6 @@ class HeirShareCalculator:
         # The estate is split 50/50 between paternal and maternal lines
         if not spouse and not children and not grandchildren and not great_grandchildren:
              # Phase 11 Refactor: Delegated to FenteDevolution rule
-             from succession_engine.rules.fente import FenteDevolution
              # Ensure we pass the current state of shares (likely empty or partial)
              heir_shares = FenteDevolution.apply_fente(other_heirs, heir_shares, tracer=tracer)
              
@@ -588,11 +609,12 @@ class HeirShareCalculator:
             souches[souche_id].append(gc)
         
         # Great-grandchildren represent their grandparent (or great-grandparent souche)
+        grandchildren_by_id = index_by_id(grandchildren)
         for ggc in great_grandchildren:
             souche_id = ggc.represented_heir_id
             # Find the root souche (child of deceased)
             # The represented_heir_id should point to the grandchild, we need to find which child souche
-            parent_gc = next((gc for gc in grandchildren if gc.id == souche_id), None)
+            parent_gc = grandchildren_by_id.get(souche_id)
             if parent_gc and parent_gc.represented_heir_id:
                 # The grandchild represents a child, so great-grandchild goes to that souche
                 root_souche = parent_gc.represented_heir_id
@@ -675,7 +697,8 @@ def check_excessive_liberalities(
     bequests_total_value: float,
     disposable_quota: float,
     legal_reserve: float,
-    reserve_fraction: float
+    reserve_fraction: float,
+    explain: bool = True
 ) -> List[str]:
     """
     Check if donations + bequests exceed disposable quota (Art. 920+ CC).
@@ -688,11 +711,14 @@ def check_excessive_liberalities(
         disposable_quota: Available disposable quota
         legal_reserve: Total legal reserve amount
         reserve_fraction: Reserve as fraction of estate
+        explain: False skips the check (fast mode: the messages are not used)
         
     Returns:
         List of warning messages
     """
     warnings = []
+    if not explain:
+        return warnings
     total_liberalities = reportable_donations_value + bequests_total_value
     
     if total_liberalities > disposable_quota and reserve_fraction > 0:
@@ -713,7 +739,9 @@ def check_excessive_liberalities(
 def calculate_droit_de_retour(
     assets: List,
     heirs: List,
-    net_succession_assets: float
+    net_succession_assets: float,
+    members: MemberIndex = None,
+    explain: bool = True
 ) -> Tuple[Dict[str, float], float, List[str]]:
     """
     Calculate droit de retour (Art. 738-2 CC).
@@ -726,6 +754,8 @@ def calculate_droit_de_retour(
         assets: List of Asset objects
         heirs: List of FamilyMember objects
         net_succession_assets: Total estate value
+        members: Index of the same heirs (built from heirs if omitted)
+        explain: False skips the warning messages (fast mode)
         
     Returns:
         Tuple of:
@@ -738,24 +768,26 @@ def calculate_droit_de_retour(
     total_return = 0.0
     
     # Only applies if no descendants
-    children = [h for h in heirs if h.relationship == HeirRelation.CHILD]
-    grandchildren = [h for h in heirs if h.relationship == HeirRelation.GRANDCHILD]
+    members = members or MemberIndex(heirs)
+    children = members.of(HeirRelation.CHILD)
+    grandchildren = members.of(HeirRelation.GRANDCHILD)
     
     if children or grandchildren:
         # Descendants exist, no droit de retour
         return return_amounts, 0.0, warnings
     
     # Check parents in heirs
-    parents = [h for h in heirs if h.relationship == HeirRelation.PARENT]
+    parents = members.of(HeirRelation.PARENT)
     if not parents:
         return return_amounts, 0.0, warnings
+    parent_ids = {p.id for p in parents}
     
     # Find assets received from parents
     max_return_per_parent = net_succession_assets * 0.25  # 1/4 limit
     
     for asset in assets:
         parent_id = getattr(asset, 'received_from_parent_id', None)
-        if parent_id and parent_id in [p.id for p in parents]:
+        if parent_id and parent_id in parent_ids:
             current_return = return_amounts.get(parent_id, 0.0)
             asset_value = asset.estimated_value
             
@@ -765,13 +797,14 @@ def calculate_droit_de_retour(
                 return_amounts[parent_id] = current_return + allowed_return
                 total_return += allowed_return
                 
-                warnings.append(
-                    f"🔄 DROIT DE RETOUR (Art. 738-2 CC): {asset.id} ({asset_value:,.0f}€) "
-                    f"retourne au parent donateur ({parent_id}). "
-                    f"Valeur restituée: {allowed_return:,.0f}€"
-                )
+                if explain:
+                    warnings.append(
+                        f"🔄 DROIT DE RETOUR (Art. 738-2 CC): {asset.id} ({asset_value:,.0f}€) "
+                        f"retourne au parent donateur ({parent_id}). "
+                        f"Valeur restituée: {allowed_return:,.0f}€"
+                    )
     
-    if total_return > 0:
+    if total_return > 0 and explain:
         warnings.insert(0, 
             f"💡 Droit de retour applicable: {total_return:,.0f}€ "
             f"(biens donnés par les parents reviennent à eux, limite: 1/4 par parent)"
@@ -8,13 +8,34 @@ Responsibilities:
 - Calculate reportable donations (rapport civil)
 - Deduct debts from estate
 - Build the reconstructed estate value
+
+Donations retained by the estate are ReportableDonation records (slotted,
+typed attributes) rather than dicts: estates may carry hundreds of them and
+they are read again per heir during taxation.
 """
 
-from typing import List, Dict, Tuple
-from succession_engine.schemas import Asset, ExemptionType
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+from succession_engine.schemas import Asset, ExemptionType, DonationType
+from succession_engine.constants import MAX_FUNERAL_DEDUCTION
+from succession_engine.core.index import SimulationIndex, index_by_id
+
+
+@dataclass(slots=True)
+class ReportableDonation:
+    """A donation counted in the estate (rapport civil or réunion fictive)."""
+    beneficiary_id: Optional[str]
+    beneficiary_name: str
+    donation_date: date
+    value: float
+    type: str
+    is_declared_to_tax: bool
+    # False for réunion fictive only donations (donation-partage, hors part)
+    is_reportable: bool = True
 
 
-def get_reportable_donations(donations: List) -> Tuple[List[Dict], float]:
+def get_reportable_donations(donations: List) -> Tuple[List[ReportableDonation], float]:
     """
     Extract reportable donations for civil report (rapport civil).
     
@@ -27,7 +48,7 @@ def get_reportable_donations(donations: List) -> Tuple[List[Dict], float]:
         donations: List of Donation schema objects
         
     Returns:
-        Tuple of (list of donation info dicts, total reportable value)
+        Tuple of (list of ReportableDonation, total reportable value)
     """
     reportable_donations = []
     reportable_donations_value = 0.0
@@ -37,19 +58,19 @@ def get_reportable_donations(donations: List) -> Tuple[List[Dict], float]:
             if donation.is_reportable():
                 reportable_value = donation.get_reportable_value()
                 reportable_donations_value += reportable_value
-                reportable_donations.append({
-                    'beneficiary_id': donation.beneficiary_heir_id,
-                    'beneficiary_name': donation.beneficiary_name,
-                    'donation_date': donation.donation_date,
-                    'value': reportable_value,
-                    'type': donation.donation_type.value,
-                    'is_declared_to_tax': donation.is_declared_to_tax
-                })
+                reportable_donations.append(ReportableDonation(
+                    donation.beneficiary_heir_id,
+                    donation.beneficiary_name,
+                    donation.donation_date,
+                    reportable_value,
+                    donation.donation_type.value,
+                    donation.is_declared_to_tax
+                ))
     
     return reportable_donations, reportable_donations_value
 
 
-def get_donations_for_reunion_fictive(donations: List) -> Tuple[List[Dict], float]:
+def get_donations_for_reunion_fictive(donations: List) -> Tuple[List[ReportableDonation], float]:
     """
     Get all donations for Reunion Fictive (Art. 922 CC).
     
@@ -62,13 +83,12 @@ def get_donations_for_reunion_fictive(donations: List) -> Tuple[List[Dict], floa
     - Présent d'usage
     
     Returns:
-        Tuple of (list of donation info dicts, total value for reunion fictive)
+        Tuple of (list of ReportableDonation, total value for reunion fictive)
     """
     reunion_donations = []
     reunion_value = 0.0
     
     if donations:
-        from succession_engine.schemas import DonationType
         for donation in donations:
             # PRESENT_USAGE is excluded from everything (Art 852 CC)
             if donation.donation_type == DonationType.PRESENT_USAGE:
@@ -82,16 +102,16 @@ def get_donations_for_reunion_fictive(donations: List) -> Tuple[List[Dict], floa
                 val = donation.get_reportable_value()
                 
             reunion_value += val
-            reunion_donations.append({
-                'beneficiary_id': donation.beneficiary_heir_id,
-                'beneficiary_name': donation.beneficiary_name,
-                'donation_date': donation.donation_date,
-                'value': val,
-                'type': donation.donation_type.value,
-                'is_declared_to_tax': donation.is_declared_to_tax,
+            reunion_donations.append(ReportableDonation(
+                donation.beneficiary_heir_id,
+                donation.beneficiary_name,
+                donation.donation_date,
+                val,
+                donation.donation_type.value,
+                donation.is_declared_to_tax,
                 # Tag to distinguish origin
-                'is_reportable': donation.is_reportable()
-            })
+                donation.is_reportable()
+            ))
             
     return reunion_donations, reunion_value
 
@@ -100,7 +120,9 @@ def reconstitute_estate(
     net_assets: float,
     reportable_donations_value: float = 0.0,
     debts: List = None,
-    assets: List[Asset] = None
+    assets: List[Asset] = None,
+    index: SimulationIndex = None,
+    explain: bool = True
 ) -> Tuple[float, float, List[str]]:
     """
     Reconstitute estate (Masse successorale).
@@ -115,6 +137,8 @@ def reconstitute_estate(
         reportable_donations_value: Total value of reportable donations
         debts: List of Debt schema objects
         assets: List of Assets (needed for Art. 769 CGI check)
+        index: Per-run lookups (assets by id), built from assets if omitted
+        explain: False skips the warning messages (fast mode)
         
     Returns:
         Tuple of (net succession assets, total deductible debts, warnings)
@@ -122,10 +146,8 @@ def reconstitute_estate(
     total_deductible_debts = 0.0
     debt_warnings = []
     
-    # Import constant locally to avoid circular imports
-    from succession_engine.constants import MAX_FUNERAL_DEDUCTION
-    
     if debts:
+        assets_by_id = index.assets_by_id if index else index_by_id(assets or [])
         for debt in debts:
             if debt.is_deductible:
                 amount_to_deduct = debt.amount
@@ -133,29 +155,31 @@ def reconstitute_estate(
                 # Check for linked asset partial exemption (Art. 769 CGI)
                 # "Les dettes contractées pour l'acquisition ou la conservation des biens 
                 # sont déductibles dans les mêmes proportions que les biens auxquels elles se rapportent."
-                if debt.linked_asset_id and assets:
-                    linked_asset = next((a for a in assets if a.id == debt.linked_asset_id), None)
+                if debt.linked_asset_id:
+                    linked_asset = assets_by_id.get(debt.linked_asset_id)
                     if linked_asset and linked_asset.professional_exemption:
                         ex_type = linked_asset.professional_exemption.exemption_type
                         if ex_type in [ExemptionType.DUTREIL, ExemptionType.FORESTRY, ExemptionType.RURAL_LEASE]:
                             # Exonération de 75% => Déductibilité de 25%
                             # Note: Simplification, certains ruraux sont à 50%, mais Dutreil/Forêt majo = 75%
                             amount_to_deduct = amount_to_deduct * 0.25
-                            debt_warnings.append(
-                                f"⚠️ Dette '{debt.description or debt.id}' plafonnée à 25% "
-                                f"car liée à un bien partiellement exonéré ({linked_asset.id}). (Art. 769 CGI)"
-                            )
+                            if explain:
+                                debt_warnings.append(
+                                    f"⚠️ Dette '{debt.description or debt.id}' plafonnée à 25% "
+                                    f"car liée à un bien partiellement exonéré ({linked_asset.id}). (Art. 769 CGI)"
+                                )
 
                 # Plafonnement frais funéraires (Art. 775 CGI)
                 if debt.debt_type == "FUNERAL":
                     if amount_to_deduct > MAX_FUNERAL_DEDUCTION and not getattr(debt, 'proof_provided', False):
                         amount_to_deduct = MAX_FUNERAL_DEDUCTION
-                        debt_warnings.append(
-                            f"⚠️ Frais funéraires plafonnés à {MAX_FUNERAL_DEDUCTION}€ (Art. 775 CGI) "
-                            f"car aucun justificatif complet n'a été fourni "
-                            f"(montant déclaré : {debt.amount}€)."
-                        )
-                    elif amount_to_deduct > MAX_FUNERAL_DEDUCTION:
+                        if explain:
+                            debt_warnings.append(
+                                f"⚠️ Frais funéraires plafonnés à {MAX_FUNERAL_DEDUCTION}€ (Art. 775 CGI) "
+                                f"car aucun justificatif complet n'a été fourni "
+                                f"(montant déclaré : {debt.amount}€)."
+                            )
+                    elif amount_to_deduct > MAX_FUNERAL_DEDUCTION and explain:
                         debt_warnings.append(
                             f"ℹ️ Frais funéraires supérieurs au plafond légal ({MAX_FUNERAL_DEDUCTION}€) "
                             f"acceptés sur justificatifs (montant : {debt.amount}€)."
@@ -163,7 +187,7 @@ def reconstitute_estate(
                         
                 total_deductible_debts += amount_to_deduct
             else:
-                if getattr(debt, 'proof_provided', False):
+                if explain and getattr(debt, 'proof_provided', False):
                      debt_warnings.append(
                         f"⚠️ La dette '{debt.description or debt.id}' a un justificatif mais est marquée non déductible."
                      )
@@ -0,0 +1,291 @@
+"""
+SimulationExecutor - Parallel execution of many simulations.
+
+SuccessionCalculator.run is pure CPU once the legislation snapshot is in
+memory, so a batch on a single Python process only uses one core. This module
+fans a list of SimulationInput out across a ProcessPoolExecutor:
+
+- Workers are pre-warmed by the pool initializer: the parent's EngineProvider
+  is installed (Django is set up only when the parent runs under it) and
+  each worker keeps a SuccessionCalculator bound to the snapshot compiled by
+  the parent process (no database access in the workers).
+- Inputs are sent in chunks (SIMULATION_EXECUTOR_CHUNKSIZE) to amortise the
+  pickling/IPC overhead.
+- Results come back in input order; a failing simulation yields an error
+  outcome for its own index instead of aborting the batch.
+
+Small batches (a single chunk) and max_workers=1 run in-process.
+
+Long-lived processes (web workers) share one executor per process
+(get_simulation_executor): its pool is started on first use, kept across
+requests and restarted when the active legislation changes. Forking and
+warming workers costs far more than a request-sized batch, so until the pool
+is warm, batches run in-process.
+"""
+
+import logging
+import math
+import os
+import threading
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Sequence
+
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.services.legislation import (
+    LegislationSnapshot, get_legislation_snapshot, snapshot_generation
+)
+from succession_engine.services.provider import EngineProvider, get_engine_provider, set_engine_provider
+
+# Number of inputs sent to a worker at once
+DEFAULT_CHUNKSIZE = 4
+
+logger = logging.getLogger(__name__)
+
+
+def run_simulation(
+    calculator: SuccessionCalculator, simulation_input: SimulationInput,
+    detail_level: DetailLevel = DetailLevel.FULL
+) -> Dict[str, Any]:
+    """
+    Run one simulation and return its outcome.
+
+    Returns:
+        {"status": "ok", "result": output} (enriched by ExplainerService in FULL mode) or
+        {"status": "error", "error": ..., "details": ...}
+    """
+    from succession_engine.services.explainer import explainer
+    try:
+        result = calculator.run(simulation_input, detail_level=detail_level)
+        if detail_level == DetailLevel.SUMMARY:
+            return {"status": "ok", "result": result.model_dump()}
+        return {"status": "ok", "result": explainer.enrich_output(result.model_dump())}
+    except Exception as e:
+        return {"status": "error", "error": "Calculation failed", "details": str(e)}
+
+
+# --- Worker process side ---
+
+_worker_calculator: Optional[SuccessionCalculator] = None
+
+
+def _init_worker(legislation: Optional[LegislationSnapshot], provider: Optional[EngineProvider] = None) -> None:
+    """Pool initializer: install the parent's provider (Django is set up only if it uses it) and snapshot."""
+    global _worker_calculator
+    if provider is not None:
+        provider.prepare_worker()
+        set_engine_provider(provider)
+    _worker_calculator = SuccessionCalculator(legislation=legislation)
+
+
+def _run_in_worker(simulation_input: SimulationInput, detail_level: DetailLevel) -> Dict[str, Any]:
+    return run_simulation(_worker_calculator, simulation_input, detail_level)
+
+
+def _warm_up() -> int:
+    """No-op task: returns once the worker has run its initializer."""
+    return os.getpid()
+
+
+def _warm_up_failed(future: Future) -> bool:
+    return future.cancelled() or future.exception() is not None
+
+
+# --- Parent process side ---
+
+def _executor_setting(name: str, default):
+    return get_engine_provider().setting(name, default)
+
+
+class SimulationExecutor:
+    """
+    Run many SimulationInput in parallel, results in input order.
+
+    Usage:
+        results = SimulationExecutor().map(inputs)
+
+    or, to reuse the same warm workers across several batches:
+        with SimulationExecutor(max_workers=4) as executor:
+            results = executor.map(inputs)
+
+    A started pool keeps the snapshot it was created with; restart it after
+    a legislation change (get_simulation_executor does it for the shared one).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        legislation: LegislationSnapshot = None,
+        detail_level: DetailLevel = DetailLevel.FULL,
+        lazy: bool = False
+    ):
+        """
+        Args:
+            max_workers: Worker processes (default: SIMULATION_EXECUTOR_WORKERS, then CPU count)
+            chunksize: Inputs per task (default: SIMULATION_EXECUTOR_CHUNKSIZE, then DEFAULT_CHUNKSIZE)
+            legislation: Compiled legislation to use (default: the active one)
+            detail_level: Default of map(); SUMMARY runs the fast mode (figures only, no explainer)
+            lazy: Never create a pool for a single batch: the first parallel batch
+                starts the persistent pool and batches run in-process until it is warm
+        """
+        self.max_workers = max(1, max_workers or _executor_setting('SIMULATION_EXECUTOR_WORKERS', 0) or os.cpu_count() or 1)
+        self.chunksize = max(1, chunksize or _executor_setting('SIMULATION_EXECUTOR_CHUNKSIZE', DEFAULT_CHUNKSIZE))
+        self.legislation = legislation
+        self.detail_level = detail_level
+        self.lazy = lazy
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._warm_up: List[Future] = []
+        self._pool_lock = threading.Lock()
+
+    def _get_legislation(self) -> Optional[LegislationSnapshot]:
+        if self.legislation is None:
+            self.legislation = get_legislation_snapshot()
+        return self.legislation
+
+    def _create_pool(self, workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._get_legislation(), get_engine_provider())
+        )
+
+    def start(self, wait_ready: bool = False) -> "SimulationExecutor":
+        """
+        Start (and pre-warm) a persistent pool of max_workers processes.
+
+        Args:
+            wait_ready: Block until every worker has loaded the snapshot
+        """
+        with self._pool_lock:
+            if self._pool is None and self.max_workers > 1:
+                self._pool = self._create_pool(self.max_workers)
+                self._warm_up = [self._pool.submit(_warm_up) for _ in range(self.max_workers)]
+        if wait_ready:
+            for future in self._warm_up:
+                future.result()
+        return self
+
+    @property
+    def ready(self) -> bool:
+        """True once the persistent pool is started and its workers are warm."""
+        warm_up = self._warm_up
+        return self._pool is not None and all(future.done() and not _warm_up_failed(future) for future in warm_up)
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool (if still the current one): the next batch starts a fresh one."""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool, self._warm_up = None, []
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the persistent pool, if any (wait=False lets batches in flight finish in the background)."""
+        with self._pool_lock:
+            pool, self._pool, self._warm_up = self._pool, None, []
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def map(
+        self, inputs: Sequence[SimulationInput], detail_level: Optional[DetailLevel] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run all inputs and return their outcomes (see run_simulation) in input order.
+
+        Args:
+            detail_level: Overrides the executor's detail level for this batch
+        """
+        inputs = list(inputs)
+        if not inputs:
+            return []
+        detail_level = detail_level or self.detail_level
+
+        workers = min(self.max_workers, math.ceil(len(inputs) / self.chunksize))
+        if self.lazy:
+            if workers > 1:
+                self.start()
+                pool, warm_up = self._pool, self._warm_up
+                if pool is not None and all(future.done() for future in warm_up):
+                    if any(_warm_up_failed(future) for future in warm_up):
+                        logger.error("Simulation workers failed to start, batch run in-process, pool restarted")
+                        self._discard_pool(pool)
+                    else:
+                        try:
+                            return self._map_in_pool(pool, inputs, detail_level)
+                        except BrokenExecutor:
+                            logger.exception("Simulation worker died, batch re-run in-process, pool restarted")
+                            self._discard_pool(pool)
+                        except RuntimeError:
+                            # Pool shut down meanwhile (legislation change): run this batch here
+                            pass
+            return self._map_in_process(inputs, detail_level)
+
+        pool = self._pool
+        if pool is not None:
+            try:
+                return self._map_in_pool(pool, inputs, detail_level)
+            except BrokenExecutor:
+                self._discard_pool(pool)
+                raise
+        if workers <= 1:
+            return self._map_in_process(inputs, detail_level)
+        with self._create_pool(workers) as pool:
+            return self._map_in_pool(pool, inputs, detail_level)
+
+    def _map_in_process(self, inputs: List[SimulationInput], detail_level: DetailLevel) -> List[Dict[str, Any]]:
+        calculator = SuccessionCalculator(legislation=self._get_legislation())
+        return [run_simulation(calculator, simulation_input, detail_level) for simulation_input in inputs]
+
+    def _map_in_pool(
+        self, pool: ProcessPoolExecutor, inputs: List[SimulationInput], detail_level: DetailLevel
+    ) -> List[Dict[str, Any]]:
+        return list(pool.map(_run_in_worker, inputs, repeat(detail_level), chunksize=self.chunksize))
+
+
+# --- Process-wide executor ---
+
+_shared_executor: Optional[SimulationExecutor] = None
+_shared_generation: Optional[int] = None
+_shared_lock = threading.Lock()
+
+
+def get_simulation_executor() -> SimulationExecutor:
+    """
+    Return the executor shared by the whole process, bound to the active legislation.
+
+    Its pool is started lazily (see SimulationExecutor lazy) and replaced by
+    a new executor after invalidate_legislation_snapshot or when the active
+    snapshot's fingerprint changes; the old pool finishes its batches in the
+    background.
+    """
+    global _shared_executor, _shared_generation
+    generation = snapshot_generation()
+    legislation = get_legislation_snapshot()
+    fingerprint = legislation.fingerprint if legislation is not None else None
+    with _shared_lock:
+        executor = _shared_executor
+        if executor is not None and _shared_generation == generation and (
+            (executor.legislation.fingerprint if executor.legislation is not None else None) == fingerprint
+        ):
+            return executor
+        _shared_executor = SimulationExecutor(legislation=legislation, lazy=True)
+        _shared_generation = generation
+    if executor is not None:
+        executor.shutdown(wait=False)
+    return _shared_executor
+
+
+def reset_simulation_executor() -> None:
+    """Stop the shared executor's pool (a new executor is created on next use)."""
+    global _shared_executor, _shared_generation
+    with _shared_lock:
+        executor, _shared_executor, _shared_generation = _shared_executor, None, None
+    if executor is not None:
+        executor.shutdown()
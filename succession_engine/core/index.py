@@ -0,0 +1,117 @@
+"""
+Simulation Index - Lookups built once per run.
+
+The pipeline looks items up by id (bequeathed assets and their
+beneficiaries, assets linked to debts, life-insurance beneficiaries),
+filters members by relationship and donations by beneficiary. Built once
+from the SimulationInput, the index turns these per-item scans into dict
+lookups, so per-heir / per-asset work no longer grows with the estate size.
+
+Lookups keep the semantics of the scans they replace: the first item wins
+on duplicate ids, groups keep the input order.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from succession_engine.schemas import HeirRelation
+
+SPOUSE_RELATIONS = (HeirRelation.SPOUSE, HeirRelation.PARTNER)
+
+
+def index_by_id(items: Iterable) -> Dict[str, Any]:
+    """{item.id: item}, the first item wins on duplicate ids (like next() scans)."""
+    by_id = {}
+    for item in items:
+        by_id.setdefault(item.id, item)
+    return by_id
+
+
+def group_by(items: Iterable, key: Callable[[Any], Any]) -> Dict[Any, List]:
+    """Items grouped by key(item), input order kept inside each group."""
+    groups = defaultdict(list)
+    for item in items:
+        groups[key(item)].append(item)
+    return dict(groups)
+
+
+@dataclass(slots=True)
+class DonationTotals:
+    """Per-beneficiary sums of the reportable donations (imputation, 15-year recall). Read-only."""
+    value: float = 0.0
+    declared_value: float = 0.0
+
+
+NO_DONATIONS = DonationTotals()
+
+
+class MemberIndex:
+    """
+    Family members by id and by relationship.
+
+    Usage:
+        members = MemberIndex(heirs)
+        children = members.of(HeirRelation.CHILD)
+    """
+
+    def __init__(self, members: Iterable):
+        self.members = list(members)
+        self.by_id = index_by_id(self.members)
+        self.by_relationship = group_by(self.members, lambda member: member.relationship)
+        # First spouse or partner in input order
+        self.spouse = next((m for m in self.members if m.relationship in SPOUSE_RELATIONS), None)
+
+    def of(self, *relationships: HeirRelation) -> List:
+        """Members with one of the relationships, in input order (do not mutate)."""
+        if len(relationships) == 1:
+            return self.by_relationship.get(relationships[0], [])
+        return [m for m in self.members if m.relationship in relationships]
+
+    def get(self, member_id: Optional[str]):
+        return self.by_id.get(member_id)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+
+@dataclass
+class SimulationIndex:
+    """
+    Per-run lookups over a SimulationInput (read-only once built).
+
+    - assets_by_id: Asset by id
+    - members: MemberIndex of all members (renouncing heirs included)
+    - donations_by_beneficiary: ReportableDonation records (see
+      get_reportable_donations) by beneficiary_id
+    - donation_totals: their DonationTotals by beneficiary_id
+    """
+    assets_by_id: Dict[str, Any] = field(default_factory=dict)
+    members: MemberIndex = field(default_factory=lambda: MemberIndex([]))
+    donations_by_beneficiary: Dict[Optional[str], List] = field(default_factory=dict)
+    donation_totals: Dict[Optional[str], DonationTotals] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, input_data, reportable_donations: Iterable = ()) -> 'SimulationIndex':
+        donations_by_beneficiary = group_by(reportable_donations, lambda d: d.beneficiary_id)
+        return cls(
+            assets_by_id=index_by_id(input_data.assets),
+            members=MemberIndex(input_data.members),
+            donations_by_beneficiary=donations_by_beneficiary,
+            donation_totals={
+                beneficiary_id: DonationTotals(
+                    sum([d.value for d in donations]),
+                    sum([d.value for d in donations if d.is_declared_to_tax])
+                )
+                for beneficiary_id, donations in donations_by_beneficiary.items()
+            }
+        )
+
+    def donations_of(self, heir_id: str) -> List:
+        return self.donations_by_beneficiary.get(heir_id, [])
+
+    def donation_totals_of(self, heir_id: str) -> DonationTotals:
+        return self.donation_totals.get(heir_id, NO_DONATIONS)
@@ -13,6 +13,7 @@ Separates property between deceased and surviving spouse:
 
 from typing import List, Dict, TYPE_CHECKING
 from succession_engine.rules.life_insurance import LifeInsuranceCalculator
+from succession_engine.schemas import OwnershipMode, HeirRelation
 
 if TYPE_CHECKING:
     from succession_engine.schemas import SimulationInput
@@ -98,7 +99,6 @@ class MatrimonialLiquidator:
                 deceased_percentage = 100.0  # Default: 100% owned by deceased (if personal) or 100% of community
                 
                 # Handle Indivision
-                from succession_engine.schemas import OwnershipMode
                 if asset.ownership_mode == OwnershipMode.INDIVISION and asset.indivision_details:
                     deceased_percentage = asset.indivision_details.get_deceased_share_percentage()
                     # Indivision share applies to the base value (which might already be weighted if logic allows, 
@@ -232,7 +232,6 @@ class MatrimonialLiquidator:
             excess_advantage = 0.0
             
             if members:
-                from succession_engine.schemas import HeirRelation
                 stepchildren = [m for m in members if m.relationship == HeirRelation.CHILD and not getattr(m, 'is_from_current_union', True)]
                 all_children = [m for m in members if m.relationship == HeirRelation.CHILD]
                 
@@ -0,0 +1,332 @@
+"""
+DonationOptimizer - Search for donation schedules that minimise total duties.
+
+Drives the existing engine: every candidate schedule is evaluated with
+SuccessionCalculator.run in fast mode (DetailLevel.SUMMARY) and
+FiscalCalculator.calculate_inheritance_tax, nothing is reimplemented here.
+
+Model:
+- The death is assumed horizon_years from today. Figures (values, ages) are
+  those of today's simulation; only the recall window depends on the horizon.
+- A planned donation is a don manuel taken from the funding asset (a personal
+  asset in full ownership): the estate shrinks by the donated amount, the
+  donation is reported (rapport civil) and imputed on the heir's share.
+- Donation duties use the legislation allowances and scale; the heir's
+  donations of the previous 15 years are recalled (Art. 784 CGI): allowance
+  and brackets apply to the cumulated amount, the donation pays the
+  difference. The same rule is applied at death to the heir's taxable share
+  from the engine (the engine's own recall, prior_allowance_used, only
+  reduces the allowance: splitting a gift would restart the brackets).
+- Reserve: an heir never receives more than their share of the estate
+  without donations, so donations stay advances on inheritance.
+
+Objective: donation duties + GlobalMetrics.total_tax_amount.
+
+Search: pattern search over the amounts (heir x donation year), steepest
+improving move of +/- delta, delta halved down to amount_step when stuck.
+Evaluations are memoized per schedule and donation duties per heir; the
+stage cache reuses the liquidation of schedules with the same total.
+"""
+
+import time
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from succession_engine.schemas import (
+    SimulationInput, Donation, DonationType, HeirRelation, OwnershipMode, AssetOrigin, AdoptionType,
+    DetailLevel, DonationPlanInput, PlannedDonation, DonationSchedule, DonationPlanResult
+)
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.core.estate import get_reportable_donations
+from succession_engine.rules.fiscal import FiscalCalculator
+from succession_engine.rules.life_insurance import LifeInsuranceCalculator
+from succession_engine.services.legislation import LegislationSnapshot, get_legislation_snapshot
+
+# Fiscal recall period of prior donations (Art. 784 CGI)
+RECALL_YEARS = 15
+
+# Donation years tried by default: every DEFAULT_DONATION_YEAR_STEP years up to the horizon
+DEFAULT_DONATION_YEAR_STEP = 5
+
+Schedule = Tuple[float, ...]  # amount per (heir, donation year), heir-major
+
+
+def add_years(day: date, years: int) -> date:
+    """Same day years later (28 February for 29 February on non-leap years)."""
+    try:
+        return day.replace(year=day.year + years)
+    except ValueError:
+        return day.replace(year=day.year + years, day=28)
+
+
+class DonationOptimizer:
+    """
+    Usage:
+        result = DonationOptimizer(plan_input).optimize()
+    """
+
+    def __init__(self, plan_input: DonationPlanInput, calculator: SuccessionCalculator = None,
+                 legislation: LegislationSnapshot = None):
+        """
+        Raises:
+            ValueError: unknown heir / funding asset, spouse as donee, no funding asset
+        """
+        self.plan_input = plan_input
+        self.simulation = plan_input.simulation
+        self.legislation = legislation or get_legislation_snapshot()
+        self.calculator = calculator or SuccessionCalculator(legislation=self.legislation)
+        self.today = date.today()
+        self.step = plan_input.amount_step
+
+        members = {member.id: member for member in self.simulation.members}
+        heir_ids = plan_input.heir_ids or [
+            member.id for member in self.simulation.members
+            if member.relationship not in (HeirRelation.SPOUSE, HeirRelation.PARTNER)
+        ]
+        for heir_id in heir_ids:
+            if heir_id not in members:
+                raise ValueError(f"Héritier introuvable : {heir_id}")
+            if members[heir_id].relationship in (HeirRelation.SPOUSE, HeirRelation.PARTNER):
+                # The engine exempts spouses at death; donations to a spouse are taxed differently
+                raise ValueError(f"Donation au conjoint/partenaire non prise en charge : {heir_id}")
+        if not heir_ids:
+            raise ValueError("Aucun donataire possible.")
+        self.heirs = [members[heir_id] for heir_id in heir_ids]
+
+        self.years = sorted(set(plan_input.donation_years or range(0, plan_input.horizon_years + 1, DEFAULT_DONATION_YEAR_STEP)))
+        if any(year < 0 or year > plan_input.horizon_years for year in self.years):
+            raise ValueError("Les années de donation doivent être comprises entre 0 et l'horizon.")
+
+        self.funding_asset = self._get_funding_asset(plan_input.funding_asset_id)
+        self.funding_share = self.funding_asset.ownership_percentage / 100
+        self.budget = self.funding_asset.estimated_value * self.funding_share
+
+        # Allowance already recalled by the engine for existing declared donations
+        self.existing_recall: Dict[str, float] = {}
+        for donation in get_reportable_donations(self.simulation.donations)[0]:
+            if donation.is_declared_to_tax:
+                beneficiary_id = donation.beneficiary_id
+                self.existing_recall[beneficiary_id] = self.existing_recall.get(beneficiary_id, 0.0) + donation.value
+
+        self.evaluations = 0
+        self._costs: Dict[Schedule, Tuple[float, float]] = {}
+        self._donation_taxes: Dict[Tuple[str, Tuple[float, ...]], Tuple[float, ...]] = {}
+
+        baseline = self._run(self.simulation)
+        self.baseline_tax = baseline.global_metrics.total_tax_amount
+        gross_shares = {heir.id: heir.gross_share_value for heir in baseline.heirs_breakdown}
+        self.heir_caps = [gross_shares.get(heir.id, 0.0) for heir in self.heirs]
+
+    def _get_funding_asset(self, asset_id: Optional[str]):
+        candidates = [
+            asset for asset in self.simulation.assets
+            if asset.ownership_mode == OwnershipMode.FULL_OWNERSHIP
+            and asset.asset_origin == AssetOrigin.PERSONAL_PROPERTY
+            and not LifeInsuranceCalculator.is_life_insurance(asset)
+        ]
+        if asset_id:
+            asset = next((a for a in candidates if a.id == asset_id), None)
+            if asset is None:
+                raise ValueError(f"Actif de financement invalide (bien propre en pleine propriété requis) : {asset_id}")
+            return asset
+        if not candidates:
+            raise ValueError("Aucun bien propre en pleine propriété pour financer les donations.")
+        return max(candidates, key=lambda a: a.estimated_value * a.ownership_percentage)
+
+    # --- Evaluation ---
+
+    def _run(self, simulation_input: SimulationInput):
+        self.evaluations += 1
+        return self.calculator.run(simulation_input, detail_level=DetailLevel.SUMMARY)
+
+    def _is_recalled(self, year: int) -> bool:
+        return self.plan_input.horizon_years - year < RECALL_YEARS
+
+    def _heir_donation_taxes(self, heir, amounts: Tuple[float, ...]) -> Tuple[float, ...]:
+        """
+        Duties of each donation to one heir (memoized). Donations of the previous
+        15 years are recalled: allowance and brackets apply to the cumulated
+        amount, the donation pays the difference.
+        """
+        key = (heir.id, amounts)
+        taxes = self._donation_taxes.get(key)
+        if taxes is None:
+            taxes = []
+            for index, (year, amount) in enumerate(zip(self.years, amounts)):
+                if amount <= 0:
+                    taxes.append(0.0)
+                    continue
+                recalled_amount = sum(
+                    prior_amount for prior_year, prior_amount in zip(self.years[:index], amounts[:index])
+                    if year - prior_year < RECALL_YEARS
+                )
+                tax = self._scale_tax(heir, recalled_amount + amount) - self._scale_tax(heir, recalled_amount)
+                taxes.append(tax)
+            taxes = tuple(taxes)
+            self._donation_taxes[key] = taxes
+        return taxes
+
+    def _scale_tax(self, heir, amount: float, prior_allowance_used: float = 0.0) -> float:
+        if amount <= 0:
+            return 0.0
+        tax, _ = FiscalCalculator.calculate_inheritance_tax(
+            amount, heir.relationship,
+            is_disabled=heir.is_disabled,
+            prior_allowance_used=prior_allowance_used,
+            is_adopted_simple=heir.adoption_type == AdoptionType.SIMPLE,
+            has_continuous_care=heir.has_received_continuous_care,
+            legislation=self.legislation
+        )
+        return tax
+
+    def _succession_tax(self, schedule: Schedule) -> float:
+        """Duties at death, donations of the last 15 years recalled on each heir's share."""
+        result = self._run(self._variant(schedule))
+        succession_tax = result.global_metrics.total_tax_amount
+        for index, heir in enumerate(self.heirs):
+            recalled = sum(
+                amount for year, amount in zip(self.years, self._heir_amounts(schedule, index))
+                if self._is_recalled(year)
+            )
+            if recalled <= 0:
+                continue
+            row = next(h for h in result.heirs_breakdown if h.id == heir.id)
+            share = row.tax_calculation_details.gross_amount if row.tax_calculation_details else 0.0
+            prior = self.existing_recall.get(heir.id, 0.0)
+            succession_tax += (
+                self._scale_tax(heir, recalled + share, prior) - self._scale_tax(heir, recalled, prior)
+                - row.tax_amount
+            )
+        return succession_tax
+
+    def _heir_amounts(self, schedule: Schedule, heir_index: int) -> Tuple[float, ...]:
+        width = len(self.years)
+        return schedule[heir_index * width:(heir_index + 1) * width]
+
+    def _planned_donations(self, schedule: Schedule) -> List[Donation]:
+        donations = []
+        for heir_index, heir in enumerate(self.heirs):
+            for year, amount in zip(self.years, self._heir_amounts(schedule, heir_index)):
+                if amount > 0:
+                    donations.append(Donation(
+                        id=f"plan_{heir.id}_{year}",
+                        donation_type=DonationType.DON_MANUEL,
+                        beneficiary_name=heir.id,
+                        beneficiary_heir_id=heir.id,
+                        beneficiary_relationship=heir.relationship,
+                        donation_date=add_years(self.today, year),
+                        original_value=amount
+                    ))
+        return donations
+
+    def _variant(self, schedule: Schedule) -> SimulationInput:
+        """The simulation at death after the schedule: funding asset reduced, donations added."""
+        funded_value = self.funding_asset.estimated_value - sum(schedule) / self.funding_share
+        assets = [
+            asset.model_copy(update={"estimated_value": funded_value}) if asset.id == self.funding_asset.id else asset
+            for asset in self.simulation.assets
+        ]
+        return self.simulation.model_copy(update={
+            "assets": assets,
+            "donations": list(self.simulation.donations) + self._planned_donations(schedule)
+        })
+
+    def _cost(self, schedule: Schedule) -> Tuple[float, float]:
+        """(donation duties, succession duties) of a schedule (memoized)."""
+        cost = self._costs.get(schedule)
+        if cost is None:
+            donation_tax = sum(
+                sum(self._heir_donation_taxes(heir, self._heir_amounts(schedule, index)))
+                for index, heir in enumerate(self.heirs)
+            )
+            if any(schedule):
+                succession_tax = self._succession_tax(schedule)
+            else:
+                succession_tax = self.baseline_tax
+            cost = (donation_tax, succession_tax)
+            self._costs[schedule] = cost
+        return cost
+
+    def _is_feasible(self, schedule: Schedule) -> bool:
+        if min(schedule) < 0 or sum(schedule) > self.budget:
+            return False
+        return all(
+            sum(self._heir_amounts(schedule, index)) <= cap
+            for index, cap in enumerate(self.heir_caps)
+        )
+
+    # --- Search ---
+
+    def optimize(self) -> DonationPlanResult:
+        """Run the search within the time budget and return the best schedules found."""
+        start = time.perf_counter()
+        deadline = start + self.plan_input.time_budget_seconds
+        size = len(self.heirs) * len(self.years)
+
+        current: Schedule = (0.0,) * size
+        current_total = sum(self._cost(current))
+        delta = self.step
+        while delta * 2 <= self.budget / 2:
+            delta *= 2
+
+        converged = True
+        while delta >= self.step:
+            best_move, best_total = None, current_total
+            for index in range(size):
+                for sign in (1, -1):
+                    candidate = list(current)
+                    candidate[index] += sign * delta
+                    candidate = tuple(candidate)
+                    if not self._is_feasible(candidate):
+                        continue
+                    if time.perf_counter() > deadline:
+                        converged = False
+                        break
+                    total = sum(self._cost(candidate))
+                    if total < best_total - 0.005:
+                        best_move, best_total = candidate, total
+                if not converged:
+                    break
+            if not converged:
+                break
+            if best_move is None:
+                delta /= 2
+            else:
+                current, current_total = best_move, best_total
+
+        return DonationPlanResult(
+            baseline_tax_amount=self.baseline_tax,
+            schedules=self._best_schedules(self.plan_input.max_schedules),
+            evaluations=self.evaluations,
+            elapsed_seconds=time.perf_counter() - start,
+            converged=converged
+        )
+
+    def _best_schedules(self, count: int) -> List[DonationSchedule]:
+        ranked = sorted(self._costs.items(), key=lambda item: (sum(item[1]), sum(item[0])))[:count]
+        return [self._describe(schedule, cost) for schedule, cost in ranked]
+
+    def _describe(self, schedule: Schedule, cost: Tuple[float, float]) -> DonationSchedule:
+        donation_tax, succession_tax = cost
+        donations = []
+        for heir_index, heir in enumerate(self.heirs):
+            amounts = self._heir_amounts(schedule, heir_index)
+            taxes = self._heir_donation_taxes(heir, amounts)
+            for year, amount, tax in zip(self.years, amounts, taxes):
+                if amount > 0:
+                    donations.append(PlannedDonation(
+                        heir_id=heir.id,
+                        year_offset=year,
+                        donation_date=add_years(self.today, year),
+                        amount=amount,
+                        recalled=self._is_recalled(year),
+                        donation_tax=tax
+                    ))
+        total = donation_tax + succession_tax
+        return DonationSchedule(
+            donations=donations,
+            donation_tax_amount=donation_tax,
+            succession_tax_amount=succession_tax,
+            total_tax_amount=total,
+            savings=self.baseline_tax - total
+        )
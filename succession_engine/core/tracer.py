@@ -1,5 +1,10 @@
+import copy
 from typing import List, Dict, Optional, Any
-from succession_engine.schemas import CalculationStep, CalculationDecision, DecisionType, HeirExplicabilityBlock
+from succession_engine.schemas import (
+    CalculationStep, CalculationDecision, DecisionType, HeirExplicabilityBlock,
+    PedagogicalContent, CalculationBlock, KeyInsight, InsightType
+)
+from succession_engine.core.educational_content import EDUCATIONAL_CONTENT
 
 class BusinessLogicTracer:
     """
@@ -11,10 +16,22 @@ class BusinessLogicTracer:
         self.steps: List[CalculationStep] = []
         self.current_step: Optional[CalculationStep] = None
         
-        # Load static content
-        from succession_engine.core.educational_content import EDUCATIONAL_CONTENT
+        # Static content
         self.content_db = EDUCATIONAL_CONTENT
 
+    def fork(self) -> 'BusinessLogicTracer':
+        """
+        Independent copy of the tracer.
+
+        Only the current step can still be modified (all recording goes
+        through current_step), so it is deep-copied; closed steps are shared.
+        """
+        clone = BusinessLogicTracer.__new__(BusinessLogicTracer)
+        clone.content_db = self.content_db
+        clone.current_step = copy.deepcopy(self.current_step)
+        clone.steps = [clone.current_step if step is self.current_step else step for step in self.steps]
+        return clone
+
     def start_step_pedagogical(self, step_number: int, step_id: str) -> None:
         """Begin a new structured calculation step."""
         # Retrieve static content for this step ID
@@ -25,7 +42,6 @@ class BusinessLogicTracer:
             "legal_references": []
         })
         
-        from succession_engine.schemas import PedagogicalContent, CalculationBlock
         
         self.current_step = CalculationStep(
             step_number=step_number,
@@ -68,7 +84,6 @@ class BusinessLogicTracer:
     def add_insight(self, type: str, message: str) -> None:
         """Add a smart insight (Positive/Warning/Edu)."""
         if self.current_step:
-            from succession_engine.schemas import KeyInsight, InsightType
             try:
                 itype = InsightType(type)
             except ValueError:
@@ -0,0 +1,156 @@
+"""
+Benchmark Engine - Latency / memory / query-count benchmark of SuccessionCalculator.run.
+
+Measures every golden scenario and synthetic large families, prints a table
+and compares it to the stored baseline (tests/benchmark/baseline.json).
+
+Usage:
+    python manage.py benchmark_engine                   # compare to the baseline
+    python manage.py benchmark_engine --save-baseline   # record a new baseline
+    python manage.py benchmark_engine --scenario SC005 --no-synthetic --iterations 200
+    python manage.py benchmark_engine --scale --iterations 5   # + generated large estates
+    python manage.py benchmark_engine --micro                  # + engine stages on a 1,000-asset estate
+
+Exits with an error when a case regresses beyond --threshold.
+"""
+
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Benchmark SuccessionCalculator.run (golden + synthetic cases) against a JSON baseline'
+
+    def add_arguments(self, parser):
+        from succession_engine.services.benchmark import (
+            DEFAULT_ITERATIONS, DEFAULT_WARMUP, DEFAULT_THRESHOLD, DEFAULT_BASELINE_PATH
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=DEFAULT_ITERATIONS,
+            help=f'Timed runs per case (default: {DEFAULT_ITERATIONS})',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=DEFAULT_WARMUP,
+            help=f'Untimed runs per case before measuring (default: {DEFAULT_WARMUP})',
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            help='Only this golden scenario ID (repeatable)',
+        )
+        parser.add_argument(
+            '--no-synthetic',
+            action='store_true',
+            help='Skip the synthetic large families',
+        )
+        parser.add_argument(
+            '--scale',
+            action='store_true',
+            help='Also measure the generated large estates (thousands of assets, slow)',
+        )
+        parser.add_argument(
+            '--micro',
+            action='store_true',
+            help='Also measure single engine stages (liquidation, reconstitution, devolution/taxation, tracer)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the generated large estates (default: 0)',
+        )
+        parser.add_argument(
+            '--summary',
+            action='store_true',
+            help='Benchmark the fast mode (DetailLevel.SUMMARY)',
+        )
+        parser.add_argument(
+            '--baseline',
+            type=str,
+            default=str(DEFAULT_BASELINE_PATH),
+            help='Baseline JSON file',
+        )
+        parser.add_argument(
+            '--save-baseline',
+            action='store_true',
+            help='Write the results as the new baseline instead of comparing',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help=f'Tolerated relative slowdown (default: {DEFAULT_THRESHOLD})',
+        )
+        parser.add_argument(
+            '--strict-tail',
+            action='store_true',
+            help='Also fail on p95 regressions (noisy on shared machines)',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Also write the report to this JSON file',
+        )
+
+    def handle(self, *args, **options):
+        from succession_engine.schemas import DetailLevel
+        from succession_engine.services.benchmark import (
+            golden_cases, synthetic_cases, scale_cases, micro_cases, run_benchmark,
+            load_baseline, save_baseline, compare_to_baseline
+        )
+
+        cases = golden_cases(only=options['scenario'])
+        if not options['no_synthetic']:
+            cases += synthetic_cases()
+        if options['scale']:
+            cases += scale_cases(seed=options['seed'])
+        micro = micro_cases(seed=options['seed']) if options['micro'] else []
+        if not cases and not micro:
+            raise CommandError('No benchmark case selected')
+
+        detail_level = DetailLevel.SUMMARY if options['summary'] else DetailLevel.FULL
+        report = run_benchmark(
+            cases, iterations=options['iterations'], warmup=options['warmup'], detail_level=detail_level,
+            micro=micro
+        )
+        self._print_table(report)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            save_baseline(report, baseline_path)
+            self.stdout.write(self.style.SUCCESS(f'Baseline enregistrée : {baseline_path}'))
+            return
+
+        baseline = load_baseline(baseline_path)
+        if baseline is None:
+            self.stdout.write(self.style.WARNING(f'Pas de baseline ({baseline_path}), utilisez --save-baseline'))
+            return
+        if baseline.get('meta', {}).get('detail_level', DetailLevel.FULL.value) != detail_level.value:
+            raise CommandError('The baseline was recorded with another detail level')
+
+        regressions = compare_to_baseline(
+            report, baseline, threshold=options['threshold'], include_tail=options['strict_tail']
+        )
+        if regressions:
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(f'  ✗ {regression}'))
+            raise CommandError(f'{len(regressions)} régression(s) de performance')
+        self.stdout.write(self.style.SUCCESS(f'✓ Aucune régression (seuil {options["threshold"]:.0%})'))
+
+    def _print_table(self, report):
+        self.stdout.write(f'{"case":<45} {"p50 ms":>9} {"p95 ms":>9} {"peak KB":>9} {"queries":>8}')
+        for name, result in report['cases'].items():
+            self.stdout.write(
+                f'{name:<45} {result["p50_ms"]:>9.3f} {result["p95_ms"]:>9.3f} '
+                f'{result["peak_kb"]:>9.1f} {result["queries"]:>8}'
+            )
+        self.stdout.write(f'Import à froid du moteur (sans Django) : {report["meta"]["cold_import_ms"]:.1f} ms')
@@ -0,0 +1,44 @@
+"""
+Export Legislation - Write a compiled legislation as a versioned artifact file.
+
+The artifact (see services.legislation_artifact) is loaded without database
+by setting LEGISLATION_ARTIFACT, or by load_legislation_artifact().
+
+Usage:
+    python manage.py export_legislation --output legislation.json.gz   # active legislation
+    python manage.py export_legislation --legislation "Loi Finances 2026" --output draft.json
+    python manage.py export_legislation > legislation.json
+"""
+
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Export a compiled legislation (active by default) as a JSON artifact, gzip if --output ends with .gz'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--legislation',
+            type=str,
+            help='Legislation id or name to export (default: the active one)',
+        )
+        parser.add_argument('--output', type=str, help='Write the artifact to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        from succession_engine.services.legislation import build_snapshot_from_db, find_legislation
+        from succession_engine.services.legislation_artifact import dump_legislation_artifact, snapshot_to_artifact
+
+        try:
+            legislation = find_legislation(options['legislation'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        snapshot = build_snapshot_from_db(legislation)
+
+        if options['output']:
+            dump_legislation_artifact(snapshot, options['output'])
+        else:
+            self.stdout.write(json.dumps(snapshot_to_artifact(snapshot), ensure_ascii=False, indent=1))
+        self.stderr.write(self.style.SUCCESS(
+            f'{snapshot.name} ({snapshot.year}) exportée, empreinte {snapshot.fingerprint}'
+        ))
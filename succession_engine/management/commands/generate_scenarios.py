@@ -0,0 +1,71 @@
+"""
+Generate Scenarios - Seeded synthetic large-estate SimulationInputs for scale testing.
+
+Writes {"inputs": [...]} (the format read by simulate_batch), one input per
+seed, all with the same sizes.
+
+Usage:
+    python manage.py generate_scenarios --assets 5000 --donations 500 --heirs 200 --output big.json
+    python manage.py generate_scenarios --family collaterals --count 10 --seed 100 --output batch.json
+    python manage.py simulate_batch big.json --summary
+"""
+
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Generate seeded synthetic SimulationInputs (large estates) as a simulate_batch input file'
+
+    def add_arguments(self, parser):
+        from succession_engine.services.scenario_generator import GeneratorConfig, FAMILIES
+
+        defaults = GeneratorConfig()
+        parser.add_argument('--seed', type=int, default=0, help='Seed of the first input (default: 0)')
+        parser.add_argument('--count', type=int, default=1, help='Inputs to generate, seeds seed..seed+count-1')
+        parser.add_argument('--family', choices=FAMILIES, default=defaults.family, help='Family structure')
+        parser.add_argument('--assets', type=int, default=defaults.assets)
+        parser.add_argument('--heirs', type=int, default=defaults.heirs, help='Members other than the spouse')
+        parser.add_argument('--donations', type=int, default=defaults.donations)
+        parser.add_argument('--debts', type=int, default=defaults.debts)
+        parser.add_argument('--bequests', type=int, default=defaults.bequests, help='Specific bequests')
+        parser.add_argument('--no-spouse', action='store_true', help='No surviving spouse (descendants family)')
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the inputs to this file instead of stdout',
+        )
+
+    def handle(self, *args, **options):
+        from succession_engine.services.scenario_generator import ScenarioGenerator, GeneratorConfig
+
+        if options['count'] < 1:
+            raise CommandError('--count must be at least 1')
+        try:
+            config = GeneratorConfig(
+                family=options['family'],
+                assets=options['assets'],
+                heirs=options['heirs'],
+                donations=options['donations'],
+                debts=options['debts'],
+                bequests=options['bequests'],
+                with_spouse=not options['no_spouse'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        inputs = [
+            ScenarioGenerator(seed).payload(config)
+            for seed in range(options['seed'], options['seed'] + options['count'])
+        ]
+        content = json.dumps({"inputs": inputs}, ensure_ascii=False)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.stdout.write(self.style.SUCCESS(
+                f'{len(inputs)} scénario(s) généré(s) ({config.assets} actifs, {config.heirs} héritiers) '
+                f'-> {options["output"]}'
+            ))
+        else:
+            self.stdout.write(content)
@@ -0,0 +1,110 @@
+"""
+Resimulate - Re-compute saved scenarios under a legislation and store compact results.
+
+Results go to SimulationResult (one row per scenario and legislation); the
+report gives the throughput and the tax impact against the latest stored
+result of each scenario (see services.resimulation).
+
+Usage:
+    python manage.py resimulate                                  # all scenarios, active legislation
+    python manage.py resimulate 12 15 18 --workers 4
+    python manage.py resimulate --since 2025-01-01
+    python manage.py resimulate --legislation "Loi Finances 2026" --dry-run
+"""
+
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Re-simulate saved scenarios (all or selected) and store compact results per legislation'
+
+    def add_arguments(self, parser):
+        from succession_engine.services.resimulation import DEFAULT_RESIMULATION_BATCH_SIZE, DEFAULT_TOP_CHANGES
+
+        parser.add_argument('scenario_ids', nargs='*', type=int, help='Scenario ids (default: all scenarios)')
+        parser.add_argument('--since', type=str, help='Only scenarios created on or after this date (YYYY-MM-DD)')
+        parser.add_argument(
+            '--legislation',
+            type=str,
+            help='Legislation id or name to apply (default: the active one)',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Compute and report only, store nothing')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Worker processes (default: SIMULATION_EXECUTOR_WORKERS, then CPU count)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_RESIMULATION_BATCH_SIZE,
+            help=f'Scenarios read, computed and written at once (default: {DEFAULT_RESIMULATION_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=DEFAULT_TOP_CHANGES,
+            help=f'Largest tax changes to list (default: {DEFAULT_TOP_CHANGES})',
+        )
+
+    def handle(self, *args, **options):
+        from succession_engine.models import SimulationScenario
+        from succession_engine.services.resimulation import Resimulation
+
+        legislation = self._get_legislation(options['legislation'])
+
+        scenarios = SimulationScenario.objects.all()
+        if options['scenario_ids']:
+            scenarios = scenarios.filter(pk__in=options['scenario_ids'])
+        if options['since']:
+            try:
+                since = datetime.strptime(options['since'], '%Y-%m-%d')
+            except ValueError:
+                raise CommandError(f"--since must be a date YYYY-MM-DD, got {options['since']!r}")
+            scenarios = scenarios.filter(created_at__gte=timezone.make_aware(since))
+
+        try:
+            resimulation = Resimulation(
+                legislation, max_workers=options['workers'],
+                batch_size=options['batch_size'], dry_run=options['dry_run'], top=options['top']
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        report = resimulation.run(scenarios)
+
+        self._print_report(report)
+
+    @staticmethod
+    def _get_legislation(value):
+        from succession_engine.services.legislation import find_legislation
+
+        try:
+            return find_legislation(value)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+    def _print_report(self, report):
+        prefix = '[dry-run] ' if report.dry_run else ''
+        self.stdout.write(
+            f'{prefix}{report.scenarios} scénario(s) sous {report.legislation} en {report.elapsed_seconds:.2f}s '
+            f'({report.throughput:.1f}/s), {report.errors} erreur(s)'
+        )
+        if not report.dry_run:
+            self.stdout.write(f'Résultats : {report.created} créé(s), {report.updated} mis à jour')
+        self.stdout.write(f'Droits totaux : {report.total_tax:,.2f} €')
+        if report.compared:
+            delta = report.compared_total_tax - report.previous_total_tax
+            self.stdout.write(
+                f'Comparés au dernier résultat enregistré ({report.compared} scénario(s)) : '
+                f'{report.previous_total_tax:,.2f} € -> {report.compared_total_tax:,.2f} € '
+                f'({delta:+,.2f} €), {report.changed} scénario(s) modifié(s)'
+            )
+            for change in report.top_changes():
+                self.stdout.write(
+                    f'  #{change.scenario_id} {change.name} : '
+                    f'{change.previous_tax:,.2f} € -> {change.new_tax:,.2f} € ({change.delta:+,.2f} €)'
+                )
+        style = self.style.WARNING if report.errors else self.style.SUCCESS
+        self.stderr.write(style(f'{prefix}Terminé'))
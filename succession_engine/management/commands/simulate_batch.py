@@ -0,0 +1,125 @@
+"""
+Simulate Batch - Run many simulations in parallel from a JSON file.
+
+Accepted input formats:
+- a JSON array of SimulationInput
+- {"inputs": [...]}
+- a golden scenarios file ({"scenarios": [{"id": ..., "input": {...}}, ...]})
+
+Results are written (in input order) to --output or stdout.
+
+Runs on the process-wide SimulationExecutor (a dedicated one with --workers
+or --chunksize); its workers are started and warmed before the batch.
+"""
+
+import json
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Run a batch of simulations in parallel (SimulationExecutor) from a JSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'input_file',
+            type=str,
+            help='JSON file containing the simulation inputs',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the results to this file instead of stdout',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Worker processes (default: SIMULATION_EXECUTOR_WORKERS, then CPU count)',
+        )
+        parser.add_argument(
+            '--chunksize',
+            type=int,
+            help='Inputs sent to a worker at once (default: SIMULATION_EXECUTOR_CHUNKSIZE)',
+        )
+        parser.add_argument(
+            '--summary',
+            action='store_true',
+            help='Fast mode: global metrics and heirs breakdown only (DetailLevel.SUMMARY)',
+        )
+
+    def handle(self, *args, **options):
+        from pydantic import ValidationError
+        from succession_engine.core.executor import SimulationExecutor, get_simulation_executor
+        from succession_engine.schemas import SimulationInput, DetailLevel
+
+        input_path = Path(options['input_file'])
+        if not input_path.exists():
+            raise CommandError(f'File not found: {input_path}')
+
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        items = self._extract_items(data)
+        if items is None:
+            raise CommandError('Expected a JSON array, {"inputs": [...]} or {"scenarios": [...]}')
+
+        # Validate everything first, invalid items are reported in place
+        parsed = []
+        for item in items:
+            try:
+                parsed.append((SimulationInput(**item), None))
+            except ValidationError as e:
+                parsed.append((None, {"errors": e.errors(include_url=False, include_context=False)}))
+            except Exception as e:
+                parsed.append((None, {"error": str(e)}))
+
+        valid_indexes = [index for index, (simulation_input, _) in enumerate(parsed) if simulation_input is not None]
+
+        start = time.perf_counter()
+        if options['workers'] or options['chunksize']:
+            executor = SimulationExecutor(max_workers=options['workers'], chunksize=options['chunksize'], lazy=True)
+        else:
+            executor = get_simulation_executor()
+        try:
+            if len(valid_indexes) > executor.chunksize:
+                executor.start(wait_ready=True)
+            outcomes = dict(zip(valid_indexes, executor.map(
+                [parsed[index][0] for index in valid_indexes],
+                detail_level=DetailLevel.SUMMARY if options['summary'] else DetailLevel.FULL
+            )))
+        finally:
+            executor.shutdown()
+        elapsed = time.perf_counter() - start
+
+        results = []
+        for index, (_, error) in enumerate(parsed):
+            outcome = outcomes[index] if error is None else {"status": "error", **error}
+            results.append({"index": index, **outcome})
+
+        payload = json.dumps(results, ensure_ascii=False, indent=2, default=str)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(payload)
+        else:
+            self.stdout.write(payload)
+
+        failed = sum(1 for r in results if r["status"] != "ok")
+        summary = (
+            f'{len(results)} simulation(s) en {elapsed:.2f}s '
+            f'({executor.max_workers} worker(s), chunksize {executor.chunksize}), {failed} erreur(s)'
+        )
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stderr.write(style(summary))
+
+    @staticmethod
+    def _extract_items(data):
+        """Return the list of raw inputs from the supported file formats, or None."""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            if isinstance(data.get('inputs'), list):
+                return data['inputs']
+            if isinstance(data.get('scenarios'), list):
+                return [scenario.get('input', {}) for scenario in data['scenarios']]
+        return None
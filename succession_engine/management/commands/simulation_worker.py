@@ -0,0 +1,89 @@
+"""
+Simulation Worker - Run the queued simulation jobs (see services.jobs).
+
+The SimulationJob table is the queue: start as many workers as needed, on
+one or several hosts sharing the database. SIGTERM / Ctrl-C stop the worker
+once its current job is finished.
+
+Usage:
+    python manage.py simulation_worker                      # poll forever
+    python manage.py simulation_worker --once               # run the queued jobs, then exit
+    python manage.py simulation_worker --chunk-size 200 --workers 4
+"""
+
+import signal
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Run queued simulation jobs (batch, donation plan) from the database queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit when the queue is empty')
+        parser.add_argument('--max-jobs', type=int, help='Exit after this many jobs')
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            help='Seconds between two polls of an empty queue (default: SIMULATION_JOB_POLL_INTERVAL)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Batch inputs computed between two progress reports (default: SIMULATION_JOB_CHUNK_SIZE)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Worker processes of a batch job (default: SIMULATION_EXECUTOR_WORKERS, then CPU count)',
+        )
+        parser.add_argument('--name', type=str, help='Worker name stored on its jobs (default: host:pid)')
+
+    def handle(self, *args, **options):
+        from succession_engine.services.jobs import (
+            SimulationWorker, requeue_stale_jobs, DEFAULT_JOB_MAX_ATTEMPTS, DEFAULT_JOB_STALE_SECONDS
+        )
+
+        worker = SimulationWorker(name=options['name'], chunk_size=options['chunk_size'], max_workers=options['workers'])
+        poll_interval = options['poll_interval'] or getattr(settings, 'SIMULATION_JOB_POLL_INTERVAL', 2.0)
+        stale_seconds = getattr(settings, 'SIMULATION_JOB_STALE_SECONDS', DEFAULT_JOB_STALE_SECONDS)
+        max_attempts = getattr(settings, 'SIMULATION_JOB_MAX_ATTEMPTS', DEFAULT_JOB_MAX_ATTEMPTS)
+
+        self._stopping = False
+        previous_handlers = {sig: signal.signal(sig, self._stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        self.stderr.write(f'Worker {worker.name} démarré')
+        processed = 0
+        try:
+            while not self._stopping and (options['max_jobs'] is None or processed < options['max_jobs']):
+                requeued, failed = requeue_stale_jobs(stale_seconds, max_attempts)
+                if requeued or failed:
+                    self.stderr.write(self.style.WARNING(
+                        f'{requeued} job(s) abandonné(s) remis en file, {failed} en échec'
+                    ))
+
+                started = time.monotonic()
+                job = worker.run_next()
+                if job is None:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                processed += 1
+                self._print_job(job, time.monotonic() - started)
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
+        self.stderr.write(self.style.SUCCESS(f'Worker {worker.name} arrêté, {processed} job(s) traité(s)'))
+
+    def _stop(self, signum, frame):
+        self._stopping = True
+
+    def _print_job(self, job, elapsed: float):
+        line = f'{job.kind} {job.pk} : {job.status} ({job.progress_done}/{job.progress_total}) en {elapsed:.2f}s'
+        if job.status == 'failed':
+            self.stdout.write(self.style.ERROR(f'{line} - {job.error}'))
+        else:
+            self.stdout.write(line)
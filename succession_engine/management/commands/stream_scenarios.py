@@ -0,0 +1,90 @@
+"""
+Stream Scenarios - Re-compute the saved SimulationScenario rows as NDJSON.
+
+Scenarios are read chunk by chunk and each result is written as soon as it
+is computed (one JSON document per line, see services.scenario_stream), so
+memory stays bounded whatever the size of the client book.
+
+Usage:
+    python manage.py stream_scenarios --output book.ndjson --summary
+    python manage.py stream_scenarios --output book.ndjson --resume   # after an interruption
+    python manage.py stream_scenarios --after 12000 --limit 500 > part.ndjson
+"""
+
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Re-compute the saved scenarios and write one NDJSON result line per scenario'
+
+    def add_arguments(self, parser):
+        from succession_engine.services.scenario_stream import DEFAULT_STREAM_CHUNK_SIZE
+
+        parser.add_argument('--output', type=str, help='Write the lines to this file instead of stdout')
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue --output after its last complete line (a partial last line is dropped)',
+        )
+        parser.add_argument('--after', type=int, default=0, help='Start after this scenario id (resume cursor)')
+        parser.add_argument('--limit', type=int, help='Maximum number of scenarios')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_STREAM_CHUNK_SIZE,
+            help=f'Scenarios fetched from the database at once (default: {DEFAULT_STREAM_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--summary',
+            action='store_true',
+            help='Fast mode: global metrics and heirs breakdown only (DetailLevel.SUMMARY)',
+        )
+
+    def handle(self, *args, **options):
+        from succession_engine.schemas import DetailLevel
+        from succession_engine.services.scenario_stream import (
+            stream_scenario_results, read_resume_cursor, line_status
+        )
+
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+        if options['resume'] and not options['output']:
+            raise CommandError('--resume requires --output')
+
+        after = options['after']
+        mode = 'wb'
+        if options['resume']:
+            try:
+                cursor, size = read_resume_cursor(options['output'])
+            except ValueError as e:
+                raise CommandError(str(e))
+            after = max(after, cursor)
+            with open(options['output'], 'ab') as f:
+                f.truncate(size)
+            mode = 'ab'
+
+        lines = stream_scenario_results(
+            after=after, limit=options['limit'], chunk_size=options['chunk_size'],
+            detail_level=DetailLevel.SUMMARY if options['summary'] else DetailLevel.FULL
+        )
+
+        start = time.perf_counter()
+        count = failed = 0
+        output = open(options['output'], mode) if options['output'] else None
+        try:
+            for line in lines:
+                if output is not None:
+                    output.write(line)
+                else:
+                    self.stdout.write(line.decode('utf-8'), ending='')
+                count += 1
+                if line_status(line) != 'ok':
+                    failed += 1
+        finally:
+            if output is not None:
+                output.close()
+
+        summary = f'{count} scénario(s) après #{after} en {time.perf_counter() - start:.2f}s, {failed} erreur(s)'
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stderr.write(style(summary))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('succession_engine', '0007_add_collateral_taxes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimulationResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('legislation_fingerprint', models.CharField(help_text='Content hash of the compiled legislation used', max_length=16)),
+                ('status', models.CharField(choices=[('ok', 'OK'), ('error', 'Erreur')], max_length=10)),
+                ('total_estate_value', models.DecimalField(blank=True, decimal_places=2, max_digits=14, null=True)),
+                ('total_tax_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=14, null=True)),
+                ('heirs_summary', models.JSONField(blank=True, default=list, help_text='[{id, relationship, net_share_value, tax_amount}]')),
+                ('error', models.TextField(blank=True, default='')),
+                ('computed_at', models.DateTimeField()),
+                ('legislation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='simulation_results', to='succession_engine.legislation')),
+                ('scenario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='results', to='succession_engine.simulationscenario')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scenario', 'legislation'), name='unique_result_per_legislation')],
+            },
+        ),
+    ]
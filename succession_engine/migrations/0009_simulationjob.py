@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:58
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('succession_engine', '0008_simulationresult'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimulationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('batch', 'Batch'), ('donation_plan', 'Plan de donations')], max_length=20)),
+                ('status', models.CharField(choices=[('queued', 'En attente'), ('running', 'En cours'), ('done', 'Terminé'), ('failed', 'Échec')], default='queued', max_length=10)),
+                ('input_data', models.JSONField(help_text='Request body of the matching synchronous endpoint')),
+                ('detail_level', models.CharField(default='full', max_length=10)),
+                ('legislation_fingerprint', models.CharField(blank=True, default='', max_length=16)),
+                ('progress_done', models.PositiveIntegerField(default=0)),
+                ('progress_total', models.PositiveIntegerField(default=0)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('worker', models.CharField(blank=True, default='', help_text='Worker running (or having run) the job', max_length=100)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, help_text='Last progress report of the worker', null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('legislation', models.ForeignKey(blank=True, help_text='Legislation to apply (empty: the active one when the job runs)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='simulation_jobs', to='succession_engine.legislation')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='simulation_job_queue')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('succession_engine', '0009_simulationjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimulationJobChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.PositiveIntegerField(help_text='Index of the first batch item of the chunk')),
+                ('size', models.PositiveIntegerField()),
+                ('succeeded', models.PositiveIntegerField(default=0)),
+                ('results', models.JSONField(help_text='Outcomes of items start .. start + size - 1, in order')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='succession_engine.simulationjob')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('job', 'start'), name='unique_chunk_per_job')],
+            },
+        ),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -68,6 +70,99 @@ class SimulationScenario(models.Model):
     def __str__(self):
         return self.name
 
+
+class SimulationResult(models.Model):
+    """
+    Compact result of a saved scenario under one legislation (resimulate command).
+    One row per (scenario, legislation), overwritten by each re-simulation.
+    """
+    STATUS_CHOICES = [
+        ('ok', 'OK'),
+        ('error', 'Erreur'),
+    ]
+
+    scenario = models.ForeignKey(SimulationScenario, on_delete=models.CASCADE, related_name='results')
+    legislation = models.ForeignKey(Legislation, on_delete=models.CASCADE, related_name='simulation_results')
+    legislation_fingerprint = models.CharField(max_length=16, help_text="Content hash of the compiled legislation used")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    total_estate_value = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True)
+    total_tax_amount = models.DecimalField(max_digits=14, decimal_places=2, null=True, blank=True)
+    heirs_summary = models.JSONField(default=list, blank=True, help_text="[{id, relationship, net_share_value, tax_amount}]")
+    error = models.TextField(blank=True, default='')
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['scenario', 'legislation'], name='unique_result_per_legislation'),
+        ]
+
+    def __str__(self):
+        return f"{self.scenario_id} / {self.legislation_id} : {self.status}"
+
+class SimulationJob(models.Model):
+    """
+    Long simulation (batch, donation plan) queued through the API and run by
+    the simulation_worker command; the table is the queue (see services.jobs).
+    """
+    KIND_CHOICES = [
+        ('batch', 'Batch'),
+        ('donation_plan', 'Plan de donations'),
+    ]
+    STATUS_CHOICES = [
+        ('queued', 'En attente'),
+        ('running', 'En cours'),
+        ('done', 'Terminé'),
+        ('failed', 'Échec'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    input_data = models.JSONField(help_text="Request body of the matching synchronous endpoint")
+    detail_level = models.CharField(max_length=10, default='full')
+    legislation = models.ForeignKey(
+        Legislation, on_delete=models.CASCADE, null=True, blank=True, related_name='simulation_jobs',
+        help_text="Legislation to apply (empty: the active one when the job runs)"
+    )
+    legislation_fingerprint = models.CharField(max_length=16, blank=True, default='')
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    worker = models.CharField(max_length=100, blank=True, default='', help_text="Worker running (or having run) the job")
+    attempts = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, help_text="Last progress report of the worker")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='simulation_job_queue'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.pk} : {self.status}"
+
+class SimulationJobChunk(models.Model):
+    """
+    Outcomes of consecutive items of a batch SimulationJob, saved by the worker
+    after each chunk (the job itself only keeps the counts).
+    """
+    job = models.ForeignKey(SimulationJob, on_delete=models.CASCADE, related_name='chunks')
+    start = models.PositiveIntegerField(help_text="Index of the first batch item of the chunk")
+    size = models.PositiveIntegerField()
+    succeeded = models.PositiveIntegerField(default=0)
+    results = models.JSONField(help_text="Outcomes of items start .. start + size - 1, in order")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'start'], name='unique_chunk_per_job'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} [{self.start}:{self.start + self.size}]"
+
 class Donation(models.Model):
     """
     Donation model matching the database schema.
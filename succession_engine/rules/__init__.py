@@ -4,6 +4,7 @@ Rules module for succession calculations.
 This module contains the business logic for French succession law,
 separated by domain:
 - fiscal: Tax calculations (inheritance tax, allowances, brackets)
+- fiscal_vectorized: Tax scale on many net taxable bases at once (NumPy, imported on demand)
 - usufruct: Usufruct/bare ownership valuation (Art. 669 CGI)
 - reduction: Reduction of excessive liberalities (Art. 920+ CC)
 - life_insurance: Life insurance taxation (Art. 990 I & 757 B CGI)
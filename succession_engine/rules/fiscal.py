@@ -1,5 +1,5 @@
 from succession_engine.schemas import HeirRelation, TaxCalculationDetail, TaxBracketDetail, ExemptionType, ProfessionalExemption
-from succession_engine.models import Legislation, Allowance, TaxBracket
+from succession_engine.services.legislation import LegislationSnapshot, get_legislation_snapshot
 from succession_engine.constants import (
     DISABILITY_ALLOWANCE,
     DUTREIL_EXEMPTION_RATE,
@@ -9,6 +9,21 @@ from succession_engine.constants import (
     FORESTRY_EXEMPTION_RATE,
 )
 
+# Mapping HeirRelation -> fiscal category used by Allowance / TaxBracket rows
+RELATION_TO_TAX_CATEGORY = {
+    'CHILD': 'CHILD',
+    'GRANDCHILD': 'CHILD',
+    'GREAT_GRANDCHILD': 'CHILD',
+    'PARENT': 'CHILD',
+    'SIBLING': 'SIBLING',
+    'SPOUSE': 'SPOUSE',
+    'PARTNER': 'SPOUSE',
+    'NEPHEW_NIECE': 'NEPHEW_NIECE',
+    'AUNT_UNCLE': 'RELATIVES_UP_TO_4TH_DEGREE',
+    'COUSIN': 'RELATIVES_UP_TO_4TH_DEGREE',
+    'GREAT_UNCLE_AUNT': 'RELATIVES_UP_TO_4TH_DEGREE',
+}
+
 class FiscalCalculator:
     """
     Responsible for all tax-related calculations in the succession process.
@@ -62,6 +77,18 @@ class FiscalCalculator:
         # Exonération non applicable
         return 0.0, asset_value
 
+    @staticmethod
+    def tax_relationship(
+        relationship: HeirRelation, is_adopted_simple: bool = False, has_continuous_care: bool = False
+    ) -> HeirRelation:
+        """
+        Relationship whose allowance and tax scale apply (Art. 786 CGI): a
+        simple adoptee without continuous care is taxed as a third party.
+        """
+        if is_adopted_simple and relationship == HeirRelation.CHILD and not has_continuous_care:
+            return HeirRelation.OTHER
+        return relationship
+
     @staticmethod
     def calculate_inheritance_tax(
         taxable_amount: float, 
@@ -70,7 +97,9 @@ class FiscalCalculator:
         prior_allowance_used: float = 0.0,
         is_adopted_simple: bool = False,
         has_continuous_care: bool = False,
-        tracer: 'BusinessLogicTracer' = None
+        tracer: 'BusinessLogicTracer' = None,
+        legislation: LegislationSnapshot = None,
+        apply_scale: bool = True
     ):
         """
         Calculates the inheritance tax based on the taxable amount and the relationship.
@@ -83,6 +112,9 @@ class FiscalCalculator:
             prior_allowance_used: Allowance already used by donations within 15 years (Art. 784 CGI)
                                   This amount is deducted from the available allowance.
             tracer: Optional tracer for explicability
+            legislation: Compiled legislation (default: cached active snapshot)
+            apply_scale: False stops after the allowances: no tax, details.net_taxable
+                         is the base to tax later (see rules.fiscal_vectorized)
         
         Returns:
             tuple: (tax_amount: float, details: TaxCalculationDetail)
@@ -90,16 +122,17 @@ class FiscalCalculator:
         if tracer:
             tracer.add_sub_step(f"Fiscalité {relationship}: Part brute: {taxable_amount:,.2f}€")
 
-        # Fetch active legislation
-        try:
-            legislation = Legislation.objects.get(is_active=True)
-        except Legislation.DoesNotExist:
-            print(f"[DEBUG FISCAL] No active legislation found!")
+        # Fetch active legislation (compiled snapshot, no query in steady state)
+        if legislation is None:
+            legislation = get_legislation_snapshot()
+        if legislation is None:
             if tracer: tracer.add_decision("ERROR", "Pas de législation active trouvée.")
             return 0.0, None
 
         # Handle adoption simple (Art. 786 CGI)
-        effective_relationship = relationship
+        effective_relationship = FiscalCalculator.tax_relationship(
+            relationship, is_adopted_simple, has_continuous_care
+        )
         if is_adopted_simple and relationship == HeirRelation.CHILD:
             if has_continuous_care:
                 if tracer:
@@ -109,7 +142,6 @@ class FiscalCalculator:
                         "Preuve de soins continus apportée (Art. 786 CGI)."
                     )
             else:
-                effective_relationship = HeirRelation.OTHER
                 if tracer:
                     tracer.add_decision(
                         "EXCLUDED", 
@@ -118,24 +150,10 @@ class FiscalCalculator:
                     )
 
         # 1. Apply Allowances
-        relation_map = {
-            'CHILD': 'CHILD',
-            'GRANDCHILD': 'CHILD',
-            'GREAT_GRANDCHILD': 'CHILD',
-            'PARENT': 'CHILD',
-            'SIBLING': 'SIBLING',
-            'SPOUSE': 'SPOUSE',
-            'PARTNER': 'SPOUSE',
-            'NEPHEW_NIECE': 'NEPHEW_NIECE',
-            'AUNT_UNCLE': 'RELATIVES_UP_TO_4TH_DEGREE',
-            'COUSIN': 'RELATIVES_UP_TO_4TH_DEGREE',
-            'GREAT_UNCLE_AUNT': 'RELATIVES_UP_TO_4TH_DEGREE',
-        }
         rel_key = str(effective_relationship.value) if hasattr(effective_relationship, 'value') else str(effective_relationship)
-        db_relation = relation_map.get(rel_key, 'OTHER')
+        db_relation = RELATION_TO_TAX_CATEGORY.get(rel_key, 'OTHER')
         
-        allowance_obj = Allowance.objects.filter(legislation=legislation, relationship=db_relation).first()
-        base_allowance = float(allowance_obj.amount) if allowance_obj else 0.0
+        base_allowance = legislation.get_allowance(db_relation)
         
         # Apply disability allowance (Art. 779 II CGI)
         disability_bonus = DISABILITY_ALLOWANCE if is_disabled else 0.0
@@ -191,19 +209,31 @@ class FiscalCalculator:
             )
             return 0.0, details
 
+        if not apply_scale:
+            details = TaxCalculationDetail(
+                relationship=relationship.value,
+                gross_amount=taxable_amount,
+                allowance_name=allowance_name,
+                allowance_amount=total_allowance,
+                net_taxable=net_taxable,
+                brackets_applied=[],
+                total_tax=0.0
+            )
+            return 0.0, details
+
         # 2. Apply Tax Scale
         tax = 0.0
         brackets_details = []
-        brackets = TaxBracket.objects.filter(legislation=legislation, relationship=db_relation).order_by('min_amount')
+        brackets = legislation.get_brackets(db_relation)
         
-        if not brackets.exists():
+        if not brackets:
             if tracer: tracer.add_decision("WARNING", f"Aucun barème trouvé pour {db_relation}!")
             # Logic here falls through to return 0 tax
         
         for bracket in brackets:
-            limit = float(bracket.max_amount) if bracket.max_amount else float('inf')
-            rate = float(bracket.rate)
-            min_amt = float(bracket.min_amount)
+            limit = bracket.max_amount if bracket.max_amount is not None else float('inf')
+            rate = bracket.rate
+            min_amt = bracket.min_amount
             
             if net_taxable > min_amt:
                 upper_bound = min(net_taxable, limit)
@@ -0,0 +1,142 @@
+"""
+Vectorized inheritance tax - Tax scale applied to many net taxable bases at once.
+
+Sensitivity sweeps evaluate the same tax scale (Art. 777 CGI) on thousands
+of net taxable amounts. Instead of one FiscalCalculator.calculate_inheritance_tax
+call per amount, the bracket rows of a category are compiled once into
+cumulative tables:
+
+- mins / maxs / rates: bracket bounds and rates (max = +inf for the last one)
+- cumulative_tax[k]: tax due on all brackets below k when bracket k is reached
+
+and every base is then taxed in a single NumPy pass:
+
+    k = index of the bracket containing the base (searchsorted on mins)
+    tax = cumulative_tax[k] + (min(base, maxs[k]) - mins[k]) * rates[k]
+
+cumulative_tax is accumulated bracket by bracket in the same order as the
+scalar loop, so the results are identical to calculate_inheritance_tax (not
+only to the cent).
+
+Inputs are NET taxable amounts (after allowances), the relationship is a
+HeirRelation or a fiscal category ('CHILD', 'SIBLING', ...).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from succession_engine.schemas import HeirRelation
+from succession_engine.services.legislation import BracketRow, LegislationSnapshot, get_legislation_snapshot
+from succession_engine.rules.fiscal import RELATION_TO_TAX_CATEGORY
+
+
+@dataclass(frozen=True)
+class BracketTable:
+    """Cumulative tables of one tax scale (see module docstring)."""
+    mins: np.ndarray
+    maxs: np.ndarray
+    rates: np.ndarray
+    cumulative_tax: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return len(self.rates)
+
+
+@dataclass
+class VectorizedTaxResult:
+    """
+    Taxes of many bases for one category.
+
+    - net_taxable: the input bases, shape (n,)
+    - taxes: tax due per base, shape (n,)
+    - taxable_in_bracket / tax_for_bracket: per-bracket breakdown, shape
+      (n, brackets), only when requested (with_breakdown=True)
+    """
+    net_taxable: np.ndarray
+    taxes: np.ndarray
+    table: Optional[BracketTable] = None
+    taxable_in_bracket: Optional[np.ndarray] = None
+    tax_for_bracket: Optional[np.ndarray] = None
+
+
+@lru_cache(maxsize=64)
+def build_bracket_table(brackets: Tuple[BracketRow, ...]) -> BracketTable:
+    """Compile sorted bracket rows into cumulative tables (cached per scale)."""
+    mins = np.array([row.min_amount for row in brackets], dtype=float)
+    maxs = np.array([row.max_amount if row.max_amount is not None else np.inf for row in brackets], dtype=float)
+    rates = np.array([row.rate for row in brackets], dtype=float)
+
+    # Same accumulation order as the scalar loop: ((0 + t0) + t1) + ...
+    cumulative = [0.0]
+    for row_min, row_max, rate in zip(mins[:-1], maxs[:-1], rates[:-1]):
+        cumulative.append(cumulative[-1] + float((row_max - row_min) * rate))
+    cumulative_tax = np.array(cumulative[:len(brackets)], dtype=float)
+
+    for array in (mins, maxs, rates, cumulative_tax):
+        array.setflags(write=False)
+    return BracketTable(mins=mins, maxs=maxs, rates=rates, cumulative_tax=cumulative_tax)
+
+
+def tax_category(relationship: Union[HeirRelation, str]) -> str:
+    """Fiscal category (Allowance / TaxBracket rows) of a relationship."""
+    rel_key = str(relationship.value) if hasattr(relationship, 'value') else str(relationship)
+    if rel_key in RELATION_TO_TAX_CATEGORY.values():
+        return rel_key
+    return RELATION_TO_TAX_CATEGORY.get(rel_key, 'OTHER')
+
+
+def calculate_inheritance_taxes(
+    net_taxable,
+    relationship: Union[HeirRelation, str],
+    legislation: LegislationSnapshot = None,
+    with_breakdown: bool = False
+) -> VectorizedTaxResult:
+    """
+    Apply the tax scale of a relationship to an array of net taxable amounts.
+
+    Args:
+        net_taxable: Net taxable amounts (after allowances), any array-like
+        relationship: HeirRelation or fiscal category
+        legislation: Compiled legislation (default: cached active snapshot)
+        with_breakdown: Also return the per-bracket (n, brackets) matrices
+
+    Returns:
+        VectorizedTaxResult. Spouses/partners (exempt, loi TEPA), categories
+        without brackets and bases <= 0 are not taxed, like the scalar function.
+    """
+    bases = np.asarray(net_taxable, dtype=float)
+    if bases.ndim != 1:
+        bases = bases.reshape(-1)
+
+    if legislation is None:
+        legislation = get_legislation_snapshot()
+
+    exempt = relationship in (HeirRelation.SPOUSE, HeirRelation.PARTNER, 'SPOUSE', 'PARTNER')
+    brackets = legislation.get_brackets(tax_category(relationship)) if legislation is not None else ()
+    if exempt or not brackets:
+        result = VectorizedTaxResult(net_taxable=bases, taxes=np.zeros_like(bases))
+        if with_breakdown:
+            result.taxable_in_bracket = np.zeros((len(bases), 0))
+            result.tax_for_bracket = np.zeros((len(bases), 0))
+        return result
+
+    table = build_bracket_table(brackets)
+
+    # Bracket containing each base: last k with mins[k] < base (-1 = not taxed)
+    index = np.searchsorted(table.mins, bases, side='left') - 1
+    reached = index >= 0
+    k = np.where(reached, index, 0)
+    partial = (np.minimum(bases, table.maxs[k]) - table.mins[k]) * table.rates[k]
+    taxes = np.where(reached, table.cumulative_tax[k] + np.maximum(partial, 0.0), 0.0)
+
+    result = VectorizedTaxResult(net_taxable=bases, taxes=taxes, table=table)
+    if with_breakdown:
+        upper = np.minimum(bases[:, None], table.maxs[None, :])
+        taxable_in_bracket = np.maximum(upper - table.mins[None, :], 0.0)
+        result.taxable_in_bracket = taxable_in_bracket
+        result.tax_for_bracket = taxable_in_bracket * table.rates[None, :]
+    return result
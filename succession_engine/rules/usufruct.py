@@ -2,10 +2,14 @@
 Valorisation de l'usufruit selon le barème fiscal (Art. 669 CGI).
 """
 
-from succession_engine.models import Legislation, UsufructScale
+import math
 from datetime import date
 from typing import Optional, Tuple
-from decimal import Decimal
+
+from succession_engine.constants import DEFAULT_USUFRUCT_SCALE
+from succession_engine.services.legislation import (
+    LegislationSnapshot, DEFAULT_USUFRUCT_RATES, get_legislation_snapshot, lookup_usufruct_rate
+)
 
 
 class UsufructValuator:
@@ -25,46 +29,29 @@ class UsufructValuator:
     """
     
     # Barème par défaut (si pas en DB)
-    DEFAULT_SCALE = [
-        (21, 0.90),   # < 21 ans
-        (31, 0.80),   # 21-30 ans
-        (41, 0.70),   # 31-40 ans
-        (51, 0.60),   # 41-50 ans
-        (61, 0.50),   # 51-60 ans
-        (71, 0.40),   # 61-70 ans
-        (81, 0.30),   # 71-80 ans
-        (91, 0.20),   # 81-90 ans
-        (999, 0.10),  # > 91 ans
-    ]
+    DEFAULT_SCALE = list(DEFAULT_USUFRUCT_SCALE)
     
     @classmethod
-    def get_usufruct_rate(cls, age: int) -> float:
+    def get_usufruct_rate(cls, age: int, legislation: LegislationSnapshot = None) -> float:
         """
         Retourne le taux de l'usufruit selon l'âge de l'usufruitier.
         
+        Lecture O(1) dans la table âge -> taux précalculée du LegislationSnapshot
+        (aucune requête en régime établi). Sans législation active, le barème
+        légal par défaut s'applique.
+        
         Args:
             age: Âge de l'usufruitier
+            legislation: Législation compilée (défaut: snapshot actif en cache)
             
         Returns:
             float: Taux de l'usufruit (0.0 à 1.0)
         """
-        # Try to get from database
-        try:
-            legislation = Legislation.objects.filter(is_active=True).first()
-            if legislation:
-                scale_entries = legislation.usufruct_scales.all().order_by('max_age')
-                for entry in scale_entries:
-                    if age < entry.max_age:
-                        return float(entry.rate)
-        except Exception:
-            pass  # Fallback to default scale
-        
-        # Use default scale
-        for max_age, rate in cls.DEFAULT_SCALE:
-            if age < max_age:
-                return rate
-        
-        return 0.10  # Default for very old
+        if legislation is None:
+            legislation = get_legislation_snapshot()
+        if legislation is None:
+            return lookup_usufruct_rate(DEFAULT_USUFRUCT_RATES, age)
+        return legislation.get_usufruct_rate(age)
     
     @classmethod
     def calculate_temporary_usufruct(cls, total_value: float, duration_years: int) -> Tuple[float, float, float]:
@@ -78,7 +65,6 @@ class UsufructValuator:
         - 5 ans -> 1 tranche -> 23%
         - 11 ans -> 2 tranches -> 46%
         """
-        import math
         num_periods = math.ceil(duration_years / 10)
         usufruct_rate = min(1.0, num_periods * 0.23)
         
@@ -94,7 +80,8 @@ class UsufructValuator:
         usufructuary_birth_date: Optional[date] = None,
         reference_date: Optional[date] = None,
         duration_years: Optional[int] = None,
-        usufruct_type: str = "VIAGER"  # "VIAGER" or "TEMPORAIRE"
+        usufruct_type: str = "VIAGER",  # "VIAGER" or "TEMPORAIRE"
+        legislation: LegislationSnapshot = None
     ) -> Tuple[float, float, float]:
         """
         Calcule la valeur de l'usufruit (viager ou temporaire).
@@ -105,6 +92,7 @@ class UsufructValuator:
             reference_date: Date de référence (défaut: today)
             duration_years: Durée en années (pour temporaire)
             usufruct_type: "VIAGER" ou "TEMPORAIRE"
+            legislation: Législation compilée (défaut: snapshot actif en cache)
             
         Returns:
             Tuple (usufruct_value, bare_ownership_value, usufruct_rate)
@@ -130,13 +118,13 @@ class UsufructValuator:
         if (reference_date.month, reference_date.day) < (usufructuary_birth_date.month, usufructuary_birth_date.day):
             age -= 1
         
-        usufruct_rate = cls.get_usufruct_rate(age)
+        usufruct_rate = cls.get_usufruct_rate(age, legislation)
         usufruct_value = total_value * usufruct_rate
         bare_ownership_value = total_value * (1 - usufruct_rate)
         
         return usufruct_value, bare_ownership_value, usufruct_rate
     
     @classmethod
-    def get_bare_ownership_rate(cls, age: int) -> float:
+    def get_bare_ownership_rate(cls, age: int, legislation: LegislationSnapshot = None) -> float:
         """Retourne le taux de la nue-propriété (Viager)."""
-        return 1.0 - cls.get_usufruct_rate(age)
+        return 1.0 - cls.get_usufruct_rate(age, legislation)
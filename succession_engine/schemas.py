@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List, Optional, Union, Dict
 from datetime import date
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, Field, model_validator, field_validator, model_serializer, SerializationInfo
 
 # --- Enums ---
 
@@ -663,6 +663,15 @@ class CalculationStep(BaseModel):
     # Per-Heir Breakdown (for FISCAL step - Human-First design)
     heir_blocks: List['HeirExplicabilityBlock'] = Field(default_factory=list)
 
+    @model_serializer(mode="wrap")
+    def _serialize_with_explanations(self, handler, info: SerializationInfo):
+        """Enrichissement pendant la sérialisation si context={"explainer": ...} (cf. ExplainerService)"""
+        data = handler(self)
+        explainer = info.context.get("explainer") if info.context else None
+        if explainer is not None:
+            explainer.apply_explanations(data)
+        return data
+
 
 class HeirExplicabilityBlock(BaseModel):
     """
@@ -766,3 +775,165 @@ class SuccessionOutput(BaseModel):
 
     # Alertes Legacy (Liste de strings pour backward compatibility)
     warnings: List[str] = Field(default_factory=list)
+
+
+class DetailLevel(str, Enum):
+    """Niveau de détail de la simulation"""
+    FULL = "full"        # Sortie complète : étapes pédagogiques, alertes, explications
+    SUMMARY = "summary"  # Mode rapide : métriques globales et détail par héritier uniquement
+
+class SuccessionSummaryOutput(BaseModel):
+    """
+    Sortie allégée (DetailLevel.SUMMARY) pour les traitements de masse et
+    l'optimisation : ni tracer, ni alertes, ni clés d'explication.
+    """
+    global_metrics: GlobalMetrics
+    heirs_breakdown: List[HeirBreakdown]
+
+
+# --- Comparaison des options du conjoint (Art. 757 / 1094-1 CC) ---
+
+class SpouseOptionsInput(BaseModel):
+    """Entrée de la comparaison : simulation + options à comparer (défaut : toutes les options ouvertes)"""
+    simulation: SimulationInput
+    options: List[SpouseChoiceType] = Field(default_factory=list)
+
+class SpouseOptionResult(BaseModel):
+    """Résultat complet d'une option du conjoint"""
+    option: SpouseChoiceType
+    total_tax_amount: float
+    total_net_value: float  # Somme des parts nettes de droits
+    result: SuccessionOutput
+
+class HeirOptionComparison(BaseModel):
+    """Part nette et droits d'un héritier pour chaque option (clé = option)"""
+    id: str
+    name: str
+    relationship: HeirRelation
+    net_share_value: Dict[str, float]
+    tax_amount: Dict[str, float]
+    net_share_delta: Dict[str, float]  # Écart vs l'option de référence
+
+class SpouseOptionsComparison(BaseModel):
+    """Comparaison côte à côte des options du conjoint survivant"""
+    reference_option: SpouseChoiceType  # Première option comparée, base des écarts
+    options: List[SpouseOptionResult]
+    heirs_comparison: List[HeirOptionComparison]
+
+
+# --- Balayage de sensibilité (droits en fonction d'une valeur) ---
+
+class SweepTarget(str, Enum):
+    """Champ numérique que l'on fait varier"""
+    ASSET_VALUE = "asset_value"        # Asset.estimated_value
+    DONATION_VALUE = "donation_value"  # Donation.current_estimated_value
+    DEBT_AMOUNT = "debt_amount"        # Debt.amount
+
+class SweepInput(BaseModel):
+    """Entrée du balayage : simulation + champ à faire varier de start à stop (steps points)"""
+    simulation: SimulationInput
+    target: SweepTarget
+    target_id: str  # id de l'actif / de la donation / de la dette
+    start: float = Field(ge=0)
+    stop: float = Field(ge=0)
+    steps: int = Field(default=11, ge=2)
+
+    def values(self) -> List[float]:
+        """Points du balayage, bornes incluses"""
+        step = (self.stop - self.start) / (self.steps - 1)
+        return [self.start + step * i for i in range(self.steps - 1)] + [self.stop]
+
+class HeirSweepSeries(BaseModel):
+    """Droits et part nette d'un héritier pour chaque point du balayage"""
+    id: str
+    name: str
+    relationship: HeirRelation
+    tax_amount: List[float]
+    net_share_value: List[float]
+
+class SweepResult(BaseModel):
+    """Séries du balayage (même ordre que values)"""
+    target: SweepTarget
+    target_id: str
+    values: List[float]
+    total_estate_value: List[float]
+    total_tax_amount: List[float]
+    heirs: List[HeirSweepSeries]
+
+
+# --- Optimisation du plan de donations ---
+
+class DonationPlanInput(BaseModel):
+    """
+    Entrée de l'optimiseur : simulation (patrimoine actuel) + espace de recherche.
+
+    Le décès est supposé dans horizon_years ans ; une donation faite moins de
+    15 ans avant le décès est rappelée (Art. 784 CGI).
+    """
+    simulation: SimulationInput
+    horizon_years: int = Field(default=20, ge=0, le=60)
+    donation_years: List[int] = Field(default_factory=list)  # Années (depuis aujourd'hui) possibles, défaut : tous les 5 ans
+    heir_ids: List[str] = Field(default_factory=list)  # Donataires, défaut : tous les membres hors conjoint/partenaire
+    funding_asset_id: Optional[str] = None  # Actif dont sont prélevées les donations, défaut : le plus gros bien propre
+    amount_step: float = Field(default=10_000.0, gt=0)  # Granularité des montants
+    time_budget_seconds: float = Field(default=2.0, gt=0)
+    max_schedules: int = Field(default=5, ge=1, le=50)
+
+class PlannedDonation(BaseModel):
+    """Donation proposée"""
+    heir_id: str
+    year_offset: int  # Années depuis aujourd'hui
+    donation_date: date
+    amount: float
+    recalled: bool  # Moins de 15 ans avant le décès supposé : abattement rappelé
+    donation_tax: float  # Droits de donation
+
+class DonationSchedule(BaseModel):
+    """Plan de donations évalué"""
+    donations: List[PlannedDonation]
+    donation_tax_amount: float
+    succession_tax_amount: float
+    total_tax_amount: float
+    savings: float  # Économie vs aucune donation
+
+class DonationPlanResult(BaseModel):
+    """Meilleurs plans trouvés (meilleur en premier)"""
+    baseline_tax_amount: float
+    schedules: List[DonationSchedule]
+    evaluations: int
+    elapsed_seconds: float
+    converged: bool  # False si le budget de temps a interrompu la recherche
+
+
+# --- Comparaison de législations (même succession, plusieurs lois de finances) ---
+
+class LegislationComparisonInput(BaseModel):
+    """Entrée de la comparaison : simulation + législations à comparer (la première est la référence)"""
+    simulation: SimulationInput
+    legislation_ids: List[int] = Field(min_length=1)
+
+class LegislationResult(BaseModel):
+    """Résultat de la succession sous une législation"""
+    legislation_id: Optional[int]
+    name: str
+    year: int
+    fingerprint: str
+    total_tax_amount: float
+    total_net_value: float  # Somme des parts nettes de droits
+    result: Union[SuccessionOutput, SuccessionSummaryOutput]
+
+class HeirLegislationComparison(BaseModel):
+    """Droits et part nette d'un héritier pour chaque législation (clé = id de la législation)"""
+    id: str
+    name: str
+    relationship: HeirRelation
+    tax_amount: Dict[str, float]
+    net_share_value: Dict[str, float]
+    tax_delta: Dict[str, float]  # Écart vs la législation de référence
+
+class LegislationComparison(BaseModel):
+    """Comparaison côte à côte d'une succession sous plusieurs législations (tableau d'écarts)"""
+    reference_legislation_id: Optional[int]  # Première législation comparée, base des écarts
+    legislations: List[LegislationResult]
+    total_tax_delta: Dict[str, float]
+    heirs_comparison: List[HeirLegislationComparison]
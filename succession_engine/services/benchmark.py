@@ -0,0 +1,439 @@
+"""
+Benchmark - Latency, memory and query-count measurements of SuccessionCalculator.run.
+
+Cases:
+- every scenario of tests/golden_scenarios.json
+- synthetic large families (spouse, many children, grandchildren by
+  representation, many assets and donations)
+- on demand, large generated estates (services.scenario_generator: thousands
+  of assets, hundreds of donations and heirs, all three families)
+- on demand, micro-benchmarks of single engine stages on a generated
+  1,000-asset estate: the per-asset loops (liquidation, reconstitution), the
+  per-heir loops (devolution and taxation) and the tracer
+
+Per case: p50/p95/mean latency over N timed runs (after warmup), peak
+memory allocated by one run (tracemalloc) and Django queries issued by one
+steady-state run (the legislation snapshot is compiled during warmup).
+Runs bypass the stage cache so every iteration does the full work.
+
+Reports are JSON-serialisable dicts; compare_to_baseline() lists the
+regressions against a stored report (see the benchmark_engine command and
+tests/benchmark). Latency baselines are machine-specific: regenerate them
+with `benchmark_engine --save-baseline` on the machine that runs the check.
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from succession_engine.schemas import SimulationInput, DetailLevel
+
+GOLDEN_SCENARIOS_PATH = Path(__file__).resolve().parent.parent.parent / 'tests' / 'golden_scenarios.json'
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent.parent.parent / 'tests' / 'benchmark' / 'baseline.json'
+
+DEFAULT_ITERATIONS = 50
+DEFAULT_WARMUP = 3
+
+# Relative slowdown (p50, peak memory) tolerated before a regression is reported.
+# p95 is dominated by scheduler noise on shared machines: only checked on
+# demand (include_tail), with twice this margin.
+DEFAULT_THRESHOLD = 0.25
+# Latency differences below this many milliseconds are noise, never regressions
+DEFAULT_MIN_DELTA_MS = 0.05
+
+# Synthetic families: (children, assets, donations per child)
+SYNTHETIC_SIZES = ((10, 20, 1), (40, 100, 2))
+
+# Generated large estates (scale cases): (family, assets, donations, debts, heirs, bequests)
+SCALE_SIZES = (
+    ("descendants", 1000, 100, 100, 50, 50),
+    ("collaterals", 5000, 500, 500, 200, 100),
+    ("descendants", 5000, 500, 500, 200, 100),
+)
+
+# Estate the micro-benchmarks run on (same layout as SCALE_SIZES)
+MICRO_SIZE = ("descendants", 1000, 100, 100, 50, 50)
+MICRO_INSIGHTS = 100
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    simulation_input: SimulationInput
+
+
+@dataclass
+class MicroCase:
+    """One engine stage, run by operation() on inputs prepared once."""
+    name: str
+    operation: Callable[[], Any]
+
+
+@dataclass
+class CaseResult:
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    peak_kb: float
+    queries: int
+
+
+# --- Cases ---
+
+def golden_cases(path: Path = GOLDEN_SCENARIOS_PATH, only: Optional[Sequence[str]] = None) -> List[BenchmarkCase]:
+    """One case per golden scenario (optionally only the given ids)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        scenarios = json.load(f).get('scenarios', [])
+    return [
+        BenchmarkCase(name=f"golden:{scenario['id']}", simulation_input=SimulationInput(**scenario['input']))
+        for scenario in scenarios
+        if not only or scenario['id'] in only
+    ]
+
+
+def synthetic_family_input(children: int, assets: int, donations_per_child: int = 1) -> SimulationInput:
+    """
+    A large family: spouse, `children` children (every fifth one predeceased
+    and represented by two grandchildren), community and personal assets,
+    reportable donations to each living child.
+    """
+    members = [{"id": "conjoint", "birth_date": "1955-06-01", "relationship": "SPOUSE"}]
+    donations = []
+    for index in range(children):
+        child_id = f"enfant_{index}"
+        if index % 5 == 4:
+            for rank in range(2):
+                members.append({
+                    "id": f"petit_enfant_{index}_{rank}", "birth_date": "2005-01-01",
+                    "relationship": "GRANDCHILD", "represented_heir_id": child_id
+                })
+            continue
+        members.append({"id": child_id, "birth_date": f"{1975 + index % 20}-03-15", "relationship": "CHILD"})
+        for rank in range(donations_per_child):
+            donations.append({
+                "id": f"don_{index}_{rank}", "donation_type": "don_manuel",
+                "beneficiary_name": child_id, "beneficiary_heir_id": child_id,
+                "beneficiary_relationship": "CHILD", "donation_date": "2015-01-01",
+                "original_value": 20_000 + 1_000 * rank, "is_declared_to_tax": rank == 0
+            })
+
+    asset_list = [
+        {
+            "id": f"bien_{index}", "estimated_value": 50_000 + 7_500 * index,
+            "ownership_mode": "FULL_OWNERSHIP",
+            "asset_origin": "COMMUNITY_PROPERTY" if index % 2 else "PERSONAL_PROPERTY",
+            "acquisition_date": "2000-01-01"
+        }
+        for index in range(assets)
+    ]
+    return SimulationInput(
+        matrimonial_regime="COMMUNITY_LEGAL",
+        marriage_date=date(1980, 6, 1),
+        assets=asset_list,
+        members=members,
+        donations=donations
+    )
+
+
+def synthetic_cases(sizes: Sequence = SYNTHETIC_SIZES) -> List[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            name=f"synthetic:{children}children_{assets}assets",
+            simulation_input=synthetic_family_input(children, assets, donations)
+        )
+        for children, assets, donations in sizes
+    ]
+
+
+def scale_cases(sizes: Sequence = SCALE_SIZES, seed: int = 0) -> List[BenchmarkCase]:
+    """Large estates from the seeded scenario generator (same seed, same inputs)."""
+    from succession_engine.services.scenario_generator import ScenarioGenerator, GeneratorConfig
+
+    generator = ScenarioGenerator(seed)
+    return [
+        BenchmarkCase(
+            name=f"scale:{family}_{assets}assets_{heirs}heirs",
+            simulation_input=generator.generate(GeneratorConfig(
+                family=family, assets=assets, donations=donations, debts=debts, heirs=heirs, bequests=bequests
+            ))
+        )
+        for family, assets, donations, debts, heirs, bequests in sizes
+    ]
+
+
+def micro_cases(size: Sequence = MICRO_SIZE, seed: int = 0) -> List[MicroCase]:
+    """
+    Single engine stages on one generated estate.
+
+    Isolates the per-asset and per-heir loops that a full run dilutes: a
+    regression there (an import or a lookup moved back into a loop) shows up
+    here first. Devolution and taxation use the active legislation snapshot.
+    """
+    from succession_engine.core.calculator import SuccessionCalculator
+    from succession_engine.core.estate import get_reportable_donations, reconstitute_estate
+    from succession_engine.core.index import SimulationIndex
+    from succession_engine.core.liquidation import MatrimonialLiquidator
+    from succession_engine.core.tracer import BusinessLogicTracer
+
+    _, assets, donations, _, heirs, _ = size
+    simulation_input = scale_cases((size,), seed=seed)[0].simulation_input
+    calculator = SuccessionCalculator(use_stage_cache=False)
+    net_assets = MatrimonialLiquidator().liquidate(simulation_input)
+    reportable_donations, reportable_value = get_reportable_donations(simulation_input.donations)
+    prepared = calculator.prepare_estate(simulation_input, explain=False)
+
+    def liquidate():
+        return MatrimonialLiquidator().liquidate(simulation_input, tracer=BusinessLogicTracer())
+
+    def reconstitute():
+        index = SimulationIndex.build(simulation_input, reportable_donations)
+        return reconstitute_estate(
+            net_assets, reportable_value, simulation_input.debts, simulation_input.assets, index=index
+        )
+
+    def devolve_and_tax():
+        return calculator.complete(simulation_input, prepared.fork(), detail_level=DetailLevel.SUMMARY)
+
+    def trace_insights():
+        tracer = BusinessLogicTracer()
+        tracer.start_step_pedagogical(1, "LIQUIDATION")
+        for rank in range(MICRO_INSIGHTS):
+            tracer.add_insight("WARNING" if rank % 2 else "POSITIVE", f"Insight {rank}")
+        return tracer.get_steps()
+
+    return [
+        MicroCase(name=f"micro:liquidate_{assets}assets", operation=liquidate),
+        MicroCase(name=f"micro:reconstitute_{assets}assets_{donations}donations", operation=reconstitute),
+        MicroCase(name=f"micro:devolve_and_tax_{heirs}heirs", operation=devolve_and_tax),
+        MicroCase(name=f"micro:tracer_{MICRO_INSIGHTS}insights", operation=trace_insights),
+    ]
+
+
+# Cold import of the engine in a fresh interpreter without Django (ms, best of
+# rounds); tests/benchmark checks it against this budget
+ENGINE_MODULE = 'succession_engine.core.calculator'
+COLD_IMPORT_BUDGET_MS = 400.0
+
+_COLD_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"import_ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+# --- Measurements ---
+
+def calibrate(rounds: int = 7) -> float:
+    """
+    Milliseconds taken by a fixed pure-Python workload (best of rounds).
+
+    Shared/virtual machines run at very different speeds from one minute to
+    the next; latencies are compared relative to this reference.
+    """
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        rows = [{"id": index, "value": index * 1.5, "label": str(index)} for index in range(20_000)]
+        sorted(rows, key=lambda row: -row["value"])
+        sum(row["value"] for row in rows if row["id"] % 3)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def measure_cold_import(module: str = ENGINE_MODULE, rounds: int = 3) -> Dict[str, Any]:
+    """
+    Import module in fresh interpreters without DJANGO_SETTINGS_MODULE.
+
+    Returns:
+        {"import_ms": best time, "modules": modules loaded by the import}
+    """
+    env = {name: value for name, value in os.environ.items() if name != 'DJANGO_SETTINGS_MODULE'}
+    best = None
+    for _ in range(rounds):
+        completed = subprocess.run(
+            [sys.executable, '-c', _COLD_IMPORT_SCRIPT.format(module=module)],
+            capture_output=True, text=True, check=True, env=env, cwd=GOLDEN_SCENARIOS_PATH.parent.parent
+        )
+        measure = json.loads(completed.stdout)
+        if best is None or measure["import_ms"] < best["import_ms"]:
+            best = measure
+    best["import_ms"] = round(best["import_ms"], 2)
+    return best
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure_case(
+    case: BenchmarkCase, calculator=None,
+    iterations: int = DEFAULT_ITERATIONS, warmup: int = DEFAULT_WARMUP,
+    detail_level: DetailLevel = DetailLevel.FULL
+) -> CaseResult:
+    """Time calculator.run on one case and count its allocations and queries."""
+    from succession_engine.core.calculator import SuccessionCalculator
+
+    calculator = calculator or SuccessionCalculator(use_stage_cache=False)
+    simulation_input = case.simulation_input
+    return measure_operation(
+        case.name, lambda: calculator.run(simulation_input, detail_level=detail_level),
+        iterations=iterations, warmup=warmup
+    )
+
+
+def measure_micro_case(
+    case: MicroCase, iterations: int = DEFAULT_ITERATIONS, warmup: int = DEFAULT_WARMUP
+) -> CaseResult:
+    return measure_operation(case.name, case.operation, iterations=iterations, warmup=warmup)
+
+
+def measure_operation(
+    name: str, operation: Callable[[], Any],
+    iterations: int = DEFAULT_ITERATIONS, warmup: int = DEFAULT_WARMUP
+) -> CaseResult:
+    """Time operation() and count the allocations and queries of one call."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for _ in range(warmup):
+        operation()
+
+    with CaptureQueriesContext(connection) as captured:
+        operation()
+
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Collector pauses would land on random iterations: collect once, then time without it
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            operation()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    timings.sort()
+
+    return CaseResult(
+        name=name,
+        iterations=iterations,
+        p50_ms=round(_percentile(timings, 0.50), 4),
+        p95_ms=round(_percentile(timings, 0.95), 4),
+        mean_ms=round(statistics.fmean(timings), 4),
+        peak_kb=round(peak / 1024, 1),
+        queries=len(captured.captured_queries)
+    )
+
+
+def run_benchmark(
+    cases: Sequence[BenchmarkCase],
+    iterations: int = DEFAULT_ITERATIONS, warmup: int = DEFAULT_WARMUP,
+    detail_level: DetailLevel = DetailLevel.FULL,
+    micro: Sequence[MicroCase] = ()
+) -> Dict[str, Any]:
+    """Measure every case (then every micro case) and return a JSON-serialisable report."""
+    calibration_before = calibrate()
+    results = {
+        case.name: asdict(measure_case(case, iterations=iterations, warmup=warmup, detail_level=detail_level))
+        for case in cases
+    }
+    for case in micro:
+        results[case.name] = asdict(measure_micro_case(case, iterations=iterations, warmup=warmup))
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": iterations,
+            "warmup": warmup,
+            "detail_level": detail_level.value,
+            "calibration_ms": round(min(calibration_before, calibrate()), 4),
+            "cold_import_ms": measure_cold_import()["import_ms"],
+        },
+        "cases": results,
+    }
+
+
+# --- Baselines ---
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """Stored report, or None if there is none yet."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(report: Dict[str, Any], path: Path = DEFAULT_BASELINE_PATH) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD, min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+    include_tail: bool = False
+) -> List[str]:
+    """
+    Regressions of report against baseline (cases missing from either side are ignored).
+
+    Latencies are rescaled by the calibration ratio of the two reports, so a
+    slower machine state is not reported as a regression.
+
+    - p50 slower by more than threshold (and by more than min_delta_ms),
+      p95 by more than twice threshold if include_tail
+    - peak memory larger by more than threshold
+    - any additional database query
+    """
+    regressions = []
+    current_calibration = report.get("meta", {}).get("calibration_ms")
+    reference_calibration = baseline.get("meta", {}).get("calibration_ms")
+    scale = reference_calibration / current_calibration if current_calibration and reference_calibration else 1.0
+
+    for name, current in report.get("cases", {}).items():
+        reference = baseline.get("cases", {}).get(name)
+        if reference is None:
+            continue
+        checks = [("p50_ms", threshold)] + ([("p95_ms", threshold * 2)] if include_tail else [])
+        for metric, margin in checks:
+            value = current[metric] * scale
+            if value > reference[metric] * (1 + margin) and value - reference[metric] > min_delta_ms:
+                regressions.append(
+                    f"{name}: {metric} {reference[metric]:.3f} -> {value:.3f} ms "
+                    f"(+{(value / reference[metric] - 1) * 100:.0f}%, calibrated)"
+                )
+        if reference["peak_kb"] > 0 and current["peak_kb"] > reference["peak_kb"] * (1 + threshold):
+            regressions.append(f"{name}: peak memory {reference['peak_kb']:.1f} -> {current['peak_kb']:.1f} KB")
+        if current["queries"] > reference["queries"]:
+            regressions.append(f"{name}: queries {reference['queries']} -> {current['queries']}")
+    return regressions
@@ -87,9 +87,18 @@ class ExplainerService:
         }
         """
         enriched = step.copy()
-        
+        self.apply_explanations(enriched)
+        return enriched
+    
+    def apply_explanations(self, enriched: Dict[str, Any]) -> None:
+        """
+        In-place version of enrich_step: adds what/why/legal_basis/applied_rules/
+        excluded_rules and drops rule_ids/excluded_rule_ids. Also called by the
+        CalculationStep serializer when the output is dumped with
+        context={"explainer": explainer} (enrichment during serialisation).
+        """
         # Extract and enrich applied rules
-        rule_ids = step.get("rule_ids", [])
+        rule_ids = enriched.get("rule_ids", [])
         applied_rules = []
         
         # Aggregate what/why/legal_basis from all applied rules
@@ -121,7 +130,7 @@ class ExplainerService:
         enriched["applied_rules"] = applied_rules
         
         # Enrich excluded rules
-        excluded_rule_data = step.get("excluded_rule_ids", [])
+        excluded_rule_data = enriched.get("excluded_rule_ids", [])
         excluded_rules = []
         
         for excl in excluded_rule_data:
@@ -142,8 +151,6 @@ class ExplainerService:
         # Clean up intermediate fields
         enriched.pop("rule_ids", None)
         enriched.pop("excluded_rule_ids", None)
-        
-        return enriched
     
     def enrich_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,276 @@
+"""
+Simulation Jobs - Database-backed queue for long simulations (batch, donation plan).
+
+Batch and optimisation runs can take minutes and do not fit an HTTP request:
+the API stores a SimulationJob and answers 202 with its id, the
+simulation_worker command runs it and the client polls the job for its
+progress, then its result.
+
+- The SimulationJob table is the queue, no broker: a worker claims the
+  oldest queued job with SELECT ... FOR UPDATE SKIP LOCKED (PostgreSQL), so
+  concurrent workers neither wait on nor take the same row. SQLite has no
+  row locks (select_for_update is ignored there): the claim itself is a
+  conditional UPDATE ... WHERE status = 'queued', which one worker only wins.
+- Batch inputs run by chunks of SIMULATION_JOB_CHUNK_SIZE on one warm
+  SimulationExecutor. The outcomes of each chunk are saved as a
+  SimulationJobChunk row together with the progress (and a heartbeat): the
+  worker never holds more than one chunk of results, the job row only gets
+  the counts, and a job taken back from a dead worker resumes after its last
+  saved chunk (from scratch if the legislation changed meanwhile). The
+  result endpoint streams the chunks back as the body of
+  /api/v1/simulate/batch/ (stream_batch_result).
+- A running job without heartbeat for SIMULATION_JOB_STALE_SECONDS (worker
+  killed) is queued again, and failed after SIMULATION_JOB_MAX_ATTEMPTS runs.
+"""
+
+import json
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from pydantic import ValidationError
+from pydantic_core import to_jsonable_python
+
+from succession_engine.core.executor import SimulationExecutor
+from succession_engine.core.optimizer import DonationOptimizer
+from succession_engine.models import Legislation, SimulationJob, SimulationJobChunk
+from succession_engine.schemas import SimulationInput, DetailLevel, DonationPlanInput
+from succession_engine.services.legislation import get_legislation_snapshot, get_legislation_snapshot_by_id
+
+JOB_BATCH = "batch"
+JOB_DONATION_PLAN = "donation_plan"
+JOB_KINDS = (JOB_BATCH, JOB_DONATION_PLAN)
+
+DEFAULT_JOB_CHUNK_SIZE = 50
+DEFAULT_JOB_MAX_INPUTS = 10_000
+DEFAULT_JOB_OPTIMIZER_MAX_SECONDS = 300.0
+DEFAULT_JOB_STALE_SECONDS = 900.0
+DEFAULT_JOB_MAX_ATTEMPTS = 3
+
+
+class JobLost(Exception):
+    """The job was taken back from this worker (queued again as stale) while it ran."""
+
+
+def batch_items(payload) -> list:
+    """
+    Inputs of a batch body: a JSON array or {"inputs": [...]}.
+
+    Raises:
+        ValueError: neither form
+    """
+    items = payload.get("inputs") if isinstance(payload, dict) else payload
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array of simulation inputs (or {\"inputs\": [...]}).")
+    return items
+
+
+def validate_batch_item(item) -> Tuple[Optional[SimulationInput], Optional[Dict[str, Any]]]:
+    """Return (SimulationInput, None) or (None, error_dict) for one batch item."""
+    try:
+        return SimulationInput(**item), None
+    except ValidationError as e:
+        return None, {"errors": e.errors(include_url=False, include_context=False)}
+    except Exception as e:
+        return None, {"error": str(e)}
+
+
+def submit_job(
+    kind: str, payload, detail_level: DetailLevel = DetailLevel.FULL, legislation_id: Optional[int] = None
+) -> SimulationJob:
+    """
+    Queue a job; batch items are validated by the worker (per-item errors, as the batch endpoint).
+
+    Raises:
+        ValueError: unknown kind or legislation, malformed or too large payload
+            (pydantic ValidationError for an invalid donation plan)
+    """
+    if kind == JOB_BATCH:
+        items = batch_items(payload)
+        max_inputs = getattr(settings, 'SIMULATION_JOB_MAX_INPUTS', DEFAULT_JOB_MAX_INPUTS)
+        if len(items) > max_inputs:
+            raise ValueError(f"Batch too large: {len(items)} inputs (max {max_inputs}).")
+        total = len(items)
+    elif kind == JOB_DONATION_PLAN:
+        if not isinstance(payload, dict):
+            raise ValueError("Expected a donation plan JSON object.")
+        DonationPlanInput(**payload)
+        total = 1
+    else:
+        raise ValueError(f"Unknown job kind {kind!r}, expected one of {JOB_KINDS}")
+
+    if legislation_id is not None and not Legislation.objects.filter(pk=legislation_id).exists():
+        raise ValueError(f"Législation introuvable : {legislation_id}")
+
+    return SimulationJob.objects.create(
+        kind=kind, input_data=payload, detail_level=detail_level.value,
+        legislation_id=legislation_id, progress_total=total
+    )
+
+
+def stream_batch_result(job: SimulationJob) -> Iterator[bytes]:
+    """
+    JSON body of a finished batch job ({"count", "succeeded", "failed", "results"}),
+    written chunk by chunk from its SimulationJobChunk rows.
+    """
+    summary = json.dumps(job.result, separators=(",", ":")).encode("utf-8")
+    yield summary[:-1] + b',"results":['
+    separator = b''
+    chunks = job.chunks.order_by('start').values_list('results', flat=True)
+    for results in chunks.iterator(chunk_size=20):
+        if results:
+            yield separator + json.dumps(results, ensure_ascii=False, separators=(",", ":")).encode("utf-8")[1:-1]
+            separator = b','
+    yield b']}'
+
+
+def claim_next_job(worker: str) -> Optional[SimulationJob]:
+    """Mark the oldest queued job as running for this worker and return it (None: queue empty)."""
+    while True:
+        with transaction.atomic():
+            candidate = (
+                SimulationJob.objects.select_for_update(skip_locked=True)
+                .filter(status='queued').order_by('created_at').only('pk').first()
+            )
+            if candidate is None:
+                return None
+            now = timezone.now()
+            claimed = SimulationJob.objects.filter(pk=candidate.pk, status='queued').update(
+                status='running', worker=worker, started_at=now, heartbeat_at=now,
+                progress_done=0, attempts=F('attempts') + 1
+            )
+        if claimed:
+            return SimulationJob.objects.get(pk=candidate.pk)
+        # Taken by another worker between the read and the update (SQLite): next one
+
+
+def requeue_stale_jobs(stale_seconds: float, max_attempts: int) -> Tuple[int, int]:
+    """
+    Take back the running jobs whose worker stopped reporting.
+
+    Returns:
+        (queued again, failed after max_attempts runs)
+    """
+    now = timezone.now()
+    stale = SimulationJob.objects.filter(status='running', heartbeat_at__lt=now - timedelta(seconds=stale_seconds))
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status='failed', error=f"Worker perdu, abandon après {max_attempts} tentative(s)", finished_at=now
+    )
+    requeued = stale.update(status='queued', worker='', heartbeat_at=None)
+    return requeued, failed
+
+
+class SimulationWorker:
+    """
+    Usage (see the simulation_worker command):
+        worker = SimulationWorker(chunk_size=100)
+        while worker.run_next():
+            pass
+    """
+
+    def __init__(self, name: Optional[str] = None, chunk_size: Optional[int] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Args:
+            name: Worker name stored on its jobs (default: host:pid)
+            chunk_size: Batch inputs computed between two progress reports (default: SIMULATION_JOB_CHUNK_SIZE)
+            max_workers: SimulationExecutor processes of a batch (default: SIMULATION_EXECUTOR_WORKERS)
+        """
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.chunk_size = max(1, chunk_size or getattr(settings, 'SIMULATION_JOB_CHUNK_SIZE', DEFAULT_JOB_CHUNK_SIZE))
+        self.max_workers = max_workers
+
+    def run_next(self) -> Optional[SimulationJob]:
+        """Claim and run the next queued job, None when the queue is empty."""
+        job = claim_next_job(self.name)
+        if job is not None:
+            self.run(job)
+        return job
+
+    def run(self, job: SimulationJob) -> None:
+        """Run a claimed job and store its result or error on it."""
+        try:
+            if job.kind == JOB_BATCH:
+                result = self._run_batch(job)
+            elif job.kind == JOB_DONATION_PLAN:
+                result = self._run_donation_plan(job)
+            else:
+                raise ValueError(f"Unknown job kind {job.kind!r}")
+        except JobLost:
+            return
+        except Exception as e:
+            self._finish(job, status='failed', error=str(e))
+        else:
+            self._finish(job, status='done', result=result)
+
+    def _mine(self, job: SimulationJob):
+        return SimulationJob.objects.filter(pk=job.pk, status='running', worker=self.name)
+
+    def _report_progress(self, job: SimulationJob, done: int, **fields) -> None:
+        """
+        Raises:
+            JobLost: the job is no longer running for this worker
+        """
+        if not self._mine(job).update(progress_done=done, heartbeat_at=timezone.now(), **fields):
+            raise JobLost(f"Job {job.pk} repris à {self.name}")
+        job.progress_done = done
+
+    def _finish(self, job: SimulationJob, status: str, result=None, error: str = '') -> None:
+        job.status, job.result, job.error, job.finished_at = status, result, error, timezone.now()
+        self._mine(job).update(status=status, result=result, error=error, finished_at=job.finished_at)
+
+    def _get_legislation(self, job: SimulationJob):
+        if job.legislation_id is None:
+            return get_legislation_snapshot()
+        return get_legislation_snapshot_by_id(job.legislation_id)
+
+    def _run_batch(self, job: SimulationJob) -> Dict[str, Any]:
+        """Run the batch chunk by chunk (resuming after the saved chunks); returns the counts only."""
+        items = batch_items(job.input_data)
+        legislation = self._get_legislation(job)
+        fingerprint = legislation.fingerprint if legislation else ''
+        if job.legislation_fingerprint != fingerprint:
+            # Chunks of a previous attempt were computed under another legislation
+            job.chunks.all().delete()
+        saved = job.chunks.aggregate(done=Sum('size'), succeeded=Sum('succeeded'))
+        done, succeeded = saved['done'] or 0, saved['succeeded'] or 0
+        self._report_progress(job, done, legislation_fingerprint=fingerprint)
+
+        executor = SimulationExecutor(
+            max_workers=self.max_workers, legislation=legislation, detail_level=DetailLevel(job.detail_level)
+        )
+        with executor:
+            for start in range(done, len(items), self.chunk_size):
+                parsed = [validate_batch_item(item) for item in items[start:start + self.chunk_size]]
+                valid_offsets = [offset for offset, (simulation_input, _) in enumerate(parsed) if simulation_input is not None]
+                outcomes = dict(zip(valid_offsets, executor.map([parsed[offset][0] for offset in valid_offsets])))
+                results = []
+                for offset, (_, error) in enumerate(parsed):
+                    outcome = outcomes[offset] if error is None else {"status": "error", **error}
+                    results.append(to_jsonable_python({"index": start + offset, **outcome}))
+                chunk_succeeded = sum(1 for r in results if r["status"] == "ok")
+                with transaction.atomic():
+                    self._report_progress(job, start + len(results))
+                    SimulationJobChunk.objects.create(
+                        job=job, start=start, size=len(results), succeeded=chunk_succeeded, results=results
+                    )
+                succeeded += chunk_succeeded
+
+        return {"count": len(items), "succeeded": succeeded, "failed": len(items) - succeeded}
+
+    def _run_donation_plan(self, job: SimulationJob) -> Dict[str, Any]:
+        plan_input = DonationPlanInput(**job.input_data)
+        max_seconds = getattr(settings, 'SIMULATION_JOB_OPTIMIZER_MAX_SECONDS', DEFAULT_JOB_OPTIMIZER_MAX_SECONDS)
+        if plan_input.time_budget_seconds > max_seconds:
+            plan_input = plan_input.model_copy(update={"time_budget_seconds": max_seconds})
+
+        legislation = self._get_legislation(job)
+        self._report_progress(job, 0, legislation_fingerprint=legislation.fingerprint if legislation else '')
+        result = DonationOptimizer(plan_input, legislation=legislation).optimize()
+        self._report_progress(job, 1)
+        return result.model_dump(mode="json")
@@ -0,0 +1,50 @@
+"""
+JSON Output - Simulation results serialised once to JSON bytes.
+
+The former response path walked the output three times: model_dump(),
+ExplainerService.enrich_output() (dict copies) and the DRF JSONRenderer.
+Here the explanations are added by the CalculationStep serializer
+(context={"explainer": explainer}) while pydantic writes the bytes, and the
+view returns them as is.
+
+Encoders (SIMULATION_JSON_ENCODER):
+- "pydantic": model_dump_json (default, no extra dependency)
+- "orjson": model_dump + orjson.dumps (optional orjson package)
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from succession_engine.schemas import DetailLevel
+
+JSON_ENCODERS = ("pydantic", "orjson")
+
+
+def get_json_encoder() -> str:
+    encoder = getattr(settings, 'SIMULATION_JSON_ENCODER', 'pydantic') or 'pydantic'
+    if encoder not in JSON_ENCODERS:
+        raise ImproperlyConfigured(
+            f"SIMULATION_JSON_ENCODER must be one of {', '.join(JSON_ENCODERS)}, got {encoder!r}"
+        )
+    return encoder
+
+
+def dump_result(result, detail_level: DetailLevel = DetailLevel.FULL) -> bytes:
+    """
+    JSON bytes of a SuccessionOutput / SuccessionSummaryOutput (or of a model
+    embedding them), calculation steps enriched with the rule dictionary in full mode.
+    """
+    context = None
+    if detail_level == DetailLevel.FULL:
+        from succession_engine.services.explainer import explainer
+        context = {"explainer": explainer}
+
+    if get_json_encoder() == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            raise ImproperlyConfigured("SIMULATION_JSON_ENCODER='orjson' requires the orjson package")
+        return orjson.dumps(result.model_dump(context=context))
+
+    # Same as model_dump_json, but bytes straight from pydantic-core (no str round trip)
+    return result.__pydantic_serializer__.to_json(result, context=context)
@@ -0,0 +1,273 @@
+"""
+LegislationSnapshot - Compiled, in-process copy of the active fiscal legislation.
+
+The fiscal rules (allowances, tax brackets, usufruct scale) change at most a
+few times a year, but they used to be fetched from the database for every heir
+of every simulation. This module compiles them once per process into an
+immutable snapshot that the calculators read without any ORM access.
+
+Any legislation, active or not, can be compiled by id
+(get_legislation_snapshot_by_id) and passed explicitly to the calculators:
+comparing laws never requires flipping the active flag.
+
+Snapshots are loaded through the installed EngineProvider (see
+services.provider): this module never imports Django itself.
+
+Invalidation:
+- post_save / post_delete signals on Legislation, TaxBracket, Allowance and
+  UsufructScale (see succession_engine.signals) drop the cached snapshots.
+- LEGISLATION_SNAPSHOT_TTL (seconds, optional setting) bounds staleness for
+  other worker processes that did not receive the signal.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+from succession_engine.constants import DEFAULT_USUFRUCT_SCALE, MAX_USUFRUCT_AGE
+from succession_engine.services.provider import get_engine_provider
+
+
+@dataclass(frozen=True)
+class BracketRow:
+    """One compiled tax bracket (Art. 777 CGI). max_amount None means infinity."""
+    min_amount: float
+    max_amount: Optional[float]
+    rate: float
+
+
+def build_usufruct_rate_table(scale: Sequence[Tuple[int, float]] = ()) -> Tuple[float, ...]:
+    """
+    Precompute the usufruct rate for every age from 0 to MAX_USUFRUCT_AGE.
+
+    The legislation scale is read first; ages it does not cover fall back to
+    the statutory scale (Art. 669 I CGI), then to 10%.
+    """
+    def rate_for(age: int) -> float:
+        for max_age, rate in scale:
+            if age < max_age:
+                return rate
+        for max_age, rate in DEFAULT_USUFRUCT_SCALE:
+            if age < max_age:
+                return rate
+        return 0.10
+
+    return tuple(rate_for(age) for age in range(MAX_USUFRUCT_AGE + 1))
+
+
+DEFAULT_USUFRUCT_RATES = build_usufruct_rate_table()
+
+
+def lookup_usufruct_rate(rates: Tuple[float, ...], age: int) -> float:
+    """O(1) lookup in a precomputed table, ages clamped to [0, MAX_USUFRUCT_AGE]."""
+    return rates[min(max(age, 0), MAX_USUFRUCT_AGE)]
+
+
+@dataclass(frozen=True)
+class LegislationSnapshot:
+    """
+    Immutable compiled legislation.
+
+    - allowances: {db_relation: amount} (Art. 779 CGI)
+    - brackets: {db_relation: (BracketRow, ...)} sorted by min_amount (Art. 777 CGI)
+    - usufruct_scale: ((max_age, rate), ...) sorted by max_age (Art. 669 CGI)
+    - usufruct_rates: age -> rate table (0..MAX_USUFRUCT_AGE), derived from usufruct_scale
+    - fingerprint: content hash, changes whenever any rule changes (cache keys)
+    """
+    legislation_id: Optional[int]
+    name: str
+    year: int
+    allowances: Dict[str, float] = field(default_factory=dict)
+    brackets: Dict[str, Tuple[BracketRow, ...]] = field(default_factory=dict)
+    usufruct_scale: Tuple[Tuple[int, float], ...] = ()
+    usufruct_rates: Tuple[float, ...] = field(default=(), repr=False)
+    fingerprint: str = field(default='', repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.usufruct_rates:
+            object.__setattr__(self, 'usufruct_rates', build_usufruct_rate_table(self.usufruct_scale))
+        if not self.fingerprint:
+            object.__setattr__(self, 'fingerprint', self._compute_fingerprint())
+
+    def _compute_fingerprint(self) -> str:
+        content = json.dumps([
+            self.legislation_id, self.name, self.year,
+            sorted(self.allowances.items()),
+            sorted((rel, [(r.min_amount, r.max_amount, r.rate) for r in rows]) for rel, rows in self.brackets.items()),
+            list(self.usufruct_scale),
+        ], separators=(',', ':'))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+    def get_allowance(self, db_relation: str) -> float:
+        """Return the base allowance for a fiscal category (0 if none defined)."""
+        return self.allowances.get(db_relation, 0.0)
+
+    def get_brackets(self, db_relation: str) -> Tuple[BracketRow, ...]:
+        """Return the sorted bracket rows for a fiscal category."""
+        return self.brackets.get(db_relation, ())
+
+    def get_usufruct_rate(self, age: int) -> float:
+        """Return the usufruct rate for an age (Art. 669 CGI), no I/O."""
+        return lookup_usufruct_rate(self.usufruct_rates, age)
+
+
+def build_snapshot_from_db(legislation=None) -> Optional[LegislationSnapshot]:
+    """
+    Compile a snapshot from the database.
+
+    Args:
+        legislation: Legislation instance to compile (default: the active one)
+
+    Returns:
+        LegislationSnapshot, or None if no active legislation exists
+    """
+    from succession_engine.models import Legislation, Allowance, TaxBracket, UsufructScale
+
+    if legislation is None:
+        legislation = Legislation.objects.filter(is_active=True).first()
+        if legislation is None:
+            return None
+
+    allowances = {}
+    for relationship, amount in (
+        Allowance.objects.filter(legislation=legislation)
+        .order_by('pk').values_list('relationship', 'amount')
+    ):
+        # Same semantic as the former `.filter(...).first()`: first row wins
+        allowances.setdefault(relationship, float(amount))
+
+    brackets = {}
+    for relationship, min_amount, max_amount, rate in (
+        TaxBracket.objects.filter(legislation=legislation)
+        .order_by('min_amount', 'pk').values_list('relationship', 'min_amount', 'max_amount', 'rate')
+    ):
+        brackets.setdefault(relationship, []).append(BracketRow(
+            min_amount=float(min_amount),
+            max_amount=float(max_amount) if max_amount else None,
+            rate=float(rate),
+        ))
+
+    usufruct_scale = tuple(
+        (max_age, float(rate))
+        for max_age, rate in UsufructScale.objects.filter(legislation=legislation)
+        .order_by('max_age').values_list('max_age', 'rate')
+    )
+
+    return LegislationSnapshot(
+        legislation_id=legislation.pk,
+        name=legislation.name,
+        year=legislation.year,
+        allowances=allowances,
+        brackets={rel: tuple(rows) for rel, rows in brackets.items()},
+        usufruct_scale=usufruct_scale,
+    )
+
+
+def find_legislation(reference: Optional[str] = None):
+    """
+    Legislation from a command-line reference: id or name (latest year first),
+    the active legislation if None.
+
+    Raises:
+        ValueError: no matching (or no active) legislation
+    """
+    from succession_engine.models import Legislation
+
+    if reference is None:
+        legislation = Legislation.objects.filter(is_active=True).first()
+        if legislation is None:
+            raise ValueError('No active legislation, use --legislation')
+        return legislation
+    legislation = None
+    if reference.isdigit():
+        legislation = Legislation.objects.filter(pk=int(reference)).first()
+    if legislation is None:
+        legislation = Legislation.objects.filter(name=reference).order_by('-year', '-pk').first()
+    if legislation is None:
+        raise ValueError(f'Legislation not found: {reference}')
+    return legislation
+
+
+# --- Process-wide cache ---
+
+_lock = threading.Lock()
+# (snapshot, loaded_at), replaced as a whole so a lock-free reader never sees half of it
+_cached: Optional[Tuple[Optional[LegislationSnapshot], float]] = None
+# Explicitly requested legislations (not necessarily active): {legislation_id: (snapshot, loaded_at)}
+_snapshots_by_id: Dict[int, Tuple[LegislationSnapshot, float]] = {}
+# Bumped by invalidate_legislation_snapshot: loads started before it are not stored
+_generation = 0
+
+
+def _snapshot_ttl() -> Optional[float]:
+    return get_engine_provider().setting('LEGISLATION_SNAPSHOT_TTL')
+
+
+def get_legislation_snapshot() -> Optional[LegislationSnapshot]:
+    """
+    Return the compiled active legislation, loading it on first use.
+
+    Steady state: no database query. Returns None if no legislation is active.
+    Loaded by the installed EngineProvider (database, LEGISLATION_ARTIFACT file,
+    or the packaged legislation outside Django).
+    """
+    global _cached
+
+    cached = _cached
+    if cached is not None:
+        snapshot, loaded_at = cached
+        ttl = _snapshot_ttl()
+        if ttl is None or time.monotonic() - loaded_at < ttl:
+            return snapshot
+
+    with _lock:
+        if _cached is not None and _cached is not cached:
+            # Another thread reloaded it while we were waiting
+            return _cached[0]
+        snapshot = get_engine_provider().load_active_legislation()
+        _cached = (snapshot, time.monotonic())
+        return snapshot
+
+
+def get_legislation_snapshot_by_id(legislation_id: int) -> LegislationSnapshot:
+    """
+    Return the compiled legislation with this id, active or not (comparisons,
+    draft finance laws), without touching the active flag.
+
+    Cached per id and invalidated like the active snapshot.
+
+    Raises:
+        ValueError: no legislation with this id
+    """
+    cached = _snapshots_by_id.get(legislation_id)
+    if cached is not None:
+        snapshot, loaded_at = cached
+        ttl = _snapshot_ttl()
+        if ttl is None or time.monotonic() - loaded_at < ttl:
+            return snapshot
+
+    # Loaded outside the lock (may be slow); stored only if no invalidation
+    # happened meanwhile, otherwise a stale draft would be cached for good.
+    generation = _generation
+    snapshot = get_engine_provider().load_legislation(legislation_id)
+    with _lock:
+        if _generation == generation:
+            _snapshots_by_id[legislation_id] = (snapshot, time.monotonic())
+    return snapshot
+
+
+def snapshot_generation() -> int:
+    """Number of invalidations so far: long-lived holders of a snapshot (worker pools) compare it to restart."""
+    return _generation
+
+
+def invalidate_legislation_snapshot(**kwargs) -> None:
+    """Drop the cached snapshots. Usable directly as a signal receiver."""
+    global _cached, _generation
+    with _lock:
+        _generation += 1
+        _cached = None
+        _snapshots_by_id.clear()
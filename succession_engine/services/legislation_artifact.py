@@ -0,0 +1,135 @@
+"""
+Legislation Artifact - Compiled legislation as a versioned file (no database).
+
+A LegislationSnapshot is exported (export_legislation command) to a JSON
+document, gzip-compressed when the path ends with ".gz":
+
+    {
+        "format": "succession-legislation", "version": 1,
+        "legislation": {"id": 1, "name": "Loi de Finances 2024", "year": 2024},
+        "fingerprint": "...",
+        "allowances": {"CHILD": 100000.0, "SPOUSE": null, ...},   # null = unlimited
+        "brackets": {"CHILD": [[min_amount, max_amount, rate], ...], ...},
+        "usufruct_scale": [[max_age, rate], ...],
+        "constants": {...}   # statutory constants of succession_engine.constants
+    }
+
+load_legislation_artifact() rebuilds the snapshot without Django or the ORM,
+so workers, tests and CLI tools start without a database (see the
+LEGISLATION_ARTIFACT setting). Loading checks the format version, the
+fingerprint (content integrity) and that the statutory constants match the
+running engine (an artifact exported by another engine version is rejected).
+"""
+
+import gzip
+import json
+import math
+from typing import Any, Dict
+
+from succession_engine import constants
+from succession_engine.services.legislation import BracketRow, LegislationSnapshot
+
+ARTIFACT_FORMAT = "succession-legislation"
+ARTIFACT_VERSION = 1
+
+
+def engine_constants() -> Dict[str, Any]:
+    """Statutory constants of the running engine (succession_engine.constants), JSON form."""
+    return {name: _jsonable(getattr(constants, name)) for name in sorted(dir(constants)) if name.isupper()}
+
+
+def snapshot_to_artifact(snapshot: LegislationSnapshot) -> Dict[str, Any]:
+    """Artifact document of a compiled legislation."""
+    return {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "legislation": {"id": snapshot.legislation_id, "name": snapshot.name, "year": snapshot.year},
+        "fingerprint": snapshot.fingerprint,
+        "allowances": {
+            relation: None if math.isinf(amount) else amount
+            for relation, amount in sorted(snapshot.allowances.items())
+        },
+        "brackets": {
+            relation: [[row.min_amount, row.max_amount, row.rate] for row in rows]
+            for relation, rows in sorted(snapshot.brackets.items())
+        },
+        "usufruct_scale": [[max_age, rate] for max_age, rate in snapshot.usufruct_scale],
+        "constants": engine_constants(),
+    }
+
+
+def artifact_to_snapshot(artifact: Dict[str, Any], check_constants: bool = True) -> LegislationSnapshot:
+    """
+    Snapshot of an artifact document.
+
+    Raises:
+        ValueError: unknown format/version, altered content (fingerprint) or,
+            with check_constants, constants differing from the running engine
+    """
+    if artifact.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"Not a legislation artifact (format {artifact.get('format')!r})")
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported legislation artifact version {artifact.get('version')!r} (expected {ARTIFACT_VERSION})"
+        )
+    exported, current = artifact.get("constants") or {}, engine_constants()
+    if check_constants and exported != current:
+        differing = sorted(name for name in set(exported) | set(current) if exported.get(name) != current.get(name))
+        raise ValueError(f"Legislation artifact exported with other engine constants: {', '.join(differing)}")
+
+    legislation = artifact["legislation"]
+    snapshot = LegislationSnapshot(
+        legislation_id=legislation["id"],
+        name=legislation["name"],
+        year=legislation["year"],
+        allowances={
+            relation: math.inf if amount is None else float(amount)
+            for relation, amount in artifact["allowances"].items()
+        },
+        brackets={
+            relation: tuple(
+                BracketRow(
+                    min_amount=float(min_amount),
+                    max_amount=None if max_amount is None else float(max_amount),
+                    rate=float(rate),
+                )
+                for min_amount, max_amount, rate in rows
+            )
+            for relation, rows in artifact["brackets"].items()
+        },
+        usufruct_scale=tuple((int(max_age), float(rate)) for max_age, rate in artifact["usufruct_scale"]),
+    )
+    if snapshot.fingerprint != artifact.get("fingerprint"):
+        raise ValueError(
+            f"Legislation artifact fingerprint mismatch ({artifact.get('fingerprint')} != {snapshot.fingerprint})"
+        )
+    return snapshot
+
+
+def dump_legislation_artifact(snapshot: LegislationSnapshot, path) -> None:
+    """Write the artifact of a snapshot (gzip when path ends with .gz)."""
+    content = json.dumps(snapshot_to_artifact(snapshot), ensure_ascii=False, indent=1).encode("utf-8")
+    if str(path).endswith(".gz"):
+        content = gzip.compress(content, mtime=0)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def load_legislation_artifact(path, check_constants: bool = True) -> LegislationSnapshot:
+    """Read an artifact file (plain or gzip JSON) into a snapshot, no database access."""
+    with open(path, "rb") as f:
+        content = f.read()
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+    return artifact_to_snapshot(json.loads(content), check_constants=check_constants)
+
+
+def _jsonable(value):
+    """JSON form of a constant: str keys, lists, inf as null (what a load gives back)."""
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, float) and math.isinf(value):
+        return None
+    return value
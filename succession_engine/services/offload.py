@@ -0,0 +1,160 @@
+"""
+Simulation Offloader - Bounded pool running simulations for the async endpoint.
+
+SuccessionCalculator.run is CPU-bound: on an ASGI server it must not run on
+the event loop, and an unbounded executor queue only turns overload into
+ever-growing latency. The offloader runs each simulation (calculation and
+JSON serialisation) in a pool of SIMULATION_ASYNC_WORKERS threads or
+processes (SIMULATION_ASYNC_BACKEND) and accepts at most
+SIMULATION_ASYNC_MAX_PENDING more simulations waiting for a worker. Beyond
+that, submit() raises SimulationOverloaded at once (HTTP 503 with
+Retry-After) instead of queueing.
+
+A slot is released when the simulation really ends, not when the client
+goes away, so abandoned requests still count until their worker is free.
+
+- "thread" (default): shares the process caches (stage cache, snapshot),
+  keeps the event loop free but runs one simulation at a time on the GIL
+- "process": true parallelism on several cores, workers set up like the
+  SimulationExecutor ones (provider of the parent process)
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.json_output import dump_result
+from succession_engine.services.legislation import LegislationSnapshot
+from succession_engine.services.provider import EngineProvider, get_engine_provider, set_engine_provider
+
+OFFLOAD_BACKENDS = ("thread", "process")
+DEFAULT_MAX_PENDING = 16
+
+
+class SimulationOverloaded(Exception):
+    """Every worker is busy and the waiting queue is full."""
+
+
+def simulate_to_json(
+    simulation_input: SimulationInput, legislation: Optional[LegislationSnapshot], detail_level: DetailLevel
+) -> bytes:
+    """Run one simulation and serialise it (the unit of work sent to the pool)."""
+    result = SuccessionCalculator(legislation=legislation).run(simulation_input, detail_level=detail_level)
+    return dump_result(result, detail_level)
+
+
+def _init_process(provider: EngineProvider) -> None:
+    provider.prepare_worker()
+    set_engine_provider(provider)
+
+
+class SimulationOffloader:
+    """
+    Usage (in an async view):
+        content = await get_simulation_offloader().submit(simulation_input, legislation, detail_level)
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_pending: int = DEFAULT_MAX_PENDING, backend: str = "thread"
+    ):
+        """
+        Args:
+            max_workers: Simulations running at once (default: CPU count)
+            max_pending: Simulations accepted while waiting for a worker
+            backend: "thread" or "process"
+        """
+        if backend not in OFFLOAD_BACKENDS:
+            raise ValueError(f"Unknown offload backend {backend!r}, expected one of {OFFLOAD_BACKENDS}")
+        if max_pending < 0:
+            raise ValueError("max_pending must be positive or zero")
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.backend = backend
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+
+    @property
+    def capacity(self) -> int:
+        """Simulations accepted at once: running plus waiting."""
+        return self.max_workers + self.max_pending
+
+    def _get_pool(self) -> Executor:
+        # Created on first use: after the server forked its workers
+        if self._pool is None:
+            if self.backend == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_init_process, initargs=(get_engine_provider(),)
+                )
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="simulation")
+        return self._pool
+
+    def _release(self, future=None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    async def submit(
+        self, simulation_input: SimulationInput, legislation: Optional[LegislationSnapshot] = None,
+        detail_level: DetailLevel = DetailLevel.FULL
+    ) -> bytes:
+        """
+        Run a simulation in the pool and return its JSON bytes.
+
+        Raises:
+            SimulationOverloaded: capacity reached (nothing was queued)
+        """
+        with self._lock:
+            if self.in_flight >= self.capacity:
+                raise SimulationOverloaded(
+                    f"{self.in_flight} simulation(s) en cours ou en attente (capacité {self.capacity})"
+                )
+            self.in_flight += 1
+            pool = self._get_pool()
+        try:
+            future = pool.submit(simulate_to_json, simulation_input, legislation, detail_level)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+# --- Process-wide offloader ---
+
+_offloader: Optional[SimulationOffloader] = None
+_offloader_lock = threading.Lock()
+
+
+def get_simulation_offloader() -> SimulationOffloader:
+    """The offloader configured by the SIMULATION_ASYNC_* settings, created on first use."""
+    global _offloader
+    if _offloader is None:
+        from django.conf import settings
+        with _offloader_lock:
+            if _offloader is None:
+                _offloader = SimulationOffloader(
+                    max_workers=getattr(settings, 'SIMULATION_ASYNC_WORKERS', None),
+                    max_pending=getattr(settings, 'SIMULATION_ASYNC_MAX_PENDING', DEFAULT_MAX_PENDING),
+                    backend=getattr(settings, 'SIMULATION_ASYNC_BACKEND', 'thread'),
+                )
+    return _offloader
+
+
+def reset_simulation_offloader() -> None:
+    """Stop the pool and forget the offloader (re-read from settings on next use)."""
+    global _offloader
+    with _offloader_lock:
+        offloader, _offloader = _offloader, None
+    if offloader is not None:
+        offloader.shutdown()
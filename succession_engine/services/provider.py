@@ -0,0 +1,153 @@
+"""
+Engine Provider - Data access of the calculation engine (legislation, settings).
+
+The engine (core/, rules/, schemas, services.legislation) never imports
+Django: whatever it needs from the outside goes through the installed
+EngineProvider.
+
+- DjangoProvider: legislation compiled from the database, Django settings.
+  Installed by the succession_engine app (AppConfig.ready), so the API,
+  management commands and tests behave as before.
+- StaticProvider: pure Python, for CLI tools, worker processes and scripts
+  that do not configure Django. Without arguments it serves the legislation
+  packaged in succession_engine/data (exported with export_legislation).
+
+Standalone usage (no django.setup(), no settings, no database):
+
+    from succession_engine.core.calculator import SuccessionCalculator
+    from succession_engine.services.provider import StaticProvider, set_engine_provider
+
+    set_engine_provider(StaticProvider.from_artifact("legislation.json.gz"))   # optional
+    result = SuccessionCalculator().run(simulation_input)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from succession_engine.services.legislation import LegislationSnapshot
+
+# Legislation served by StaticProvider() when none is given
+PACKAGED_LEGISLATION_PATH = Path(__file__).resolve().parent.parent / "data" / "legislation.json"
+
+
+class EngineProvider(ABC):
+    """Interface between the engine and its data sources."""
+
+    @abstractmethod
+    def load_active_legislation(self) -> Optional[LegislationSnapshot]:
+        """The legislation used when none is passed explicitly (None: no active legislation)."""
+
+    @abstractmethod
+    def load_legislation(self, legislation_id: int) -> LegislationSnapshot:
+        """
+        Any legislation, active or not.
+
+        Raises:
+            ValueError: unknown legislation
+        """
+
+    def setting(self, name: str, default: Any = None) -> Any:
+        """Engine setting (SIMULATION_STAGE_CACHE_SIZE, LEGISLATION_SNAPSHOT_TTL, ...)."""
+        return default
+
+    def prepare_worker(self) -> None:
+        """Called once in each SimulationExecutor worker process before any simulation."""
+
+
+class StaticProvider(EngineProvider):
+    """In-memory legislations and settings, no Django."""
+
+    def __init__(
+        self,
+        legislation: Optional[LegislationSnapshot] = None,
+        others: Iterable[LegislationSnapshot] = (),
+        settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            legislation: Active legislation (default: the packaged one)
+            others: Further legislations reachable by id (comparisons)
+            settings: Engine settings, by setting name
+        """
+        if legislation is None:
+            from succession_engine.services.legislation_artifact import load_legislation_artifact
+            legislation = load_legislation_artifact(PACKAGED_LEGISLATION_PATH)
+        self.legislation = legislation
+        self.legislations = {s.legislation_id: s for s in (legislation, *others)}
+        self.settings = dict(settings or {})
+
+    @classmethod
+    def from_artifact(cls, path, **kwargs) -> "StaticProvider":
+        """Provider serving an exported legislation artifact (see services.legislation_artifact)."""
+        from succession_engine.services.legislation_artifact import load_legislation_artifact
+        return cls(load_legislation_artifact(path), **kwargs)
+
+    def load_active_legislation(self) -> Optional[LegislationSnapshot]:
+        return self.legislation
+
+    def load_legislation(self, legislation_id: int) -> LegislationSnapshot:
+        if legislation_id not in self.legislations:
+            raise ValueError(f"Législation introuvable : {legislation_id}")
+        return self.legislations[legislation_id]
+
+    def setting(self, name: str, default: Any = None) -> Any:
+        return self.settings.get(name, default)
+
+
+class DjangoProvider(EngineProvider):
+    """Legislation tables and settings of the Django project."""
+
+    def load_active_legislation(self) -> Optional[LegislationSnapshot]:
+        """The LEGISLATION_ARTIFACT file when configured (no database), else the active legislation."""
+        from succession_engine.services.legislation import build_snapshot_from_db
+
+        path = self.setting('LEGISLATION_ARTIFACT')
+        if path:
+            from succession_engine.services.legislation_artifact import load_legislation_artifact
+            return load_legislation_artifact(path)
+        return build_snapshot_from_db()
+
+    def load_legislation(self, legislation_id: int) -> LegislationSnapshot:
+        from succession_engine.models import Legislation
+        from succession_engine.services.legislation import build_snapshot_from_db
+
+        legislation = Legislation.objects.filter(pk=legislation_id).first()
+        if legislation is None:
+            raise ValueError(f"Législation introuvable : {legislation_id}")
+        return build_snapshot_from_db(legislation)
+
+    def setting(self, name: str, default: Any = None) -> Any:
+        from django.conf import settings
+        value = getattr(settings, name, None)
+        return default if value is None else value
+
+    def prepare_worker(self) -> None:
+        import django
+        from django.apps import apps
+        if not apps.ready:
+            django.setup()
+
+
+# --- Installed provider ---
+
+_provider: Optional[EngineProvider] = None
+
+
+def get_engine_provider() -> EngineProvider:
+    """The installed provider, a StaticProvider() on first use if none was installed."""
+    global _provider
+    if _provider is None:
+        _provider = StaticProvider()
+    return _provider
+
+
+def set_engine_provider(provider: EngineProvider) -> None:
+    """Install the provider of the process and drop the legislation cached from the previous one."""
+    global _provider
+    from succession_engine.services.legislation import invalidate_legislation_snapshot
+    _provider = provider
+    invalidate_legislation_snapshot()
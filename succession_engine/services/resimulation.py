@@ -0,0 +1,265 @@
+"""
+Resimulation - Bulk re-computation of the saved scenarios under one legislation.
+
+Used after a legislation change (new finance law) to measure its tax impact
+across the client book:
+
+- scenarios are read in pk order by batches (.iterator), validated in the
+  parent process and computed in fast mode (DetailLevel.SUMMARY) by a
+  persistent SimulationExecutor pool bound to the chosen legislation;
+- each result is reduced to a compact SimulationResult row (totals and a
+  per-heir summary) written with one bulk_create + one bulk_update per
+  batch, one row per (scenario, legislation);
+- the report compares every total with the latest stored result of the
+  scenario before this run (under any legislation), so a --dry-run under
+  a draft legislation gives the tax delta without writing anything. It
+  counts the changed scenarios but only keeps the largest changes (bounded
+  heap), so its size does not grow with the client book.
+"""
+
+import heapq
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.utils import timezone
+from pydantic import ValidationError
+
+from succession_engine.core.executor import SimulationExecutor
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.legislation import build_snapshot_from_db
+
+DEFAULT_RESIMULATION_BATCH_SIZE = 500
+
+# Largest tax changes kept by the report
+DEFAULT_TOP_CHANGES = 10
+
+# Tax differences below this amount (euros) are rounding, not changes
+TAX_DELTA_TOLERANCE = 0.01
+
+
+@dataclass
+class ScenarioDelta:
+    """Tax change of one scenario against its latest stored result."""
+    scenario_id: int
+    name: str
+    previous_tax: float
+    new_tax: float
+
+    @property
+    def delta(self) -> float:
+        return self.new_tax - self.previous_tax
+
+
+@dataclass
+class ResimulationReport:
+    """Counts, throughput and tax impact of a resimulation run."""
+    legislation: str
+    dry_run: bool
+    scenarios: int = 0
+    errors: int = 0
+    created: int = 0
+    updated: int = 0
+    elapsed_seconds: float = 0.0
+    total_tax: float = 0.0
+    # Totals over the scenarios that already had a stored result
+    compared: int = 0
+    previous_total_tax: float = 0.0
+    compared_total_tax: float = 0.0
+    # Scenarios whose tax changed; only the top_count largest changes are kept
+    changed: int = 0
+    top_count: int = DEFAULT_TOP_CHANGES
+    _top: List[Tuple[float, int, ScenarioDelta]] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """Scenarios per second."""
+        return self.scenarios / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def changes(self) -> List[ScenarioDelta]:
+        """Kept changes, largest first."""
+        return self.top_changes()
+
+    def add_change(self, change: ScenarioDelta) -> None:
+        """Count a change, keep it if it is among the top_count largest (min-heap on abs(delta))."""
+        self.changed += 1
+        if self.top_count <= 0:
+            return
+        entry = (abs(change.delta), change.scenario_id, change)
+        if len(self._top) < self.top_count:
+            heapq.heappush(self._top, entry)
+        else:
+            heapq.heappushpop(self._top, entry)
+
+    def top_changes(self, count: Optional[int] = None) -> List[ScenarioDelta]:
+        """Largest kept changes first (at most top_count)."""
+        largest = sorted(self._top, reverse=True)
+        return [change for _, _, change in largest[:count]]
+
+
+def summarise_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact fields of a SimulationResult from a SUMMARY output (model_dump)."""
+    metrics = result["global_metrics"]
+    return {
+        "total_estate_value": _money(metrics["total_estate_value"]),
+        "total_tax_amount": _money(metrics["total_tax_amount"]),
+        "heirs_summary": [
+            {
+                "id": heir["id"],
+                "relationship": getattr(heir["relationship"], "value", heir["relationship"]),
+                "net_share_value": round(heir["net_share_value"], 2),
+                "tax_amount": round(heir["tax_amount"], 2),
+            }
+            for heir in result["heirs_breakdown"]
+        ],
+    }
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(str(round(value, 2)))
+
+
+class Resimulation:
+    """
+    Re-simulate saved scenarios under one legislation.
+
+    Usage:
+        report = Resimulation(legislation, max_workers=8).run(SimulationScenario.objects.all())
+    """
+
+    def __init__(
+        self,
+        legislation,
+        max_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_RESIMULATION_BATCH_SIZE,
+        dry_run: bool = False,
+        top: int = DEFAULT_TOP_CHANGES
+    ):
+        """
+        Args:
+            legislation: Legislation instance to apply
+            max_workers: Worker processes (default: SIMULATION_EXECUTOR_WORKERS, then CPU count)
+            batch_size: Scenarios read, computed and written at once
+            dry_run: Compute and compare only, write nothing
+            top: Largest tax changes kept by the report
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.legislation = legislation
+        self.snapshot = build_snapshot_from_db(legislation)
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.top = top
+
+    def run(self, scenarios) -> ResimulationReport:
+        """Re-simulate a SimulationScenario queryset, batch by batch."""
+        report = ResimulationReport(legislation=str(self.legislation), dry_run=self.dry_run, top_count=self.top)
+        start = time.perf_counter()
+        with SimulationExecutor(
+            max_workers=self.max_workers, legislation=self.snapshot, detail_level=DetailLevel.SUMMARY
+        ) as executor:
+            batch = []
+            for scenario in scenarios.order_by('pk').only('id', 'name', 'input_data').iterator(chunk_size=self.batch_size):
+                batch.append(scenario)
+                if len(batch) >= self.batch_size:
+                    self._run_batch(executor, batch, report)
+                    batch = []
+            if batch:
+                self._run_batch(executor, batch, report)
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def _run_batch(self, executor: SimulationExecutor, scenarios: List, report: ResimulationReport) -> None:
+        parsed: List[Tuple[Optional[SimulationInput], Optional[str]]] = []
+        for scenario in scenarios:
+            try:
+                parsed.append((SimulationInput.model_validate(scenario.input_data), None))
+            except ValidationError as e:
+                parsed.append((None, str(e)))
+
+        valid = [simulation_input for simulation_input, _ in parsed if simulation_input is not None]
+        outcomes = iter(executor.map(valid))
+
+        computed_at = timezone.now()
+        rows = []
+        for scenario, (simulation_input, error) in zip(scenarios, parsed):
+            outcome = next(outcomes) if simulation_input is not None else {"status": "error", "details": error}
+            rows.append(self._build_row(scenario, outcome, computed_at))
+
+        self._compare(scenarios, rows, report)
+        report.scenarios += len(rows)
+        report.errors += sum(1 for row in rows if row.status == 'error')
+        if not self.dry_run:
+            self._save(rows, report)
+
+    def _build_row(self, scenario, outcome: Dict[str, Any], computed_at):
+        from succession_engine.models import SimulationResult
+
+        row = SimulationResult(
+            scenario=scenario, legislation=self.legislation,
+            legislation_fingerprint=self.snapshot.fingerprint if self.snapshot else '',
+            computed_at=computed_at
+        )
+        if outcome["status"] == "ok":
+            row.status = 'ok'
+            for name, value in summarise_result(outcome["result"]).items():
+                setattr(row, name, value)
+        else:
+            row.status = 'error'
+            row.error = outcome.get("details") or outcome.get("error", "")
+        return row
+
+    def _compare(self, scenarios: List, rows: List, report: ResimulationReport) -> None:
+        """Compare the new totals with the latest stored result of each scenario."""
+        from succession_engine.models import SimulationResult
+
+        previous = {}
+        for scenario_id, total_tax_amount in (
+            SimulationResult.objects.filter(scenario_id__in=[s.pk for s in scenarios], status='ok')
+            .order_by('scenario_id', '-computed_at').values_list('scenario_id', 'total_tax_amount')
+        ):
+            previous.setdefault(scenario_id, float(total_tax_amount))
+
+        for scenario, row in zip(scenarios, rows):
+            if row.status != 'ok':
+                continue
+            new_tax = float(row.total_tax_amount)
+            report.total_tax += new_tax
+            if scenario.pk not in previous:
+                continue
+            report.compared += 1
+            report.previous_total_tax += previous[scenario.pk]
+            report.compared_total_tax += new_tax
+            if abs(new_tax - previous[scenario.pk]) > TAX_DELTA_TOLERANCE:
+                report.add_change(ScenarioDelta(scenario.pk, scenario.name, previous[scenario.pk], new_tax))
+
+    def _save(self, rows: List, report: ResimulationReport) -> None:
+        """One bulk_update for the rows already stored for this legislation, one bulk_create for the others."""
+        from succession_engine.models import SimulationResult
+
+        existing = dict(
+            SimulationResult.objects.filter(
+                legislation=self.legislation, scenario_id__in=[row.scenario_id for row in rows]
+            ).values_list('scenario_id', 'pk')
+        )
+        to_update = []
+        to_create = []
+        for row in rows:
+            if row.scenario_id in existing:
+                row.pk = existing[row.scenario_id]
+                to_update.append(row)
+            else:
+                to_create.append(row)
+
+        SimulationResult.objects.bulk_create(to_create, batch_size=self.batch_size)
+        SimulationResult.objects.bulk_update(
+            to_update,
+            ['legislation_fingerprint', 'status', 'total_estate_value', 'total_tax_amount',
+             'heirs_summary', 'error', 'computed_at'],
+            batch_size=self.batch_size
+        )
+        report.created += len(to_create)
+        report.updated += len(to_update)
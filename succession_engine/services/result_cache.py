@@ -0,0 +1,192 @@
+"""
+ResultCache - Response-level cache for simulation results.
+
+Identical payloads (page reloads, golden scenario runs, shared links) are
+served from the cache without running the calculator, building the tracer,
+validating the output or calling ExplainerService.
+
+Key: canonical hash of the validated SimulationInput + fingerprint of the
+compiled legislation + today's date (ages, and thus usufruct rates, depend
+on it). A legislation change produces a new fingerprint, so stale results
+are never served; the in-process backend is also cleared by the legislation
+signals to free memory. Trusted requests are keyed on their raw body
+instead (raw_result_cache_key).
+
+Backends (SIMULATION_RESULT_CACHE_BACKEND):
+- "lru": in-process LRU bounded by SIMULATION_RESULT_CACHE_SIZE entries and
+  SIMULATION_RESULT_CACHE_MAX_BYTES of serialised results (a FULL output of a
+  1,000-asset estate weighs megabytes); a result larger than the whole byte
+  budget is not cached
+- "django": Django cache framework (CACHES alias SIMULATION_RESULT_CACHE_ALIAS,
+  locmem/file/redis...), entries expire after SIMULATION_RESULT_CACHE_TIMEOUT
+- "" / None: disabled
+
+Async views use aget / aset: the in-process LRU answers inline, the Django
+backend goes through the cache's own async API (never blocking the event
+loop on a database or network cache).
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Optional
+
+from succession_engine.core.cache import canonical_hash
+from succession_engine.schemas import DetailLevel
+from succession_engine.services.legislation import LegislationSnapshot
+
+DEFAULT_RESULT_CACHE_SIZE = 512
+DEFAULT_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_RESULT_CACHE_TIMEOUT = 3600
+
+
+def result_cache_key(
+    simulation_input, legislation: Optional[LegislationSnapshot],
+    detail_level: DetailLevel = DetailLevel.FULL
+) -> str:
+    """Cache key of a simulation: input content, legislation version, date and detail level."""
+    return canonical_hash(
+        "result",
+        legislation.fingerprint if legislation is not None else "no-legislation",
+        date.today().isoformat(),
+        detail_level.value,
+        simulation_input.model_dump_json(exclude_defaults=True)
+    )
+
+
+def raw_result_cache_key(
+    body: bytes, legislation: Optional[LegislationSnapshot],
+    detail_level: DetailLevel = DetailLevel.FULL
+) -> str:
+    """
+    Cache key of a trusted request: hash of the raw JSON body (no canonical
+    re-serialisation of the input, which costs as much as the validation on
+    large estates). Trusted callers send the same bytes for the same input.
+    """
+    return canonical_hash(
+        "result-raw",
+        legislation.fingerprint if legislation is not None else "no-legislation",
+        date.today().isoformat(),
+        detail_level.value,
+        body
+    )
+
+
+class LocalResultCache:
+    """In-process LRU backend, bounded by entry count and by total size of the cached bytes."""
+
+    def __init__(self, maxsize: int = DEFAULT_RESULT_CACHE_SIZE, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            content = self._data.get(key)
+            if content is not None:
+                self._data.move_to_end(key)
+            return content
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        return self.get(key)
+
+    async def aset(self, key: str, content: bytes) -> None:
+        self.set(key, content)
+
+    def set(self, key: str, content: bytes) -> None:
+        """Store content, evicting least recently used results beyond maxsize / max_bytes."""
+        size = len(content)
+        if self.maxsize <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self._data[key] = content
+            self.total_bytes += size
+            while len(self._data) > self.maxsize or self.total_bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DjangoResultCache:
+    """Django cache framework backend (shared between workers if the cache is)."""
+
+    key_prefix = "succession:result:"
+
+    def __init__(self, alias: str = "default", timeout: Optional[int] = DEFAULT_RESULT_CACHE_TIMEOUT):
+        from django.core.cache import caches
+        self._cache = caches[alias]
+        self.timeout = timeout
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(self.key_prefix + key)
+
+    def set(self, key: str, content: bytes) -> None:
+        self._cache.set(self.key_prefix + key, content, timeout=self.timeout)
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        return await self._cache.aget(self.key_prefix + key)
+
+    async def aset(self, key: str, content: bytes) -> None:
+        await self._cache.aset(self.key_prefix + key, content, timeout=self.timeout)
+
+    def clear(self) -> None:
+        # Keys embed the legislation fingerprint: stale entries are never hit
+        # and simply expire, the shared cache is not flushed.
+        pass
+
+
+# --- Process-wide instance ---
+
+_result_cache = None
+_configured = False
+_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Return the configured result cache backend, or None when disabled."""
+    global _result_cache, _configured
+    if not _configured:
+        from django.conf import settings
+        with _lock:
+            if not _configured:
+                backend = getattr(settings, 'SIMULATION_RESULT_CACHE_BACKEND', 'lru')
+                if backend == 'lru':
+                    _result_cache = LocalResultCache(
+                        maxsize=getattr(settings, 'SIMULATION_RESULT_CACHE_SIZE', DEFAULT_RESULT_CACHE_SIZE),
+                        max_bytes=getattr(settings, 'SIMULATION_RESULT_CACHE_MAX_BYTES', DEFAULT_RESULT_CACHE_MAX_BYTES)
+                    )
+                elif backend == 'django':
+                    _result_cache = DjangoResultCache(
+                        alias=getattr(settings, 'SIMULATION_RESULT_CACHE_ALIAS', 'default'),
+                        timeout=getattr(settings, 'SIMULATION_RESULT_CACHE_TIMEOUT', DEFAULT_RESULT_CACHE_TIMEOUT)
+                    )
+                elif backend:
+                    raise ValueError(f"Unknown SIMULATION_RESULT_CACHE_BACKEND: {backend!r}")
+                _configured = True
+    return _result_cache
+
+
+def invalidate_result_cache(**kwargs) -> None:
+    """Clear the result cache. Usable directly as a signal receiver."""
+    if _result_cache is not None:
+        _result_cache.clear()
+
+
+def reset_result_cache() -> None:
+    """Forget the configured backend (re-read from settings on next use)."""
+    global _result_cache, _configured
+    with _lock:
+        _result_cache = None
+        _configured = False
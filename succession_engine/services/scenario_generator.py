@@ -0,0 +1,285 @@
+"""
+Scenario generator - Seeded, deterministic large SimulationInputs for scale testing.
+
+Golden and seed scenarios have a handful of assets and members; this module
+builds valid inputs of any size to see how the pipeline scales (asset x
+bequest scans in process_specific_bequests, debt x asset lookups in
+reconstitute_estate, souches in HeirShareCalculator...).
+
+Families:
+- "descendants": spouse (optional), children, representation chains
+  (predeceased children represented by grandchildren, some of them
+  represented in turn by great-grandchildren), adoptions
+- "siblings": parents, siblings and nephews/nieces representing
+  predeceased siblings
+- "collaterals": aunts/uncles and cousins split between the paternal and
+  maternal lines (fente, Art. 746 CC)
+
+Assets mix personal / community / indivision property, life-insurance
+contracts with beneficiary clauses (dismembered when there is a spouse),
+professional exemptions; debts are linked to assets, donations are made
+to heirs and specific bequests target random assets.
+
+The same seed and config always produce the same input (no dependency on
+today's date).
+"""
+
+import random
+from dataclasses import dataclass, asdict, replace
+from typing import Any, Dict, List
+
+from succession_engine.schemas import SimulationInput
+
+FAMILIES = ("descendants", "siblings", "collaterals")
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Sizes and mix of a generated scenario."""
+    assets: int = 20
+    heirs: int = 10  # Members other than the spouse
+    donations: int = 5
+    debts: int = 5
+    bequests: int = 0
+    family: str = "descendants"
+    with_spouse: bool = True  # Descendants only (a spouse excludes siblings and collaterals)
+    life_insurance_ratio: float = 0.05
+    indivision_ratio: float = 0.10
+    representation_ratio: float = 0.20  # Share of children / siblings predeceased and represented
+
+    def __post_init__(self):
+        if self.family not in FAMILIES:
+            raise ValueError(f"Unknown family {self.family!r}, expected one of {FAMILIES}")
+        if self.assets < 1 or self.heirs < 1:
+            raise ValueError("A scenario needs at least one asset and one heir")
+
+
+def _date(rng: random.Random, first_year: int, last_year: int) -> str:
+    return f"{rng.randint(first_year, last_year)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+class ScenarioGenerator:
+    """
+    Usage:
+        simulation_input = ScenarioGenerator(seed=42).generate(GeneratorConfig(assets=5000))
+    """
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def generate(self, config: GeneratorConfig = GeneratorConfig()) -> SimulationInput:
+        """Validated SimulationInput."""
+        return SimulationInput(**self.payload(config))
+
+    def payload(self, config: GeneratorConfig = GeneratorConfig()) -> Dict[str, Any]:
+        """JSON-compatible SimulationInput payload (what a client would POST)."""
+        rng = random.Random(f"{self.seed}:{sorted(asdict(config).items())}")
+        with_spouse = config.with_spouse and config.family == "descendants"
+
+        members = self._members(rng, config, with_spouse)
+        heirs = [m for m in members if m["relationship"] != "SPOUSE"]
+        regime = "COMMUNITY_LEGAL" if with_spouse else "SEPARATION"
+        assets = self._assets(rng, config, members, with_spouse)
+        plain_assets = [a for a in assets if "premiums_before_70" not in a]
+
+        payload = {
+            "matrimonial_regime": regime,
+            "assets": assets,
+            "members": members,
+            "donations": self._donations(rng, config, heirs),
+            "debts": self._debts(rng, config, plain_assets, with_spouse),
+            "wishes": {
+                "specific_bequests": [
+                    {
+                        "asset_id": rng.choice(plain_assets)["id"],
+                        "beneficiary_id": rng.choice(heirs)["id"],
+                        "share_percentage": rng.choice([25.0, 50.0, 100.0]),
+                    }
+                    for _ in range(config.bequests)
+                ] if plain_assets else [],
+            },
+        }
+        if with_spouse:
+            payload["marriage_date"] = "1985-06-15"
+            payload["wishes"]["spouse_choice"] = {"choice": rng.choice(["USUFRUCT", "QUARTER_OWNERSHIP"])}
+        return payload
+
+    # --- Members ---
+
+    def _members(self, rng: random.Random, config: GeneratorConfig, with_spouse: bool) -> List[Dict]:
+        members = []
+        if with_spouse:
+            members.append({"id": "conjoint", "birth_date": _date(rng, 1945, 1965), "relationship": "SPOUSE"})
+        if config.family == "descendants":
+            members += self._descendants(rng, config.heirs, config.representation_ratio)
+        elif config.family == "siblings":
+            members += self._siblings(rng, config.heirs, config.representation_ratio)
+        else:
+            members += self._collaterals(rng, config.heirs)
+        return members
+
+    @staticmethod
+    def _descendants(rng: random.Random, count: int, representation_ratio: float) -> List[Dict]:
+        members = []
+        index = 0
+        while len(members) < count:
+            child_id = f"enfant_{index}"
+            index += 1
+            if rng.random() >= representation_ratio or count - len(members) < 2:
+                child = {"id": child_id, "birth_date": _date(rng, 1970, 1995), "relationship": "CHILD"}
+                if rng.random() < 0.05:
+                    child["adoption_type"] = rng.choice(["plénière", "simple"])
+                    child["has_received_continuous_care"] = rng.random() < 0.5
+                members.append(child)
+                continue
+            # Predeceased child: its souche is represented by grandchildren,
+            # some of them represented in turn by great-grandchildren
+            for rank in range(rng.randint(1, 3)):
+                grandchild_id = f"petit_enfant_{index}_{rank}"
+                members.append({
+                    "id": grandchild_id, "birth_date": _date(rng, 1995, 2010),
+                    "relationship": "GRANDCHILD", "represented_heir_id": child_id
+                })
+                if rng.random() < representation_ratio:
+                    members.append({
+                        "id": f"arriere_petit_enfant_{index}_{rank}", "birth_date": _date(rng, 2015, 2022),
+                        "relationship": "GREAT_GRANDCHILD", "represented_heir_id": grandchild_id
+                    })
+        return members[:count]
+
+    @staticmethod
+    def _siblings(rng: random.Random, count: int, representation_ratio: float) -> List[Dict]:
+        members = [
+            {"id": f"parent_{rank}", "birth_date": _date(rng, 1930, 1945), "relationship": "PARENT"}
+            for rank in range(min(2, max(0, count - 1)))
+        ]
+        index = 0
+        while len(members) < count:
+            sibling_id = f"frere_soeur_{index}"
+            index += 1
+            if rng.random() >= representation_ratio or count - len(members) < 2:
+                members.append({"id": sibling_id, "birth_date": _date(rng, 1950, 1970), "relationship": "SIBLING"})
+                continue
+            for rank in range(rng.randint(1, 3)):
+                members.append({
+                    "id": f"neveu_niece_{index}_{rank}", "birth_date": _date(rng, 1975, 2000),
+                    "relationship": "NEPHEW_NIECE", "represented_heir_id": sibling_id
+                })
+        return members[:count]
+
+    @staticmethod
+    def _collaterals(rng: random.Random, count: int) -> List[Dict]:
+        members = []
+        for index in range(count):
+            relationship = "AUNT_UNCLE" if index % 4 == 0 else "COUSIN"
+            members.append({
+                "id": f"{relationship.lower()}_{index}",
+                "birth_date": _date(rng, 1935, 1955) if relationship == "AUNT_UNCLE" else _date(rng, 1955, 1985),
+                "relationship": relationship,
+                "paternal_line": index % 2 == 0
+            })
+        return members
+
+    # --- Patrimony ---
+
+    @staticmethod
+    def _assets(rng: random.Random, config: GeneratorConfig, members: List[Dict], with_spouse: bool) -> List[Dict]:
+        heirs = [m for m in members if m["relationship"] != "SPOUSE"]
+        assets = []
+        for index in range(config.assets):
+            draw = rng.random()
+            value = round(rng.lognormvariate(11.5, 1.0), -2)
+            if draw < config.life_insurance_ratio:
+                asset = {
+                    "id": f"assurance_vie_{index}", "estimated_value": value,
+                    "ownership_mode": "FULL_OWNERSHIP", "asset_origin": "PERSONAL_PROPERTY",
+                    "premiums_before_70": round(value * rng.uniform(0.3, 1.0), -2),
+                    "premiums_after_70": round(value * rng.uniform(0.0, 0.3), -2),
+                    "subscriber_type": "DECEASED",
+                }
+                if with_spouse and rng.random() < 0.5:
+                    # Clause démembrée : usufruit au conjoint, nue-propriété aux héritiers
+                    bare_owners = rng.sample(heirs, min(len(heirs), rng.randint(1, 3)))
+                    asset["life_insurance_beneficiaries"] = [
+                        {"beneficiary_id": "conjoint", "share_percent": 100.0, "ownership_type": "USUFRUCT"}
+                    ] + [
+                        {
+                            "beneficiary_id": heir["id"], "share_percent": round(100.0 / len(bare_owners), 4),
+                            "ownership_type": "BARE_OWNERSHIP"
+                        }
+                        for heir in bare_owners
+                    ]
+                else:
+                    beneficiaries = rng.sample(heirs, min(len(heirs), rng.randint(1, 3)))
+                    asset["life_insurance_beneficiaries"] = [
+                        {"beneficiary_id": heir["id"], "share_percent": round(100.0 / len(beneficiaries), 4)}
+                        for heir in beneficiaries
+                    ]
+            elif draw < config.life_insurance_ratio + config.indivision_ratio:
+                others_share = rng.choice([25.0, 50.0, 75.0])
+                asset = {
+                    "id": f"indivision_{index}", "estimated_value": value,
+                    "ownership_mode": "INDIVISION", "asset_origin": "INDIVISION",
+                    "indivision_details": {
+                        "withOthers": True, "othersShare": others_share,
+                        "coOwners": [f"coindivisaire_{index}"]
+                    },
+                }
+            else:
+                if with_spouse and rng.random() < 0.5:
+                    origin, acquired = "COMMUNITY_PROPERTY", _date(rng, 1986, 2020)
+                else:
+                    # Biens propres acquis avant le mariage (pas d'alerte date/régime)
+                    origin = rng.choice(["PERSONAL_PROPERTY", "INHERITANCE"])
+                    acquired = _date(rng, 1975, 1984) if with_spouse else _date(rng, 1975, 2020)
+                asset = {
+                    "id": f"bien_{index}", "estimated_value": value,
+                    "ownership_mode": "FULL_OWNERSHIP", "asset_origin": origin,
+                    "acquisition_date": acquired,
+                }
+                if rng.random() < 0.03:
+                    asset["professional_exemption"] = {
+                        "exemption_type": "DUTREIL", "dutreil_commitment_start": _date(rng, 2010, 2020)
+                    }
+            assets.append(asset)
+        return assets
+
+    @staticmethod
+    def _donations(rng: random.Random, config: GeneratorConfig, heirs: List[Dict]) -> List[Dict]:
+        donations = []
+        for index in range(config.donations):
+            heir = rng.choice(heirs)
+            original_value = round(rng.uniform(5_000, 150_000), -2)
+            donations.append({
+                "id": f"donation_{index}",
+                "donation_type": rng.choice(["don_manuel", "don_manuel", "donation_partage", "present_usage"]),
+                "beneficiary_name": heir["id"],
+                "beneficiary_heir_id": heir["id"],
+                "beneficiary_relationship": heir["relationship"],
+                "donation_date": _date(rng, 2000, 2022),
+                "original_value": original_value,
+                "current_estimated_value": round(original_value * rng.uniform(0.8, 1.6), -2),
+                "is_declared_to_tax": rng.random() < 0.7,
+            })
+        return donations
+
+    @staticmethod
+    def _debts(rng: random.Random, config: GeneratorConfig, assets: List[Dict], with_spouse: bool) -> List[Dict]:
+        debts = []
+        for index in range(config.debts):
+            debt = {
+                "id": f"dette_{index}",
+                "amount": round(rng.uniform(1_000, 80_000), -2),
+                "debt_type": rng.choice(["emprunt immobilier", "crédit à la consommation", "impôts", "frais funéraires"]),
+                "asset_origin": "COMMUNITY_PROPERTY" if with_spouse and rng.random() < 0.3 else "PERSONAL_PROPERTY",
+                "proof_provided": rng.random() < 0.8,
+            }
+            if assets and rng.random() < 0.6:
+                debt["linked_asset_id"] = rng.choice(assets)["id"]
+            debts.append(debt)
+        return debts
+
+
+def generate_simulation_input(seed: int = 0, **sizes) -> SimulationInput:
+    """Shortcut: generate_simulation_input(seed=1, assets=5000, donations=500)."""
+    return ScenarioGenerator(seed).generate(replace(GeneratorConfig(), **sizes))
@@ -0,0 +1,139 @@
+"""
+Scenario Stream - Saved SimulationScenario rows re-computed as NDJSON.
+
+Re-computing the whole client book must not hold every scenario or every
+result in memory: scenarios are read with .iterator(chunk_size=...) in
+primary key order and each result is written as soon as it is computed, one
+JSON document per line:
+
+    {"scenario_id": 12, "status": "ok", "name": "...", "result": {...}}
+    {"scenario_id": 13, "status": "error", "name": "...", "errors": [...]}
+
+The cursor is the scenario_id: a stream interrupted after line N resumes
+with after=<scenario_id of line N> (see read_resume_cursor for files).
+Memory stays bounded by one chunk of rows plus one result; the stage cache
+is bypassed (every scenario is different) and the legislation snapshot is
+taken once, so a whole run uses one legislation version.
+"""
+
+import json
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from pydantic import ValidationError
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.json_output import dump_result
+from succession_engine.services.legislation import LegislationSnapshot, get_legislation_snapshot
+
+DEFAULT_STREAM_CHUNK_SIZE = 200
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+_LINE_HEAD = re.compile(rb'^\{"scenario_id":(\d+),"status":"(\w+)"')
+_READ_BLOCK = 64 * 1024
+
+
+def iter_scenarios(after: int = 0, limit: Optional[int] = None, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE):
+    """SimulationScenario rows with pk > after, in pk order, fetched chunk_size at a time."""
+    from succession_engine.models import SimulationScenario
+
+    queryset = SimulationScenario.objects.filter(pk__gt=after).order_by('pk').only('id', 'name', 'input_data')
+    if limit is not None:
+        queryset = queryset[:limit]
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def _line(header: dict, result: Optional[bytes] = None) -> bytes:
+    """One NDJSON line; an already serialised result is spliced in as is."""
+    content = json.dumps(header, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    if result is not None:
+        content = content[:-1] + b',"result":' + result + b'}'
+    return content + b'\n'
+
+
+def simulate_scenario_line(
+    calculator: SuccessionCalculator, scenario, detail_level: DetailLevel = DetailLevel.FULL
+) -> bytes:
+    """NDJSON line of one scenario: its result or its validation / calculation error."""
+    def header(status: str) -> dict:
+        return {"scenario_id": scenario.pk, "status": status, "name": scenario.name}
+
+    try:
+        simulation_input = SimulationInput.model_validate(scenario.input_data)
+    except ValidationError as e:
+        return _line({**header("error"), "errors": e.errors(include_url=False, include_context=False)})
+    try:
+        result = calculator.run(simulation_input, detail_level=detail_level)
+        content = dump_result(result, detail_level)
+    except Exception as e:
+        return _line({**header("error"), "error": "Calculation failed", "details": str(e)})
+    return _line(header("ok"), content)
+
+
+def stream_scenario_results(
+    after: int = 0,
+    limit: Optional[int] = None,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    detail_level: DetailLevel = DetailLevel.FULL,
+    legislation: Optional[LegislationSnapshot] = None
+) -> Iterator[bytes]:
+    """
+    NDJSON lines (bytes) of the saved scenarios after the cursor, computed lazily.
+
+    Args:
+        after: Resume cursor, the last scenario_id already processed (0 = from the start)
+        limit: Maximum number of scenarios (None = all)
+        chunk_size: Rows fetched from the database at once
+        detail_level: SUMMARY runs the fast mode
+        legislation: Compiled legislation to use (default: the active one)
+    """
+    calculator = SuccessionCalculator(
+        legislation=legislation or get_legislation_snapshot(), use_stage_cache=False
+    )
+    for scenario in iter_scenarios(after, limit, chunk_size):
+        yield simulate_scenario_line(calculator, scenario, detail_level)
+
+
+def line_status(line: bytes) -> Optional[str]:
+    """Status ("ok" / "error") of an NDJSON line, read from its head only."""
+    match = _LINE_HEAD.match(line)
+    return match.group(2).decode() if match else None
+
+
+def read_resume_cursor(path) -> Tuple[int, int]:
+    """
+    Resume point of an NDJSON output file.
+
+    Returns:
+        (cursor, size): scenario_id of the last complete line (0 if none) and
+        the size of the complete lines (a partially written last line lies beyond)
+    """
+    if not os.path.exists(path):
+        return 0, 0
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = _rfind_newline(f, size)
+        if end < 0:
+            return 0, 0
+        start = _rfind_newline(f, end) + 1
+        f.seek(start)
+        match = _LINE_HEAD.match(f.read(min(256, end - start)))
+    if match is None:
+        raise ValueError(f"{path}: last line is not a scenario result")
+    return int(match.group(1)), end + 1
+
+
+def _rfind_newline(f, end: int) -> int:
+    """Offset of the last b'\\n' before end (-1 if none), reading backwards by blocks."""
+    position = end
+    while position > 0:
+        block_start = max(0, position - _READ_BLOCK)
+        f.seek(block_start)
+        index = f.read(position - block_start).rfind(b'\n')
+        if index >= 0:
+            return block_start + index
+        position = block_start
+    return -1
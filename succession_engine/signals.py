@@ -0,0 +1,36 @@
+"""
+Signal receivers for the succession engine.
+
+Any change to the fiscal legislation tables drops the in-process
+LegislationSnapshot so the next simulation recompiles it, and clears the
+in-process result cache.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from succession_engine.models import Legislation, TaxBracket, Allowance, UsufructScale
+from succession_engine.services.legislation import invalidate_legislation_snapshot
+from succession_engine.services.result_cache import invalidate_result_cache
+
+LEGISLATION_MODELS = (Legislation, TaxBracket, Allowance, UsufructScale)
+
+
+def connect_legislation_signals() -> None:
+    """Connect snapshot and result cache invalidation to every legislation model."""
+    for model in LEGISLATION_MODELS:
+        post_save.connect(
+            invalidate_legislation_snapshot, sender=model,
+            dispatch_uid=f"legislation_snapshot_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_legislation_snapshot, sender=model,
+            dispatch_uid=f"legislation_snapshot_delete_{model.__name__}"
+        )
+        post_save.connect(
+            invalidate_result_cache, sender=model,
+            dispatch_uid=f"result_cache_save_{model.__name__}"
+        )
+        post_delete.connect(
+            invalidate_result_cache, sender=model,
+            dispatch_uid=f"result_cache_delete_{model.__name__}"
+        )
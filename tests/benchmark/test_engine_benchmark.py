@@ -0,0 +1,117 @@
+"""
+Benchmark tests for SuccessionCalculator.run.
+
+Query counts are deterministic and always checked. Latency/memory against
+tests/benchmark/baseline.json is machine-specific and only checked with
+SUCCESSION_BENCHMARK=1 (record the baseline first:
+`python manage.py benchmark_engine --save-baseline`).
+"""
+import ast
+import os
+from pathlib import Path
+
+import pytest
+
+from succession_engine.services.benchmark import (
+    golden_cases, synthetic_cases, scale_cases, micro_cases, measure_case, measure_micro_case, run_benchmark,
+    load_baseline, compare_to_baseline, measure_cold_import, DEFAULT_BASELINE_PATH, COLD_IMPORT_BUDGET_MS
+)
+
+run_latency_checks = pytest.mark.skipif(
+    not os.getenv("SUCCESSION_BENCHMARK"), reason="latency benchmark: set SUCCESSION_BENCHMARK=1"
+)
+
+
+def report(p50=1.0, p95=1.5, peak_kb=100.0, queries=0, calibration_ms=10.0):
+    return {
+        "meta": {"calibration_ms": calibration_ms},
+        "cases": {"golden:SC001": {"p50_ms": p50, "p95_ms": p95, "peak_kb": peak_kb, "queries": queries}},
+    }
+
+
+class TestCompareToBaseline:
+
+    def test_within_threshold(self):
+        assert compare_to_baseline(report(p50=1.2), report()) == []
+
+    def test_latency_regression(self):
+        regressions = compare_to_baseline(report(p50=1.5), report())
+
+        assert len(regressions) == 1
+        assert "p50_ms" in regressions[0]
+
+    def test_slower_machine_is_not_a_regression(self):
+        assert compare_to_baseline(report(p50=1.5, calibration_ms=15.0), report()) == []
+
+    def test_tail_only_checked_on_demand(self):
+        assert compare_to_baseline(report(p95=3.0), report()) == []
+        assert compare_to_baseline(report(p95=3.0), report(), include_tail=True)
+
+    def test_extra_query_is_a_regression(self):
+        assert compare_to_baseline(report(queries=1), report()) == ["golden:SC001: queries 0 -> 1"]
+
+    def test_memory_regression(self):
+        assert compare_to_baseline(report(peak_kb=200.0), report())
+
+
+@pytest.mark.django_db
+class TestQueryCounts:
+    """Once the legislation snapshot is compiled, a run never touches the database."""
+
+    @pytest.mark.parametrize(
+        "case",
+        golden_cases() + synthetic_cases(((5, 10, 1),)) + scale_cases((("descendants", 200, 20, 20, 20, 10),)),
+        ids=lambda case: case.name
+    )
+    def test_steady_state_run_issues_no_query(self, case, fresh_legislation_snapshot):
+        result = measure_case(case, iterations=1, warmup=1)
+
+        assert result.queries == 0
+
+    def test_micro_benchmarks_issue_no_query(self, fresh_legislation_snapshot):
+        for case in micro_cases():
+            result = measure_micro_case(case, iterations=1, warmup=1)
+
+            assert result.queries == 0, case.name
+
+
+@run_latency_checks
+@pytest.mark.django_db
+def test_no_regression_against_baseline():
+    baseline = load_baseline(DEFAULT_BASELINE_PATH)
+    if baseline is None:
+        pytest.skip("no baseline recorded")
+
+    current = run_benchmark(golden_cases() + synthetic_cases(), micro=micro_cases())
+
+    assert compare_to_baseline(current, baseline) == []
+
+
+def test_engine_import_does_not_load_django():
+    modules = measure_cold_import(rounds=1)["modules"]
+
+    assert [m for m in modules if m.split('.')[0] in ('django', 'rest_framework')] == []
+
+
+@run_latency_checks
+def test_cold_import_within_budget():
+    assert measure_cold_import()["import_ms"] < COLD_IMPORT_BUDGET_MS
+
+
+# Modules run per asset / per heir: every import is resolved once, at module load
+HOT_PATH_MODULES = (
+    "core/calculator.py", "core/liquidation.py", "core/estate.py", "core/devolution.py", "core/tracer.py",
+    "core/index.py", "rules/fiscal.py", "rules/usufruct.py", "rules/life_insurance.py", "rules/fente.py",
+)
+
+
+@pytest.mark.parametrize("module", HOT_PATH_MODULES)
+def test_no_function_level_import_in_hot_paths(module):
+    tree = ast.parse((Path(__file__).parent.parent.parent / "succession_engine" / module).read_text(encoding="utf-8"))
+    deferred = [
+        node.lineno
+        for function in ast.walk(tree) if isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef))
+        for node in ast.walk(function) if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+    assert deferred == []
@@ -19,6 +19,18 @@ def django_db_setup():
     }
 
 
+def simple_input(value=200000):
+    """Minimal simulation payload: one child inheriting one house worth value."""
+    return {
+        "matrimonial_regime": "SEPARATION",
+        "assets": [{
+            "id": "maison", "estimated_value": value,
+            "ownership_mode": "FULL_OWNERSHIP", "asset_origin": "PERSONAL_PROPERTY"
+        }],
+        "members": [{"id": "enfant1", "birth_date": "1990-01-01", "relationship": "CHILD"}],
+    }
+
+
 @pytest.fixture
 def calculator():
     """Return an instance of SuccessionCalculator."""
@@ -36,6 +48,15 @@ def golden_scenarios():
     return {"scenarios": []}
 
 
+@pytest.fixture
+def fresh_legislation_snapshot():
+    """Drop the cached LegislationSnapshot before and after the test (DB rows are rolled back)."""
+    from succession_engine.services.legislation import invalidate_legislation_snapshot
+    invalidate_legislation_snapshot()
+    yield
+    invalidate_legislation_snapshot()
+
+
 @pytest.fixture
 def fiscal_calculator():
     """Return FiscalCalculator for unit tests."""
@@ -88,3 +109,29 @@ def sample_asset():
         ownership_mode=OwnershipMode.FULL_OWNERSHIP,
         asset_origin=AssetOrigin.PERSONAL_PROPERTY
     )
+
+
+@pytest.fixture
+def active_legislation(db):
+    """The active Legislation row."""
+    from succession_engine.models import Legislation
+    return Legislation.objects.get(is_active=True)
+
+
+@pytest.fixture
+def draft_legislation(active_legislation):
+    """Inactive copy of the active legislation with a doubled child allowance (draft finance law)."""
+    from succession_engine.models import Legislation
+    draft = Legislation.objects.create(name="Loi Finances (projet)", year=2030, is_active=False)
+    for allowance in active_legislation.allowances.all():
+        allowance.pk = None
+        allowance.legislation = draft
+        if allowance.relationship == 'CHILD':
+            allowance.amount *= 2
+        allowance.save()
+    for related in (active_legislation.tax_brackets.all(), active_legislation.usufruct_scales.all()):
+        for row in related:
+            row.pk = None
+            row.legislation = draft
+            row.save()
+    return draft
@@ -0,0 +1,53 @@
+"""
+Integration tests for the batch simulation endpoint (/api/v1/simulate/batch/).
+"""
+import json
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateBatchView
+from tests.conftest import simple_input
+
+
+def post_batch(data):
+    """POST JSON straight to the view and return (status_code, body)."""
+    request = APIRequestFactory().post("/api/v1/simulate/batch/", data, format="json")
+    response = SimulateBatchView.as_view()(request)
+    response.render()
+    return response.status_code, json.loads(response.content)
+
+
+@pytest.mark.django_db
+class TestSimulateBatchView:
+
+    def test_results_in_input_order(self):
+        status_code, body = post_batch([simple_input(200000), simple_input(400000)])
+
+        assert status_code == 200
+        assert body["count"] == 2 and body["succeeded"] == 2
+        assert [r["index"] for r in body["results"]] == [0, 1]
+        values = [r["result"]["global_metrics"]["total_estate_value"] for r in body["results"]]
+        assert values == [200000.0, 400000.0]
+
+    def test_per_item_errors(self):
+        invalid = {"matrimonial_regime": "SEPARATION", "assets": []}  # members missing
+        status_code, body = post_batch({"inputs": [invalid, simple_input()]})
+
+        assert status_code == 200
+        assert body["results"][0]["status"] == "error"
+        assert body["results"][0]["errors"]
+        assert body["results"][1]["status"] == "ok"
+        assert body["failed"] == 1
+
+    @override_settings(SIMULATION_BATCH_MAX_SIZE=2)
+    def test_max_batch_size(self):
+        status_code, _ = post_batch([simple_input()] * 3)
+
+        assert status_code == 413
+
+    def test_rejects_non_array_payload(self):
+        status_code, _ = post_batch({"foo": "bar"})
+
+        assert status_code == 400
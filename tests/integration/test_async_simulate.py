@@ -0,0 +1,149 @@
+"""
+Integration tests for the async simulate endpoint (/api/v1/simulate/async/) and its bounded offloader.
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory, override_settings
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateSuccessionAsyncView, SimulateSuccessionView
+from succession_engine.services import offload
+from succession_engine.services.offload import (
+    SimulationOffloader, SimulationOverloaded, get_simulation_offloader, reset_simulation_offloader
+)
+from succession_engine.services.result_cache import DjangoResultCache, reset_result_cache
+from tests.conftest import simple_input
+
+
+def async_request(data, query=""):
+    body = data if isinstance(data, bytes) else json.dumps(data)
+    return AsyncRequestFactory().post(f"/api/v1/simulate/async/{query}", body, content_type="application/json")
+
+
+@pytest.fixture
+def blocked_worker(monkeypatch):
+    """Simulations wait for the returned event before running."""
+    release = threading.Event()
+    simulate = offload.simulate_to_json
+
+    def wait_then_simulate(*args):
+        release.wait(5)
+        return simulate(*args)
+
+    monkeypatch.setattr(offload, "simulate_to_json", wait_then_simulate)
+    yield release
+    release.set()
+
+
+@pytest.fixture
+def fresh_offloader(fresh_legislation_snapshot):
+    reset_simulation_offloader()
+    reset_result_cache()
+    yield
+    reset_simulation_offloader()
+    reset_result_cache()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_offloader")
+class TestAsyncSimulateView:
+
+    def test_same_result_as_the_sync_view(self):
+        view = SimulateSuccessionAsyncView.as_view()
+        response = async_to_sync(view)(async_request(simple_input(), "?detail_level=summary"))
+        sync_response = SimulateSuccessionView.as_view()(
+            APIRequestFactory().post("/api/v1/simulate/?detail_level=summary", simple_input(), format="json")
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == json.loads(sync_response.content)
+
+    def test_invalid_input(self):
+        response = async_to_sync(SimulateSuccessionAsyncView.as_view())(async_request({"assets": "pas une liste"}))
+
+        assert response.status_code == 400
+        assert json.loads(response.content)["errors"]
+
+    @override_settings(SIMULATION_RESULT_CACHE_BACKEND="django")
+    def test_django_result_cache_used_through_its_async_api(self, monkeypatch):
+        """A database or network cache is never called synchronously from the event loop."""
+        monkeypatch.setattr(DjangoResultCache, "get", lambda *a: pytest.fail("sync cache get"))
+        monkeypatch.setattr(DjangoResultCache, "set", lambda *a: pytest.fail("sync cache set"))
+        view = SimulateSuccessionAsyncView.as_view()
+
+        first = async_to_sync(view)(async_request(simple_input()))
+        second = async_to_sync(view)(async_request(simple_input()))
+
+        assert first["X-Result-Cache"] == "MISS"
+        assert second["X-Result-Cache"] == "HIT"
+        assert second.content == first.content
+
+    @override_settings(
+        SIMULATION_ASYNC_WORKERS=1, SIMULATION_ASYNC_MAX_PENDING=0,
+        SIMULATION_ASYNC_RETRY_AFTER=3, SIMULATION_RESULT_CACHE_BACKEND=""
+    )
+    def test_saturation_returns_503(self, blocked_worker):
+        view = SimulateSuccessionAsyncView.as_view()
+
+        async def two_concurrent_requests():
+            first = asyncio.ensure_future(view(async_request(simple_input(100_000))))
+            while get_simulation_offloader().in_flight == 0:
+                await asyncio.sleep(0.01)
+            second = await view(async_request(simple_input(200_000)))
+            blocked_worker.set()
+            return await first, second
+
+        first, second = async_to_sync(two_concurrent_requests)()
+
+        assert first.status_code == 200
+        assert second.status_code == 503
+        assert second["Retry-After"] == "3"
+        assert get_simulation_offloader().in_flight == 0
+
+
+class TestSimulationOffloader:
+
+    def test_capacity_counts_running_and_waiting(self, blocked_worker):
+        offloader = SimulationOffloader(max_workers=1, max_pending=1)
+
+        async def overload():
+            tasks = [asyncio.ensure_future(offloader.submit(None)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(SimulationOverloaded):
+                await offloader.submit(None)
+            blocked_worker.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            async_to_sync(overload)()
+            assert offloader.in_flight == 0
+        finally:
+            offloader.shutdown()
+
+    def test_slot_held_until_the_simulation_ends(self, blocked_worker):
+        """A client going away does not free the worker: the slot is released on completion."""
+        offloader = SimulationOffloader(max_workers=1, max_pending=0)
+
+        async def cancel():
+            task = asyncio.ensure_future(offloader.submit(None))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.sleep(0.01)
+            return offloader.in_flight
+
+        try:
+            assert async_to_sync(cancel)() == 1
+            blocked_worker.set()
+            offloader._pool.shutdown(wait=True)
+            assert offloader.in_flight == 0
+        finally:
+            offloader.shutdown()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            SimulationOffloader(backend="gevent")
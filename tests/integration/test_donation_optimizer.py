@@ -0,0 +1,105 @@
+"""
+Integration tests for the donation optimizer (core.optimizer).
+"""
+import json
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import OptimizeDonationsView
+from succession_engine.core.optimizer import DonationOptimizer
+from succession_engine.schemas import DonationPlanInput, DetailLevel
+
+
+def estate(value=1_500_000):
+    return {
+        "matrimonial_regime": "SEPARATION",
+        "assets": [{
+            "id": "portefeuille", "estimated_value": value,
+            "ownership_mode": "FULL_OWNERSHIP", "asset_origin": "PERSONAL_PROPERTY"
+        }],
+        "members": [
+            {"id": "enfant1", "birth_date": "1980-01-01", "relationship": "CHILD"},
+            {"id": "enfant2", "birth_date": "1982-01-01", "relationship": "CHILD"},
+        ],
+    }
+
+
+def optimize(**kwargs):
+    return DonationOptimizer(DonationPlanInput(simulation=estate(), **kwargs)).optimize()
+
+
+@pytest.mark.django_db
+class TestDonationOptimizer:
+
+    def test_no_saving_when_death_is_immediate(self):
+        """Donations recalled at death are neutral: nothing beats doing nothing."""
+        result = optimize(horizon_years=0)
+
+        assert result.converged
+        assert result.schedules[0].total_tax_amount == pytest.approx(result.baseline_tax_amount, abs=0.01)
+
+    def test_early_donations_reduce_duties(self):
+        result = optimize(horizon_years=30)
+        best = result.schedules[0]
+
+        assert best.savings > 0
+        assert best.total_tax_amount == pytest.approx(best.donation_tax_amount + best.succession_tax_amount)
+        assert sum(d.amount for d in best.donations) <= 1_500_000
+        assert all(d.amount % 10_000 == 0 for d in best.donations)
+
+    def test_succession_tax_comes_from_the_engine(self):
+        """Without recalled donations the succession duties are those of a plain engine run."""
+        optimizer = DonationOptimizer(DonationPlanInput(simulation=estate(), horizon_years=20, donation_years=[0]))
+        schedule = (100_000.0, 50_000.0)
+
+        _, succession_tax = optimizer._cost(schedule)
+        expected = optimizer.calculator.run(optimizer._variant(schedule), detail_level=DetailLevel.SUMMARY)
+
+        assert succession_tax == expected.global_metrics.total_tax_amount
+
+    def test_recall_cumulates_donations(self):
+        """Two gifts within 15 years pay the same duties as one gift of the total."""
+        optimizer = DonationOptimizer(DonationPlanInput(simulation=estate(), horizon_years=20, donation_years=[0, 5]))
+        heir = optimizer.heirs[0]
+
+        split = optimizer._heir_donation_taxes(heir, (150_000.0, 150_000.0))
+        single = optimizer._heir_donation_taxes(heir, (300_000.0, 0.0))
+
+        assert sum(split) == pytest.approx(sum(single))
+
+    def test_spouse_cannot_be_a_donee(self):
+        simulation = estate()
+        simulation["members"].append({"id": "conjoint", "birth_date": "1955-01-01", "relationship": "SPOUSE"})
+
+        with pytest.raises(ValueError):
+            DonationOptimizer(DonationPlanInput(simulation=simulation, heir_ids=["conjoint"]))
+
+    def test_time_budget_interrupts_search(self):
+        result = optimize(horizon_years=30, time_budget_seconds=1e-9)
+
+        assert not result.converged
+        assert result.schedules  # at least the baseline schedule
+
+
+@pytest.mark.django_db
+class TestDonationPlanApi:
+
+    def test_returns_schedules(self):
+        request = APIRequestFactory().post(
+            "/api/v1/simulate/donation-plan/", {"simulation": estate(), "horizon_years": 30}, format="json"
+        )
+        response = OptimizeDonationsView.as_view()(request)
+        response.render()
+        body = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert body["schedules"][0]["savings"] > 0
+
+    def test_unknown_heir_is_rejected(self):
+        request = APIRequestFactory().post(
+            "/api/v1/simulate/donation-plan/", {"simulation": estate(), "heir_ids": ["inconnu"]}, format="json"
+        )
+        response = OptimizeDonationsView.as_view()(request)
+
+        assert response.status_code == 400
@@ -0,0 +1,93 @@
+"""
+Integration tests for the tracer-off fast mode (DetailLevel.SUMMARY).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateSuccessionView
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput, DetailLevel, SuccessionSummaryOutput
+from succession_engine.services.result_cache import reset_result_cache
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+def load_golden_inputs():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return [(s["id"], s["input"]) for s in json.load(f)["scenarios"]]
+
+
+def post_simulation(data, query=""):
+    request = APIRequestFactory().post(f"/api/v1/simulate/{query}", data, format="json")
+    response = SimulateSuccessionView.as_view()(request)
+    if isinstance(response, Response):
+        response.render()
+    return response, json.loads(response.content)
+
+
+def figures(heirs_breakdown):
+    """Heir figures without the explanation keys (not built in fast mode)."""
+    return [
+        {k: v for k, v in heir.items() if k not in ("explanation_keys", "explanation_params")}
+        for heir in heirs_breakdown
+    ]
+
+
+@pytest.fixture
+def fresh_result_cache(fresh_legislation_snapshot):
+    reset_result_cache()
+    yield
+    reset_result_cache()
+
+
+@pytest.mark.django_db
+class TestSummaryFigures:
+
+    @pytest.mark.parametrize("scenario_id,raw_input", load_golden_inputs())
+    def test_summary_matches_full(self, scenario_id, raw_input):
+        input_data = SimulationInput(**raw_input)
+        calculator = SuccessionCalculator(use_stage_cache=False)
+
+        full = calculator.run(input_data).model_dump()
+        summary = calculator.run(input_data, detail_level=DetailLevel.SUMMARY)
+
+        assert isinstance(summary, SuccessionSummaryOutput)
+        summary = summary.model_dump()
+        assert summary["global_metrics"] == full["global_metrics"]
+        assert figures(summary["heirs_breakdown"]) == figures(full["heirs_breakdown"])
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_result_cache")
+class TestSummaryApi:
+
+    def test_summary_returns_figures_only(self):
+        _, raw_input = load_golden_inputs()[0]
+        response, body = post_simulation(raw_input, "?detail_level=summary")
+
+        assert response.status_code == 200
+        assert set(body) == {"global_metrics", "heirs_breakdown"}
+
+    def test_explain_false_is_summary(self):
+        _, raw_input = load_golden_inputs()[0]
+        _, body = post_simulation(raw_input, "?explain=false")
+
+        assert set(body) == {"global_metrics", "heirs_breakdown"}
+
+    def test_summary_and_full_are_cached_separately(self):
+        _, raw_input = load_golden_inputs()[0]
+        post_simulation(raw_input, "?detail_level=summary")
+        response, body = post_simulation(raw_input)
+
+        assert response["X-Result-Cache"] == "MISS"
+        assert "calculation_steps" in body
+
+    def test_invalid_detail_level_is_rejected(self):
+        _, raw_input = load_golden_inputs()[0]
+        response, _ = post_simulation(raw_input, "?detail_level=verbose")
+
+        assert response.status_code == 400
@@ -0,0 +1,54 @@
+"""
+Integration tests for the legislation artifact: export command and LEGISLATION_ARTIFACT setting.
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput
+from succession_engine.services.legislation import build_snapshot_from_db, get_legislation_snapshot
+from succession_engine.services.legislation_artifact import load_legislation_artifact
+from succession_engine.services.provider import StaticProvider
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+def golden_input():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return SimulationInput(**json.load(f)["scenarios"][0]["input"])
+
+
+@pytest.mark.django_db
+class TestLegislationArtifact:
+
+    def test_export_matches_the_database(self, draft_legislation, tmp_path):
+        path = tmp_path / "draft.json.gz"
+        call_command("export_legislation", "--legislation", str(draft_legislation.pk), "--output", str(path))
+
+        loaded = load_legislation_artifact(path)
+
+        assert loaded == build_snapshot_from_db(draft_legislation)
+        assert loaded.get_allowance('CHILD') == 200_000.0
+
+    def test_setting_loads_the_artifact_without_queries(
+        self, active_legislation, tmp_path, settings, fresh_legislation_snapshot, django_assert_num_queries
+    ):
+        path = tmp_path / "active.json"
+        call_command("export_legislation", "--output", str(path))
+        simulation_input = golden_input()
+        expected = SuccessionCalculator().run(simulation_input)
+        settings.LEGISLATION_ARTIFACT = str(path)
+
+        with django_assert_num_queries(0):
+            snapshot = get_legislation_snapshot()
+            result = SuccessionCalculator().run(simulation_input)
+
+        assert snapshot.fingerprint == build_snapshot_from_db(active_legislation).fingerprint
+        assert result.global_metrics == expected.global_metrics
+
+    def test_packaged_legislation_matches_the_migrations(self, active_legislation):
+        """succession_engine/data/legislation.json (engine without Django) is the seeded active legislation."""
+        assert StaticProvider().load_active_legislation() == build_snapshot_from_db(active_legislation)
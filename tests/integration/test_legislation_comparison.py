@@ -0,0 +1,132 @@
+"""
+Integration tests for the multi-legislation comparison (compare_legislations, /api/v1/simulate/legislations/).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import CompareLegislationsView, SimulateSuccessionView
+from succession_engine.constants import DEFAULT_USUFRUCT_SCALE
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.models import Legislation, UsufructScale
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.legislation import build_snapshot_from_db, get_legislation_snapshot_by_id
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+def load_golden_inputs():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return [(s["id"], s["input"]) for s in json.load(f)["scenarios"]]
+
+
+def post(view, data, query=""):
+    request = APIRequestFactory().post(f"/api/v1/simulate/{query}", data, format="json")
+    response = view.as_view()(request)
+    if hasattr(response, "render"):
+        response.render()
+    return response, json.loads(response.content)
+
+
+@pytest.fixture
+def legislations(fresh_legislation_snapshot, active_legislation, draft_legislation):
+    return [build_snapshot_from_db(active_legislation), build_snapshot_from_db(draft_legislation)]
+
+
+@pytest.mark.django_db
+class TestCompareLegislations:
+
+    @pytest.mark.parametrize("scenario_id,raw_input", load_golden_inputs())
+    def test_same_results_as_separate_runs(self, scenario_id, raw_input, legislations):
+        simulation_input = SimulationInput(**raw_input)
+
+        comparison = SuccessionCalculator(use_stage_cache=False).compare_legislations(simulation_input, legislations)
+
+        for legislation, legislation_result in zip(legislations, comparison.legislations):
+            expected = SuccessionCalculator(legislation=legislation, use_stage_cache=False).run(simulation_input)
+            assert legislation_result.result.model_dump() == expected.model_dump()
+
+    def test_devolution_shared_per_usufruct_scale(self, legislations, draft_legislation, monkeypatch):
+        _, raw_input = load_golden_inputs()[4]
+        calls = []
+        devolve = SuccessionCalculator._devolve
+        monkeypatch.setattr(
+            SuccessionCalculator, "_devolve", lambda self, *args: calls.append(args[2]) or devolve(self, *args)
+        )
+        calculator = SuccessionCalculator(use_stage_cache=False)
+
+        calculator.compare_legislations(SimulationInput(**raw_input), legislations, detail_level=DetailLevel.SUMMARY)
+        assert len(calls) == 1
+
+        # Art. 669 CGI scale shifted by ten years
+        for max_age, rate in DEFAULT_USUFRUCT_SCALE:
+            UsufructScale.objects.create(legislation=draft_legislation, max_age=max_age + 10, rate=rate)
+        other_scale = build_snapshot_from_db(draft_legislation)
+        comparison = calculator.compare_legislations(SimulationInput(**raw_input), [legislations[0], other_scale])
+
+        assert len(calls) == 3
+        expected = SuccessionCalculator(legislation=other_scale, use_stage_cache=False).run(SimulationInput(**raw_input))
+        assert comparison.legislations[1].result.model_dump() == expected.model_dump()
+
+    def test_diff_table(self, legislations):
+        _, raw_input = load_golden_inputs()[1]
+
+        comparison = SuccessionCalculator().compare_legislations(
+            SimulationInput(**raw_input), legislations, detail_level=DetailLevel.SUMMARY
+        )
+
+        reference, draft = (str(legislation.legislation_id) for legislation in legislations)
+        assert comparison.reference_legislation_id == legislations[0].legislation_id
+        assert comparison.total_tax_delta[reference] == 0.0
+        assert comparison.total_tax_delta[draft] < 0
+        for heir in comparison.heirs_comparison:
+            assert heir.tax_delta[draft] == pytest.approx(heir.tax_amount[draft] - heir.tax_amount[reference])
+
+
+@pytest.mark.django_db
+class TestLegislationEndpoints:
+
+    def test_compare_endpoint(self, legislations):
+        _, raw_input = load_golden_inputs()[1]
+        ids = [legislation.legislation_id for legislation in legislations]
+
+        response, body = post(CompareLegislationsView, {"simulation": raw_input, "legislation_ids": ids})
+
+        assert response.status_code == 200
+        assert [r["legislation_id"] for r in body["legislations"]] == ids
+        assert "applied_rules" in body["legislations"][0]["result"]["calculation_steps"][0]
+
+    def test_unknown_legislation(self, legislations):
+        _, raw_input = load_golden_inputs()[1]
+
+        response, _ = post(CompareLegislationsView, {"simulation": raw_input, "legislation_ids": [999999]})
+
+        assert response.status_code == 400
+
+    @override_settings(SIMULATION_COMPARISON_MAX_LEGISLATIONS=1)
+    def test_too_many_legislations(self, legislations):
+        _, raw_input = load_golden_inputs()[1]
+        ids = [legislation.legislation_id for legislation in legislations]
+
+        response, _ = post(CompareLegislationsView, {"simulation": raw_input, "legislation_ids": ids})
+
+        assert response.status_code == 400
+
+    def test_simulate_with_explicit_legislation(self, legislations, draft_legislation):
+        _, raw_input = load_golden_inputs()[1]
+
+        _, active = post(SimulateSuccessionView, raw_input, "?detail_level=summary")
+        _, draft = post(SimulateSuccessionView, raw_input, f"?detail_level=summary&legislation={draft_legislation.pk}")
+
+        assert draft["global_metrics"]["total_tax_amount"] < active["global_metrics"]["total_tax_amount"]
+        assert not Legislation.objects.get(pk=draft_legislation.pk).is_active
+
+    def test_snapshot_by_id_is_cached(self, draft_legislation, django_assert_num_queries):
+        get_legislation_snapshot_by_id(draft_legislation.pk)
+
+        with django_assert_num_queries(0):
+            snapshot = get_legislation_snapshot_by_id(draft_legislation.pk)
+        assert snapshot.legislation_id == draft_legislation.pk
@@ -0,0 +1,106 @@
+"""
+Integration tests for the bulk re-simulation of saved scenarios (resimulate command).
+"""
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.models import SimulationResult, SimulationScenario
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.resimulation import Resimulation, ResimulationReport, ScenarioDelta
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+@pytest.fixture
+def scenarios(fresh_legislation_snapshot):
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        golden = json.load(f)["scenarios"][:3]
+    saved = [SimulationScenario.objects.create(name=s["id"], input_data=s["input"]) for s in golden]
+    saved.append(SimulationScenario.objects.create(name="invalide", input_data={"assets": "pas une liste"}))
+    return saved
+
+
+@pytest.mark.django_db
+class TestResimulation:
+
+    def test_results_are_stored(self, scenarios, active_legislation):
+        report = Resimulation(active_legislation, max_workers=1).run(SimulationScenario.objects.all())
+
+        assert (report.scenarios, report.errors, report.created, report.updated) == (4, 1, 4, 0)
+        stored = SimulationResult.objects.get(scenario=scenarios[0], legislation=active_legislation)
+        expected = SuccessionCalculator().run(
+            SimulationInput(**scenarios[0].input_data), detail_level=DetailLevel.SUMMARY
+        )
+        assert stored.status == 'ok'
+        assert float(stored.total_tax_amount) == pytest.approx(expected.global_metrics.total_tax_amount, abs=0.01)
+        assert [heir["id"] for heir in stored.heirs_summary] == [h.id for h in expected.heirs_breakdown]
+        assert SimulationResult.objects.get(scenario=scenarios[3]).status == 'error'
+
+    def test_second_run_updates_in_place(self, scenarios, active_legislation):
+        Resimulation(active_legislation, max_workers=1).run(SimulationScenario.objects.all())
+        report = Resimulation(active_legislation, max_workers=1, batch_size=2).run(SimulationScenario.objects.all())
+
+        assert (report.created, report.updated) == (0, 4)
+        assert report.compared == 3 and report.changes == []
+        assert SimulationResult.objects.count() == 4
+
+    def test_dry_run_reports_the_tax_impact(self, scenarios, active_legislation, draft_legislation):
+        Resimulation(active_legislation, max_workers=1).run(SimulationScenario.objects.all())
+
+        report = Resimulation(draft_legislation, max_workers=1, dry_run=True).run(SimulationScenario.objects.all())
+
+        assert not SimulationResult.objects.filter(legislation=draft_legislation).exists()
+        assert report.compared == 3
+        assert report.compared_total_tax <= report.previous_total_tax
+        assert report.changes and all(change.delta < 0 for change in report.changes)
+        assert report.changed == len(report.changes)
+
+
+class TestResimulationReport:
+
+    def test_keeps_only_the_largest_changes(self):
+        report = ResimulationReport(legislation="LF", dry_run=True, top_count=3)
+        deltas = [5.0, -40.0, 1.0, 30.0, -2.0, 100.0, 7.0]
+
+        for scenario_id, delta in enumerate(deltas):
+            report.add_change(ScenarioDelta(scenario_id, f"s{scenario_id}", 1000.0, 1000.0 + delta))
+
+        assert report.changed == len(deltas)
+        assert len(report._top) == 3
+        assert [change.delta for change in report.top_changes()] == [100.0, -40.0, 30.0]
+        assert [change.scenario_id for change in report.top_changes(1)] == [5]
+
+    def test_zero_top_only_counts(self):
+        report = ResimulationReport(legislation="LF", dry_run=True, top_count=0)
+
+        report.add_change(ScenarioDelta(1, "s1", 10.0, 20.0))
+
+        assert report.changed == 1 and report.changes == []
+
+
+@pytest.mark.django_db
+class TestResimulateCommand:
+
+    def test_selected_scenarios(self, scenarios):
+        out = StringIO()
+        call_command("resimulate", str(scenarios[0].pk), str(scenarios[1].pk), "--workers", "1", stdout=out)
+
+        assert "2 scénario(s)" in out.getvalue()
+        assert SimulationResult.objects.count() == 2
+
+    def test_since_and_dry_run(self, scenarios):
+        out = StringIO()
+        call_command("resimulate", "--since", "2999-01-01", "--dry-run", "--workers", "1", stdout=out)
+
+        assert out.getvalue().startswith("[dry-run] 0 scénario(s)")
+        assert not SimulationResult.objects.exists()
+
+    def test_unknown_legislation(self, scenarios):
+        with pytest.raises(CommandError):
+            call_command("resimulate", "--legislation", "Loi inexistante")
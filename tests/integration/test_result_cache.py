@@ -0,0 +1,126 @@
+"""
+Integration tests for the result cache of /api/v1/simulate/.
+"""
+import json
+
+import pytest
+from django.test import override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateSuccessionView
+from succession_engine.services.result_cache import LocalResultCache, get_result_cache, reset_result_cache
+from tests.conftest import simple_input
+
+
+def post_simulation(data):
+    request = APIRequestFactory().post("/api/v1/simulate/", data, format="json")
+    response = SimulateSuccessionView.as_view()(request)
+    if isinstance(response, Response):
+        response.render()
+    return response, json.loads(response.content)
+
+
+@pytest.fixture
+def fresh_result_cache(fresh_legislation_snapshot):
+    reset_result_cache()
+    yield
+    reset_result_cache()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_result_cache")
+class TestResultCache:
+
+    def test_identical_payload_is_served_from_cache(self, monkeypatch):
+        first, first_body = post_simulation(simple_input())
+
+        from succession_engine.core.calculator import SuccessionCalculator
+        monkeypatch.setattr(SuccessionCalculator, "run", lambda *a, **k: pytest.fail("calculator called"))
+        second, second_body = post_simulation(simple_input())
+
+        assert first["X-Result-Cache"] == "MISS"
+        assert second["X-Result-Cache"] == "HIT"
+        assert second_body == first_body
+
+    def test_key_ignores_payload_key_order(self):
+        payload = simple_input()
+        reordered = {key: payload[key] for key in reversed(list(payload))}
+
+        post_simulation(payload)
+        response, _ = post_simulation(reordered)
+
+        assert response["X-Result-Cache"] == "HIT"
+
+    def test_different_input_misses(self):
+        post_simulation(simple_input(200000))
+        response, body = post_simulation(simple_input(300000))
+
+        assert response["X-Result-Cache"] == "MISS"
+        assert body["global_metrics"]["total_estate_value"] == 300000.0
+
+    def test_legislation_change_invalidates(self):
+        from succession_engine.models import Allowance
+        from succession_engine.services.legislation import get_legislation_snapshot
+
+        _, before = post_simulation(simple_input())
+        allowance = Allowance.objects.get(
+            legislation_id=get_legislation_snapshot().legislation_id, relationship='CHILD'
+        )
+        allowance.amount = 150_000
+        allowance.save()
+        response, after = post_simulation(simple_input())
+
+        assert response["X-Result-Cache"] == "MISS"
+        assert after["global_metrics"]["total_tax_amount"] < before["global_metrics"]["total_tax_amount"]
+
+    @override_settings(SIMULATION_RESULT_CACHE_BACKEND="django")
+    def test_django_cache_backend(self):
+        post_simulation(simple_input())
+        response, _ = post_simulation(simple_input())
+
+        assert response["X-Result-Cache"] == "HIT"
+
+    @override_settings(SIMULATION_RESULT_CACHE_BACKEND="")
+    def test_disabled(self):
+        post_simulation(simple_input())
+        response, _ = post_simulation(simple_input())
+
+        assert get_result_cache() is None
+        assert not response.has_header("X-Result-Cache")
+
+    @override_settings(SIMULATION_RESULT_CACHE_MAX_BYTES=100)
+    def test_result_larger_than_byte_budget_is_not_cached(self):
+        post_simulation(simple_input())
+        response, _ = post_simulation(simple_input())
+
+        assert response["X-Result-Cache"] == "MISS"
+        assert len(get_result_cache()) == 0
+
+
+class TestLocalResultCache:
+
+    def test_evicts_least_recently_used_beyond_byte_budget(self):
+        cache = LocalResultCache(maxsize=10, max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234" and cache.get("c") == b"1234"
+        assert cache.total_bytes == 8
+
+    def test_replacing_an_entry_updates_the_total(self):
+        cache = LocalResultCache(maxsize=10, max_bytes=10)
+        cache.set("a", b"12345678")
+        cache.set("a", b"12")
+
+        assert cache.total_bytes == 2
+
+    def test_entry_count_still_bounded(self):
+        cache = LocalResultCache(maxsize=1, max_bytes=1000)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+
+        assert len(cache) == 1 and cache.get("b") == b"2"
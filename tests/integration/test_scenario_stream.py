@@ -0,0 +1,91 @@
+"""
+Integration tests for the NDJSON stream of the saved scenarios (services.scenario_stream).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import ScenarioResultsStreamView
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.models import SimulationScenario
+from succession_engine.schemas import SimulationInput, DetailLevel
+from succession_engine.services.json_output import dump_result
+from succession_engine.services.scenario_stream import read_resume_cursor, stream_scenario_results
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+@pytest.fixture
+def scenarios(fresh_legislation_snapshot):
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        golden = json.load(f)["scenarios"][:4]
+    inputs = [(s["id"], s["input"]) for s in golden]
+    inputs.insert(2, ("invalide", {"assets": "pas une liste"}))
+    return [SimulationScenario.objects.create(name=name, input_data=data) for name, data in inputs]
+
+
+def stream(query=""):
+    request = APIRequestFactory().get(f"/api/v1/scenarios/results/{query}")
+    return ScenarioResultsStreamView.as_view()(request)
+
+
+def parse(content: bytes):
+    return [json.loads(line) for line in content.splitlines()]
+
+
+@pytest.mark.django_db
+class TestScenarioStream:
+
+    def test_one_line_per_scenario_in_id_order(self, scenarios):
+        response = stream("?detail_level=summary")
+        lines = parse(b"".join(response.streaming_content))
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [line["scenario_id"] for line in lines] == [s.pk for s in scenarios]
+        assert [line["status"] for line in lines] == ["ok", "ok", "error", "ok", "ok"]
+        assert lines[2]["errors"]
+
+    def test_result_matches_the_calculator(self, scenarios):
+        scenario = scenarios[0]
+        expected = dump_result(
+            SuccessionCalculator().run(SimulationInput(**scenario.input_data)), DetailLevel.FULL
+        )
+
+        first = next(stream_scenario_results(limit=1))
+
+        assert json.loads(first)["result"] == json.loads(expected)
+
+    def test_cursor_and_limit(self, scenarios):
+        lines = parse(b"".join(stream(f"?after={scenarios[1].pk}&limit=2&chunk_size=1").streaming_content))
+
+        assert [line["scenario_id"] for line in lines] == [scenarios[2].pk, scenarios[3].pk]
+
+    def test_invalid_parameter(self):
+        response = stream("?chunk_size=0")
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestStreamCommand:
+
+    def test_resume_after_interruption(self, scenarios, tmp_path):
+        output = tmp_path / "book.ndjson"
+        call_command("stream_scenarios", "--summary", "--limit", "2", "--output", str(output))
+        # Interrupted while writing the third line
+        partial_line = b'{"scenario_id":999,"status":"ok","na'
+        with open(output, "ab") as f:
+            f.write(partial_line)
+
+        assert read_resume_cursor(output) == (scenarios[1].pk, output.stat().st_size - len(partial_line))
+
+        call_command("stream_scenarios", "--summary", "--resume", "--output", str(output))
+        lines = parse(output.read_bytes())
+
+        assert [line["scenario_id"] for line in lines] == [s.pk for s in scenarios]
+
+    def test_missing_file_starts_from_the_beginning(self, tmp_path):
+        assert read_resume_cursor(tmp_path / "absent.ndjson") == (0, 0)
@@ -0,0 +1,228 @@
+"""
+Integration tests for the simulation job queue (services.jobs, /api/v1/simulate/*/jobs/, simulation_worker command).
+"""
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulationJobResultView, SimulationJobView, SubmitSimulationJobView
+from succession_engine.models import SimulationJob, SimulationJobChunk
+from succession_engine.services.jobs import (
+    JOB_BATCH, JOB_DONATION_PLAN, SimulationWorker, claim_next_job, requeue_stale_jobs, stream_batch_result, submit_job
+)
+from succession_engine.services.legislation import get_legislation_snapshot
+from tests.conftest import simple_input
+
+
+def donation_plan():
+    estate = simple_input(1_500_000)
+    estate["members"].append({"id": "enfant2", "birth_date": "1992-01-01", "relationship": "CHILD"})
+    return {"simulation": estate, "horizon_years": 30}
+
+
+def worker(**kwargs):
+    return SimulationWorker(name="test", max_workers=1, **kwargs)
+
+
+def call(view, method, path, data=None, **kwargs):
+    """Send the request straight to the view and return (status_code, body, response)."""
+    factory = APIRequestFactory()
+    request = factory.post(path, data, format="json") if method == "post" else factory.get(path)
+    response = view(request, **kwargs)
+    if response.streaming:
+        return response.status_code, json.loads(b"".join(response.streaming_content)), response
+    response.render()
+    return response.status_code, json.loads(response.content), response
+
+
+def batch_result(job):
+    return json.loads(b"".join(stream_batch_result(job)))
+
+
+submit_batch = SubmitSimulationJobView.as_view(kind=JOB_BATCH)
+submit_donation_plan = SubmitSimulationJobView.as_view(kind=JOB_DONATION_PLAN)
+
+
+@pytest.mark.django_db
+class TestSimulationJobApi:
+
+    def test_submit_poll_and_result(self):
+        status_code, body, response = call(
+            submit_batch, "post", "/api/v1/simulate/batch/jobs/?detail_level=summary",
+            [simple_input(200000), simple_input(400000)]
+        )
+
+        assert status_code == 202
+        assert body["status"] == "queued" and body["progress"] == {"done": 0, "total": 2}
+        assert response["Location"] == f"/api/v1/simulate/jobs/{body['id']}/"
+        assert body["result_url"].endswith(f"/api/v1/simulate/jobs/{body['id']}/result/")
+
+        status_code, pending, _ = call(SimulationJobResultView.as_view(), "get", "/", job_id=body["id"])
+        assert status_code == 409 and pending["status"] == "queued"
+
+        worker().run_next()
+
+        _, job_status, _ = call(SimulationJobView.as_view(), "get", "/", job_id=body["id"])
+        assert job_status["status"] == "done" and job_status["progress"] == {"done": 2, "total": 2}
+        status_code, result, _ = call(SimulationJobResultView.as_view(), "get", "/", job_id=body["id"])
+        assert status_code == 200
+        assert result["count"] == 2 and result["succeeded"] == 2
+        values = [r["result"]["global_metrics"]["total_estate_value"] for r in result["results"]]
+        assert values == [200000.0, 400000.0]
+
+    @override_settings(SIMULATION_JOB_MAX_INPUTS=2)
+    def test_submit_rejects_invalid_payloads(self, active_legislation):
+        path = "/api/v1/simulate/batch/jobs/"
+        too_large = call(submit_batch, "post", path, [simple_input()] * 3)
+        not_a_list = call(submit_batch, "post", path, {"inputs": "x"})
+        unknown_legislation = call(submit_batch, "post", f"{path}?legislation={active_legislation.pk + 1000}", [simple_input()])
+        invalid_plan = call(submit_donation_plan, "post", "/api/v1/simulate/donation-plan/jobs/", {"horizon_years": 30})
+
+        assert [r[0] for r in (too_large, not_a_list, unknown_legislation, invalid_plan)] == [400] * 4
+        assert invalid_plan[1]["errors"]
+        assert not SimulationJob.objects.exists()
+
+    def test_unknown_job(self):
+        status_code, _, _ = call(
+            SimulationJobView.as_view(), "get", "/", job_id="00000000-0000-0000-0000-000000000000"
+        )
+
+        assert status_code == 404
+
+
+@pytest.mark.django_db
+class TestSimulationWorker:
+
+    def test_batch_progress_is_reported_by_chunk(self, monkeypatch):
+        job = submit_job(JOB_BATCH, {"inputs": [simple_input(), {"assets": []}, simple_input()]})
+        reported = []
+        report_progress = SimulationWorker._report_progress
+
+        def spy(self, job, done, **fields):
+            reported.append(SimulationJob.objects.get(pk=job.pk).progress_done)
+            report_progress(self, job, done, **fields)
+
+        monkeypatch.setattr(SimulationWorker, "_report_progress", spy)
+        worker(chunk_size=2).run_next()
+        job.refresh_from_db()
+
+        assert reported == [0, 0, 2]
+        assert (job.status, job.progress_done, job.worker, job.attempts) == ("done", 3, "test", 1)
+        assert job.legislation_fingerprint
+        assert job.result == {"count": 3, "succeeded": 2, "failed": 1}
+        assert [(c.start, c.size) for c in job.chunks.order_by("start")] == [(0, 2), (2, 1)]
+        results = batch_result(job)["results"]
+        assert [(r["index"], r["status"]) for r in results] == [(0, "ok"), (1, "error"), (2, "ok")]
+        assert results[1]["errors"]
+
+    def test_requeued_batch_resumes_after_the_saved_chunks(self):
+        job = submit_job(JOB_BATCH, [simple_input(100_000), simple_input(200_000), simple_input(300_000)])
+        claimed = claim_next_job("test")
+        # Left by a previous attempt under the same legislation
+        saved = [{"index": 0, "status": "ok", "result": "saved"}, {"index": 1, "status": "ok", "result": "saved"}]
+        SimulationJobChunk.objects.create(job=job, start=0, size=2, succeeded=2, results=saved)
+        SimulationJob.objects.filter(pk=job.pk).update(legislation_fingerprint=get_legislation_snapshot().fingerprint)
+        claimed.refresh_from_db()
+
+        worker(chunk_size=2).run(claimed)
+        job.refresh_from_db()
+
+        assert (job.status, job.progress_done, job.result["succeeded"]) == ("done", 3, 3)
+        results = batch_result(job)["results"]
+        assert results[:2] == saved
+        assert results[2]["result"]["global_metrics"]["total_estate_value"] == 300000.0
+
+    def test_saved_chunks_of_another_legislation_are_recomputed(self):
+        job = submit_job(JOB_BATCH, [simple_input(100_000)])
+        claimed = claim_next_job("test")
+        SimulationJobChunk.objects.create(job=job, start=0, size=1, succeeded=1, results=[{"index": 0, "status": "ok"}])
+        SimulationJob.objects.filter(pk=job.pk).update(legislation_fingerprint="autre")
+        claimed.refresh_from_db()
+
+        worker().run(claimed)
+        job.refresh_from_db()
+
+        assert job.chunks.count() == 1
+        assert batch_result(job)["results"][0]["result"]["global_metrics"]["total_estate_value"] == 100000.0
+
+    def test_donation_plan_job(self):
+        job = submit_job(JOB_DONATION_PLAN, donation_plan())
+
+        worker().run_next()
+        job.refresh_from_db()
+
+        assert job.status == "done" and job.progress_done == job.progress_total == 1
+        assert job.result["schedules"][0]["savings"] > 0
+
+    def test_failing_job_stores_the_error(self):
+        plan = donation_plan()
+        plan["heir_ids"] = ["inconnu"]
+        job = submit_job(JOB_DONATION_PLAN, plan)
+
+        worker().run_next()
+        job.refresh_from_db()
+
+        assert job.status == "failed" and "inconnu" in job.error and job.result is None
+
+    def test_jobs_are_claimed_once_in_submission_order(self):
+        first = submit_job(JOB_BATCH, [simple_input()])
+        second = submit_job(JOB_BATCH, [simple_input()])
+
+        assert claim_next_job("a").pk == first.pk
+        assert claim_next_job("b").pk == second.pk
+        assert claim_next_job("c") is None
+
+    def test_lost_job_is_not_overwritten(self):
+        job = submit_job(JOB_BATCH, [simple_input()])
+        claimed = claim_next_job("test")
+        SimulationJob.objects.filter(pk=job.pk).update(worker="other")
+
+        worker().run(claimed)
+        job.refresh_from_db()
+
+        assert (job.status, job.worker, job.result) == ("running", "other", None)
+
+    def test_stale_jobs_are_requeued_then_failed(self):
+        retried = submit_job(JOB_BATCH, [simple_input()])
+        exhausted = submit_job(JOB_BATCH, [simple_input()])
+        claim_next_job("dead")
+        claim_next_job("dead")
+        SimulationJob.objects.filter(pk=exhausted.pk).update(attempts=3)
+        SimulationJob.objects.update(heartbeat_at=timezone.now() - timedelta(hours=1))
+
+        assert requeue_stale_jobs(stale_seconds=60, max_attempts=3) == (1, 1)
+        retried.refresh_from_db()
+        exhausted.refresh_from_db()
+        assert (retried.status, retried.worker) == ("queued", "")
+        assert exhausted.status == "failed"
+
+        assert worker().run_next().pk == retried.pk
+        retried.refresh_from_db()
+        assert (retried.status, retried.attempts) == ("done", 2)
+
+
+@pytest.mark.django_db
+class TestSimulationWorkerCommand:
+
+    def test_once_runs_the_queue_and_exits(self):
+        jobs = [submit_job(JOB_BATCH, [simple_input()] * 3) for _ in range(2)]
+        out = StringIO()
+
+        call_command("simulation_worker", "--once", "--workers", "1", "--chunk-size", "2", stdout=out, stderr=StringIO())
+
+        assert all(SimulationJob.objects.get(pk=job.pk).status == "done" for job in jobs)
+        assert out.getvalue().count(": done (3/3)") == 2
+
+    def test_max_jobs(self):
+        submit_job(JOB_BATCH, [simple_input()])
+        submit_job(JOB_BATCH, [simple_input()])
+
+        call_command("simulation_worker", "--max-jobs", "1", "--workers", "1", stdout=StringIO(), stderr=StringIO())
+
+        assert SimulationJob.objects.filter(status="queued").count() == 1
@@ -0,0 +1,95 @@
+"""
+Integration tests for the spouse option comparison (shared steps 1-2).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import CompareSpouseOptionsView
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput, SpouseChoice, SpouseChoiceType
+from succession_engine.services.explainer import explainer
+
+
+def golden_input(scenario_id):
+    path = Path(__file__).parent.parent / "golden_scenarios.json"
+    with open(path, "r", encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    return next(s["input"] for s in scenarios if s["id"] == scenario_id)
+
+
+def with_choice(input_data, choice):
+    return input_data.model_copy(update={
+        "wishes": input_data.wishes.model_copy(update={"spouse_choice": SpouseChoice(choice=choice)})
+    })
+
+
+@pytest.mark.django_db
+class TestCompareSpouseOptions:
+
+    @pytest.mark.parametrize("scenario_id", ["SC005", "SC006", "SC016", "SC_CHAOS_1"])
+    def test_each_option_matches_a_full_run(self, scenario_id):
+        input_data = SimulationInput(**golden_input(scenario_id))
+        calculator = SuccessionCalculator()
+
+        comparison = calculator.compare_spouse_options(input_data)
+
+        assert [o.option for o in comparison.options] == [
+            SpouseChoiceType.USUFRUCT, SpouseChoiceType.QUARTER_OWNERSHIP
+        ]
+        for option_result in comparison.options:
+            expected = calculator.run(with_choice(input_data, option_result.option))
+            assert option_result.result.model_dump() == expected.model_dump()
+
+    def test_deltas_against_reference_option(self):
+        input_data = SimulationInput(**golden_input("SC005"))
+
+        comparison = SuccessionCalculator().compare_spouse_options(input_data)
+
+        assert comparison.reference_option == SpouseChoiceType.USUFRUCT
+        for heir in comparison.heirs_comparison:
+            assert heir.net_share_delta["USUFRUCT"] == 0.0
+            assert heir.net_share_delta["QUARTER_OWNERSHIP"] == pytest.approx(
+                heir.net_share_value["QUARTER_OWNERSHIP"] - heir.net_share_value["USUFRUCT"]
+            )
+
+    def test_disposable_quota_requires_spouse_donation(self):
+        raw = golden_input("SC005")
+        raw["wishes"]["has_spouse_donation"] = True
+        input_data = SimulationInput(**raw)
+
+        comparison = SuccessionCalculator().compare_spouse_options(input_data)
+
+        assert SpouseChoiceType.DISPOSABLE_QUOTA in [o.option for o in comparison.options]
+
+    def test_requires_spouse(self):
+        raw = golden_input("SC005")
+        raw["members"] = [m for m in raw["members"] if m["relationship"] != "SPOUSE"]
+
+        with pytest.raises(ValueError):
+            SuccessionCalculator().compare_spouse_options(SimulationInput(**raw))
+
+    def test_api_endpoint(self):
+        request = APIRequestFactory().post(
+            "/api/v1/simulate/spouse-options/",
+            {"simulation": golden_input("SC006"), "options": ["QUARTER_OWNERSHIP", "USUFRUCT"]},
+            format="json"
+        )
+        response = CompareSpouseOptionsView.as_view()(request)
+        body = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert body["reference_option"] == "QUARTER_OWNERSHIP"
+        assert [o["option"] for o in body["options"]] == ["QUARTER_OWNERSHIP", "USUFRUCT"]
+
+    def test_api_results_are_enriched_like_a_simulation(self):
+        raw = golden_input("SC006")
+        request = APIRequestFactory().post("/api/v1/simulate/spouse-options/", {"simulation": raw}, format="json")
+        body = json.loads(CompareSpouseOptionsView.as_view()(request).content)
+        comparison = SuccessionCalculator().compare_spouse_options(SimulationInput(**raw))
+
+        expected = [explainer.enrich_output(o.result.model_dump(mode="json")) for o in comparison.options]
+        assert [o["result"] for o in body["options"]] == expected
@@ -0,0 +1,124 @@
+"""
+Integration tests for the sensitivity sweep (/api/v1/simulate/sweep/).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateSweepView
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput, SweepTarget, SweepInput, DetailLevel
+
+
+def golden_input(scenario_id):
+    path = Path(__file__).parent.parent / "golden_scenarios.json"
+    with open(path, "r", encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    return next(s["input"] for s in scenarios if s["id"] == scenario_id)
+
+
+def post_sweep(data):
+    request = APIRequestFactory().post("/api/v1/simulate/sweep/", data, format="json")
+    response = SimulateSweepView.as_view()(request)
+    response.render()
+    return response, json.loads(response.content)
+
+
+SWEEPS = [
+    ("SC005", SweepTarget.ASSET_VALUE, None),
+    ("SC_CHAOS_1", SweepTarget.DONATION_VALUE, "don_ancien"),
+    ("SC_CHAOS_2", SweepTarget.DEBT_AMOUNT, "emprunt"),
+]
+
+
+@pytest.mark.django_db
+class TestSweep:
+
+    @pytest.mark.parametrize("scenario_id,target,target_id", SWEEPS)
+    def test_each_point_matches_a_run(self, scenario_id, target, target_id):
+        input_data = SimulationInput(**golden_input(scenario_id))
+        target_id = target_id or input_data.assets[0].id
+        values = [0.0, 150_000.0, 400_000.0, 1_200_000.0]
+        calculator = SuccessionCalculator()
+
+        sweep = calculator.sweep(input_data, target, target_id, values)
+
+        assert sweep.values == values
+        for index, value in enumerate(values):
+            variant = SuccessionCalculator._sweep_variant(input_data, target, target_id, value)
+            expected = calculator.run(variant, detail_level=DetailLevel.SUMMARY)
+            assert sweep.total_tax_amount[index] == expected.global_metrics.total_tax_amount
+            for series, heir in zip(sweep.heirs, expected.heirs_breakdown):
+                assert series.id == heir.id
+                assert series.tax_amount[index] == heir.tax_amount
+                assert series.net_share_value[index] == heir.net_share_value
+
+    def test_simple_adoptee_taxed_as_third_party(self):
+        raw = golden_input("SC005")
+        child = next(m for m in raw["members"] if m["relationship"] == "CHILD")
+        child["adoption_type"] = "simple"
+        input_data = SimulationInput(**raw)
+        asset_id = input_data.assets[0].id
+        values = [150_000.0, 1_200_000.0]
+        calculator = SuccessionCalculator()
+
+        sweep = calculator.sweep(input_data, SweepTarget.ASSET_VALUE, asset_id, values)
+
+        series = next(s for s in sweep.heirs if s.id == child["id"])
+        for index, value in enumerate(values):
+            variant = SuccessionCalculator._sweep_variant(input_data, SweepTarget.ASSET_VALUE, asset_id, value)
+            expected = calculator.run(variant, detail_level=DetailLevel.SUMMARY)
+            heir = next(h for h in expected.heirs_breakdown if h.id == child["id"])
+            assert series.tax_amount[index] == heir.tax_amount > 0
+            assert sweep.total_tax_amount[index] == expected.global_metrics.total_tax_amount
+
+    def test_unknown_target_raises(self):
+        input_data = SimulationInput(**golden_input("SC005"))
+
+        with pytest.raises(ValueError):
+            SuccessionCalculator().sweep(input_data, SweepTarget.DEBT_AMOUNT, "missing", [1.0])
+
+    def test_values_include_bounds(self):
+        sweep_input = SweepInput(
+            simulation=golden_input("SC005"), target=SweepTarget.ASSET_VALUE, target_id="x",
+            start=400_000, stop=1_200_000, steps=9
+        )
+
+        assert sweep_input.values()[0] == 400_000
+        assert sweep_input.values()[-1] == 1_200_000
+        assert sweep_input.values()[1] == 500_000
+
+
+@pytest.mark.django_db
+class TestSweepApi:
+
+    def payload(self, **overrides):
+        raw = golden_input("SC005")
+        data = {
+            "simulation": raw, "target": "asset_value", "target_id": raw["assets"][0]["id"],
+            "start": 400_000, "stop": 1_200_000, "steps": 5
+        }
+        data.update(overrides)
+        return data
+
+    def test_returns_series(self):
+        response, body = post_sweep(self.payload())
+
+        assert response.status_code == 200
+        assert len(body["values"]) == len(body["total_tax_amount"]) == 5
+        assert all(len(heir["net_share_value"]) == 5 for heir in body["heirs"])
+        assert body["total_tax_amount"] == sorted(body["total_tax_amount"])
+
+    def test_unknown_target_is_rejected(self):
+        response, _ = post_sweep(self.payload(target_id="missing"))
+
+        assert response.status_code == 400
+
+    @override_settings(SIMULATION_SWEEP_MAX_STEPS=3)
+    def test_too_many_points_is_rejected(self):
+        response, _ = post_sweep(self.payload())
+
+        assert response.status_code == 400
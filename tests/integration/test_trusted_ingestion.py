@@ -0,0 +1,83 @@
+"""
+Integration tests for the trusted ingestion fast path (/api/v1/internal/simulate/, X-Api-Key).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from succession_engine.api.views import SimulateSuccessionView
+from succession_engine.schemas import SimulationInput
+from succession_engine.services.result_cache import reset_result_cache
+
+GOLDEN_PATH = Path(__file__).parent.parent / "golden_scenarios.json"
+
+
+def load_golden_inputs():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return [(s["id"], s["input"]) for s in json.load(f)["scenarios"]]
+
+
+def post_simulation(data, query="", trusted=False, **headers):
+    request = APIRequestFactory().post(f"/api/v1/simulate/{query}", data, format="json", **headers)
+    response = SimulateSuccessionView.as_view(trusted_ingestion=trusted)(request)
+    if isinstance(response, Response):
+        response.render()
+    return response, json.loads(response.content)
+
+
+@pytest.fixture
+def fresh_result_cache(fresh_legislation_snapshot):
+    reset_result_cache()
+    yield
+    reset_result_cache()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_result_cache")
+class TestTrustedIngestion:
+
+    @pytest.mark.parametrize("query", ["", "?detail=summary"])
+    @pytest.mark.parametrize("scenario_id,raw_input", load_golden_inputs()[:5])
+    def test_same_body_as_standard_route(self, scenario_id, raw_input, query):
+        with override_settings(SIMULATION_RESULT_CACHE_ENABLED=False):
+            _, standard = post_simulation(raw_input, query)
+            response, trusted = post_simulation(raw_input, query, trusted=True)
+
+        assert not isinstance(response, Response)
+        assert response["Content-Type"] == "application/json"
+        assert trusted == standard
+
+    @override_settings(SIMULATION_TRUSTED_API_KEYS=["cle-interne"])
+    def test_api_key_enables_fast_path(self, monkeypatch):
+        _, raw_input = load_golden_inputs()[0]
+        raw_validations = []
+        validate_json = SimulationInput.model_validate_json
+        monkeypatch.setattr(
+            SimulationInput, "model_validate_json",
+            lambda data: raw_validations.append(data) or validate_json(data)
+        )
+
+        post_simulation(raw_input, HTTP_X_API_KEY="autre-cle")
+        assert raw_validations == []
+        post_simulation(raw_input, HTTP_X_API_KEY="cle-interne")
+        assert len(raw_validations) == 1
+
+    def test_invalid_payload_is_rejected(self):
+        response, body = post_simulation({"assets": "pas une liste"}, trusted=True)
+
+        assert response.status_code == 400
+        assert {e["loc"][0] for e in body["errors"]} >= {"assets", "members"}
+
+    def test_second_call_is_served_from_cache(self):
+        _, raw_input = load_golden_inputs()[0]
+
+        first, first_body = post_simulation(raw_input, trusted=True)
+        second, second_body = post_simulation(raw_input, trusted=True)
+
+        assert first["X-Result-Cache"] == "MISS"
+        assert second["X-Result-Cache"] == "HIT"
+        assert second_body == first_body
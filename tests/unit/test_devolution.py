@@ -203,6 +203,21 @@ class TestExcessiveLiberalities:
         
         assert len(warnings) > 0
 
+    def test_fast_mode_skips_warnings(self):
+        """Mode rapide : aucun message construit."""
+        from succession_engine.core.devolution import check_excessive_liberalities
+        
+        warnings = check_excessive_liberalities(
+            reportable_donations_value=100000,
+            bequests_total_value=100000,
+            disposable_quota=100000,
+            legal_reserve=400000,
+            reserve_fraction=0.8,
+            explain=False
+        )
+        
+        assert warnings == []
+
 
 class TestRenunciation:
     """Tests for renunciation handling (Art. 805+ CC)."""
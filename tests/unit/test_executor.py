@@ -0,0 +1,167 @@
+"""
+Unit tests for SimulationExecutor (parallel batch execution).
+"""
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+
+from succession_engine.core.executor import SimulationExecutor, get_simulation_executor, reset_simulation_executor
+from succession_engine.schemas import DetailLevel, SimulationInput
+from succession_engine.services.legislation import invalidate_legislation_snapshot
+
+
+def load_golden_inputs(limit=8):
+    path = Path(__file__).parent.parent / "golden_scenarios.json"
+    with open(path, "r", encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    return [SimulationInput(**scenario["input"]) for scenario in scenarios[:limit]]
+
+
+def failing_initializer(*args):
+    raise RuntimeError("worker could not start")
+
+
+@pytest.mark.django_db
+class TestSimulationExecutor:
+
+    def test_parallel_results_match_sequential_in_order(self):
+        inputs = load_golden_inputs()
+
+        sequential = SimulationExecutor(max_workers=1).map(inputs)
+        parallel = SimulationExecutor(max_workers=2, chunksize=1).map(inputs)
+
+        assert [o["status"] for o in parallel] == ["ok"] * len(inputs)
+        assert parallel == sequential
+
+    def test_persistent_pool_is_reused(self):
+        inputs = load_golden_inputs(limit=4)
+
+        with SimulationExecutor(max_workers=2, chunksize=2) as executor:
+            first = executor.map(inputs)
+            second = executor.map(list(reversed(inputs)))
+
+        assert second == list(reversed(first))
+        assert executor._pool is None
+
+    def test_empty_batch(self):
+        assert SimulationExecutor(max_workers=2).map([]) == []
+
+    def test_small_batch_runs_in_process(self, monkeypatch):
+        inputs = load_golden_inputs(limit=2)
+        executor = SimulationExecutor(max_workers=4, chunksize=4)
+        monkeypatch.setattr(executor, "_create_pool", lambda workers: pytest.fail("pool created"))
+
+        outcomes = executor.map(inputs)
+
+        assert len(outcomes) == 2
+        assert all(o["status"] == "ok" for o in outcomes)
+
+    def test_detail_level_per_batch(self):
+        inputs = load_golden_inputs(limit=4)
+
+        with SimulationExecutor(max_workers=2, chunksize=1) as executor:
+            summary = executor.map(inputs, detail_level=DetailLevel.SUMMARY)
+            full = executor.map(inputs)
+
+        assert "calculation_steps" not in summary[0]["result"] and "calculation_steps" in full[0]["result"]
+        assert [o["result"]["global_metrics"] for o in summary] == [o["result"]["global_metrics"] for o in full]
+
+    def test_lazy_executor_runs_in_process_until_warm(self, monkeypatch):
+        inputs = load_golden_inputs(limit=4)
+        executor = SimulationExecutor(max_workers=2, chunksize=1, lazy=True)
+        try:
+            monkeypatch.setattr(executor, "_map_in_pool", lambda *a: pytest.fail("pool used before warm"))
+            monkeypatch.setattr(executor, "_warm_up", [])
+            monkeypatch.setattr(executor, "start", lambda *a, **k: executor)
+            sequential = executor.map(inputs)
+            monkeypatch.undo()
+
+            executor.start(wait_ready=True)
+            monkeypatch.setattr(executor, "_map_in_process", lambda *a: pytest.fail("warm pool not used"))
+
+            assert executor.ready
+            assert executor.map(inputs) == sequential
+        finally:
+            executor.shutdown()
+
+    def test_lazy_executor_starts_its_pool_on_first_parallel_batch(self):
+        executor = SimulationExecutor(max_workers=2, chunksize=1, lazy=True)
+        try:
+            executor.map(load_golden_inputs(limit=1))
+            assert executor._pool is None
+
+            outcomes = executor.map(load_golden_inputs(limit=2))
+
+            assert executor._pool is not None
+            assert [o["status"] for o in outcomes] == ["ok", "ok"]
+        finally:
+            executor.shutdown()
+
+    def test_dead_worker_restarts_the_pool(self, caplog):
+        inputs = load_golden_inputs(limit=4)
+        executor = SimulationExecutor(max_workers=2, chunksize=1, lazy=True).start(wait_ready=True)
+        try:
+            broken = executor._pool
+            os.kill(next(iter(broken._processes)), signal.SIGKILL)
+
+            outcomes = executor.map(inputs)
+
+            assert [o["status"] for o in outcomes] == ["ok"] * len(inputs)
+            assert executor._pool is not broken
+            assert "Simulation worker died" in caplog.text
+
+            executor.start(wait_ready=True)
+            assert executor.ready
+            assert executor.map(inputs) == outcomes
+        finally:
+            executor.shutdown()
+
+    def test_failed_warm_up_is_not_used(self, monkeypatch):
+        inputs = load_golden_inputs(limit=2)
+        executor = SimulationExecutor(max_workers=2, chunksize=1, lazy=True)
+        monkeypatch.setattr(
+            executor, "_create_pool",
+            lambda workers: ProcessPoolExecutor(max_workers=workers, initializer=failing_initializer)
+        )
+        try:
+            executor.start()
+            for future in executor._warm_up:
+                future.exception()
+
+            assert not executor.ready
+            assert [o["status"] for o in executor.map(inputs)] == ["ok", "ok"]
+            assert executor._pool is None
+        finally:
+            executor.shutdown()
+
+
+@pytest.mark.django_db
+class TestSharedSimulationExecutor:
+
+    @pytest.fixture(autouse=True)
+    def fresh_executor(self, fresh_legislation_snapshot):
+        reset_simulation_executor()
+        yield
+        reset_simulation_executor()
+
+    def test_reused_across_calls(self):
+        executor = get_simulation_executor()
+
+        assert executor.lazy
+        assert get_simulation_executor() is executor
+
+    @override_settings(SIMULATION_EXECUTOR_WORKERS=2)
+    def test_replaced_after_legislation_invalidation(self):
+        executor = get_simulation_executor().start()
+        pool = executor._pool
+
+        invalidate_legislation_snapshot()
+        replacement = get_simulation_executor()
+
+        assert replacement is not executor
+        assert executor._pool is None and pool is not None
@@ -0,0 +1,105 @@
+"""
+Unit tests for the vectorized tax scale (fiscal_vectorized).
+
+The vectorized engine must reproduce FiscalCalculator.calculate_inheritance_tax
+exactly on net taxable amounts, bracket boundaries included.
+"""
+import dataclasses
+
+import numpy as np
+import pytest
+
+from succession_engine.rules.fiscal import FiscalCalculator
+from succession_engine.rules.fiscal_vectorized import build_bracket_table, calculate_inheritance_taxes
+from succession_engine.schemas import HeirRelation
+from succession_engine.services.legislation import LegislationSnapshot, BracketRow, get_legislation_snapshot
+
+CHILD_BRACKETS = (
+    BracketRow(0.0, 8_072.0, 0.05),
+    BracketRow(8_072.0, 12_109.0, 0.10),
+    BracketRow(12_109.0, 15_932.0, 0.15),
+    BracketRow(15_932.0, 552_324.0, 0.20),
+    BracketRow(552_324.0, 902_838.0, 0.30),
+    BracketRow(902_838.0, 1_805_677.0, 0.40),
+    BracketRow(1_805_677.0, None, 0.45),
+)
+
+
+def make_snapshot():
+    """Snapshot without allowances: the scalar gross amount is the net taxable."""
+    return LegislationSnapshot(legislation_id=None, name="Test", year=2024, brackets={'CHILD': CHILD_BRACKETS})
+
+
+def sample_bases(brackets, count=2000, seed=42):
+    """Random amounts plus every bracket boundary (and its neighbours)."""
+    rng = np.random.default_rng(seed)
+    bounds = [b for row in brackets for b in (row.min_amount, row.max_amount) if b is not None]
+    edges = [b + delta for b in bounds for delta in (-0.01, 0.0, 0.01)]
+    return np.concatenate([rng.uniform(0, 3_000_000, count).round(2), edges, [-10.0, 0.0]])
+
+
+def scalar_taxes(bases, relationship, legislation):
+    return np.array([
+        FiscalCalculator.calculate_inheritance_tax(float(base), relationship, legislation=legislation)[0]
+        for base in bases
+    ])
+
+
+class TestBracketTable:
+
+    def test_cumulative_tax(self):
+        table = build_bracket_table(CHILD_BRACKETS)
+
+        assert table.size == 7
+        assert table.cumulative_tax[0] == 0.0
+        assert table.cumulative_tax[4] == pytest.approx(8_072 * 0.05 + 4_037 * 0.10 + 3_823 * 0.15 + 536_392 * 0.20)
+        assert np.isinf(table.maxs[-1])
+
+
+class TestVectorizedTaxes:
+
+    def test_matches_scalar_exactly(self):
+        legislation = make_snapshot()
+        bases = sample_bases(CHILD_BRACKETS)
+
+        result = calculate_inheritance_taxes(bases, HeirRelation.CHILD, legislation=legislation)
+
+        np.testing.assert_array_equal(result.taxes, scalar_taxes(bases, HeirRelation.CHILD, legislation))
+
+    def test_breakdown_matches_scalar_details(self):
+        legislation = make_snapshot()
+
+        result = calculate_inheritance_taxes([700_000.0], 'CHILD', legislation=legislation, with_breakdown=True)
+        _, details = FiscalCalculator.calculate_inheritance_tax(700_000.0, HeirRelation.CHILD, legislation=legislation)
+
+        reached = [amount for amount in result.tax_for_bracket[0] if amount > 0]
+        assert reached == [bracket.tax_for_bracket for bracket in details.brackets_applied]
+        assert result.tax_for_bracket.shape == (1, 7)
+
+    def test_spouse_and_unknown_category_are_not_taxed(self):
+        legislation = make_snapshot()
+
+        spouse = calculate_inheritance_taxes([1e6, 2e6], HeirRelation.SPOUSE, legislation=legislation)
+        sibling = calculate_inheritance_taxes([1e6], HeirRelation.SIBLING, legislation=legislation, with_breakdown=True)
+
+        assert spouse.taxes.tolist() == [0.0, 0.0]
+        assert sibling.taxes.tolist() == [0.0]
+        assert sibling.tax_for_bracket.shape == (1, 0)
+
+
+@pytest.mark.django_db
+class TestVectorizedAgainstActiveLegislation:
+
+    @pytest.mark.parametrize("relationship", [
+        HeirRelation.CHILD, HeirRelation.SIBLING, HeirRelation.NEPHEW_NIECE, HeirRelation.COUSIN, HeirRelation.OTHER
+    ])
+    def test_matches_scalar_per_category(self, fresh_legislation_snapshot, relationship):
+        legislation = dataclasses.replace(get_legislation_snapshot(), allowances={})
+        category_brackets = legislation.get_brackets(
+            'RELATIVES_UP_TO_4TH_DEGREE' if relationship == HeirRelation.COUSIN else relationship.value
+        )
+        bases = sample_bases(category_brackets, count=500)
+
+        result = calculate_inheritance_taxes(bases, relationship, legislation=legislation)
+
+        np.testing.assert_array_equal(result.taxes, scalar_taxes(bases, relationship, legislation))
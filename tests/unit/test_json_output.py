@@ -0,0 +1,54 @@
+"""
+Tests de la sérialisation directe des résultats (services.json_output).
+"""
+import json
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import DetailLevel
+from succession_engine.services.explainer import explainer
+from succession_engine.services.json_output import dump_result
+from succession_engine.services.scenario_generator import generate_simulation_input
+
+
+@pytest.fixture
+def full_result(fresh_legislation_snapshot):
+    simulation_input = generate_simulation_input(seed=1, assets=200, donations=20, heirs=12, bequests=5)
+    return SuccessionCalculator(use_stage_cache=False).run(simulation_input)
+
+
+@pytest.mark.django_db
+class TestDumpResult:
+
+    def test_full_output_is_enriched_during_serialisation(self, full_result):
+        content = dump_result(full_result, DetailLevel.FULL)
+
+        assert isinstance(content, bytes)
+        assert json.loads(content) == explainer.enrich_output(full_result.model_dump(mode="json"))
+
+    def test_plain_dump_is_not_enriched(self, full_result):
+        steps = full_result.model_dump()["calculation_steps"]
+
+        assert steps and all("applied_rules" not in step for step in steps)
+
+    def test_summary_output(self, fresh_legislation_snapshot):
+        simulation_input = generate_simulation_input(seed=1, heirs=12)
+        result = SuccessionCalculator(use_stage_cache=False).run(simulation_input, detail_level=DetailLevel.SUMMARY)
+
+        assert json.loads(dump_result(result, DetailLevel.SUMMARY)) == result.model_dump(mode="json")
+
+    def test_orjson_encoder_same_document(self, full_result):
+        pytest.importorskip("orjson")
+
+        with override_settings(SIMULATION_JSON_ENCODER="orjson"):
+            content = dump_result(full_result, DetailLevel.FULL)
+
+        assert json.loads(content) == json.loads(dump_result(full_result, DetailLevel.FULL))
+
+    def test_unknown_encoder_rejected(self, full_result):
+        with override_settings(SIMULATION_JSON_ENCODER="ujson"):
+            with pytest.raises(ImproperlyConfigured):
+                dump_result(full_result)
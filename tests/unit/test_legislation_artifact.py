@@ -0,0 +1,77 @@
+"""
+Unit tests for the legislation artifact (services.legislation_artifact).
+
+Tests for:
+- Round trip snapshot -> file -> snapshot (plain and gzip), no database
+- Rejection of altered content, unknown versions and other engine constants
+"""
+import gzip
+import json
+
+import pytest
+
+from succession_engine.services.legislation import LegislationSnapshot, BracketRow
+from succession_engine.services.legislation_artifact import (
+    ARTIFACT_VERSION, artifact_to_snapshot, dump_legislation_artifact,
+    load_legislation_artifact, snapshot_to_artifact,
+)
+
+
+@pytest.fixture
+def snapshot():
+    return LegislationSnapshot(
+        legislation_id=3,
+        name="Loi de Finances 2025",
+        year=2025,
+        allowances={'CHILD': 100_000.0, 'SPOUSE': float('inf')},
+        brackets={'CHILD': (
+            BracketRow(0.0, 8_072.0, 0.05),
+            BracketRow(8_072.0, None, 0.20),
+        )},
+        usufruct_scale=((21, 0.9), (999, 0.1)),
+    )
+
+
+class TestArtifactRoundTrip:
+
+    @pytest.mark.parametrize("filename", ["legislation.json", "legislation.json.gz"])
+    def test_round_trip(self, snapshot, tmp_path, filename):
+        path = tmp_path / filename
+        dump_legislation_artifact(snapshot, path)
+
+        loaded = load_legislation_artifact(path)
+
+        assert loaded == snapshot
+        assert loaded.fingerprint == snapshot.fingerprint
+        assert loaded.usufruct_rates == snapshot.usufruct_rates
+        assert loaded.get_allowance('SPOUSE') == float('inf')
+
+    def test_gzip_is_compressed(self, snapshot, tmp_path):
+        dump_legislation_artifact(snapshot, tmp_path / "l.json.gz")
+
+        assert json.loads(gzip.decompress((tmp_path / "l.json.gz").read_bytes()))["version"] == ARTIFACT_VERSION
+
+
+class TestArtifactValidation:
+
+    def test_altered_content_is_rejected(self, snapshot):
+        artifact = snapshot_to_artifact(snapshot)
+        artifact["brackets"]["CHILD"][1][2] = 0.10
+
+        with pytest.raises(ValueError, match="fingerprint"):
+            artifact_to_snapshot(artifact)
+
+    def test_unknown_version_is_rejected(self, snapshot):
+        artifact = snapshot_to_artifact(snapshot)
+        artifact["version"] = ARTIFACT_VERSION + 1
+
+        with pytest.raises(ValueError, match="version"):
+            artifact_to_snapshot(artifact)
+
+    def test_other_engine_constants_are_rejected(self, snapshot):
+        artifact = snapshot_to_artifact(snapshot)
+        artifact["constants"]["DUTREIL_EXEMPTION_RATE"] = 0.5
+
+        with pytest.raises(ValueError, match="DUTREIL_EXEMPTION_RATE"):
+            artifact_to_snapshot(artifact)
+        assert artifact_to_snapshot(artifact, check_constants=False) == snapshot
@@ -0,0 +1,122 @@
+"""
+Unit tests for the compiled legislation snapshot.
+
+Tests for:
+- Compilation from the database (allowances, sorted brackets)
+- Invalidation through model signals
+- Injection into FiscalCalculator / SuccessionCalculator (no ORM in steady state)
+"""
+import pytest
+from datetime import date
+
+
+def make_snapshot(**overrides):
+    """Build a small in-memory snapshot (direct line only)."""
+    from succession_engine.services.legislation import LegislationSnapshot, BracketRow
+    params = dict(
+        legislation_id=None,
+        name="Test",
+        year=2024,
+        allowances={'CHILD': 100_000.0},
+        brackets={'CHILD': (
+            BracketRow(0.0, 8_072.0, 0.05),
+            BracketRow(8_072.0, 12_109.0, 0.10),
+            BracketRow(12_109.0, 15_932.0, 0.15),
+            BracketRow(15_932.0, 552_324.0, 0.20),
+            BracketRow(552_324.0, None, 0.30),
+        )},
+    )
+    params.update(overrides)
+    return LegislationSnapshot(**params)
+
+
+class TestSnapshotInjection:
+    """FiscalCalculator works on an injected snapshot without database access."""
+
+    def test_tax_with_injected_snapshot(self):
+        """200k to a child: 100k allowance, 18 194.35€ of duties."""
+        from succession_engine.rules.fiscal import FiscalCalculator
+        from succession_engine.schemas import HeirRelation
+
+        tax, details = FiscalCalculator.calculate_inheritance_tax(
+            200_000, HeirRelation.CHILD, legislation=make_snapshot()
+        )
+
+        assert tax == pytest.approx(18_194.35, abs=0.01)
+        assert details.allowance_amount == 100_000.0
+        assert len(details.brackets_applied) == 4
+
+    def test_missing_category_yields_no_tax(self):
+        """A category without brackets is not taxed (legacy behaviour)."""
+        from succession_engine.rules.fiscal import FiscalCalculator
+        from succession_engine.schemas import HeirRelation
+
+        tax, details = FiscalCalculator.calculate_inheritance_tax(
+            50_000, HeirRelation.SIBLING, legislation=make_snapshot()
+        )
+
+        assert tax == 0.0
+        assert details.net_taxable == 50_000
+
+    def test_fingerprint_tracks_content(self):
+        """Same rules -> same fingerprint; any rule change -> new fingerprint."""
+        assert make_snapshot().fingerprint == make_snapshot().fingerprint
+        assert make_snapshot().fingerprint != make_snapshot(allowances={'CHILD': 100_001.0}).fingerprint
+
+
+@pytest.mark.django_db
+class TestSnapshotFromDatabase:
+    """Compilation and invalidation against the migrated legislation."""
+
+    def test_compiles_active_legislation(self, fresh_legislation_snapshot):
+        from succession_engine.services.legislation import get_legislation_snapshot
+
+        snapshot = get_legislation_snapshot()
+
+        assert snapshot is not None
+        assert snapshot.get_allowance('CHILD') == 100_000.0
+        mins = [row.min_amount for row in snapshot.get_brackets('CHILD')]
+        assert mins == sorted(mins)
+        assert snapshot.get_brackets('CHILD')[-1].max_amount is None
+
+    def test_cached_between_calls(self, fresh_legislation_snapshot, django_assert_num_queries):
+        from succession_engine.services.legislation import get_legislation_snapshot
+
+        first = get_legislation_snapshot()
+        with django_assert_num_queries(0):
+            assert get_legislation_snapshot() is first
+
+    def test_invalidated_on_allowance_save(self, fresh_legislation_snapshot):
+        from succession_engine.models import Allowance
+        from succession_engine.services.legislation import get_legislation_snapshot
+
+        snapshot = get_legislation_snapshot()
+        allowance = Allowance.objects.get(legislation_id=snapshot.legislation_id, relationship='CHILD')
+        allowance.amount = 123_456
+        allowance.save()
+
+        assert get_legislation_snapshot().get_allowance('CHILD') == 123_456.0
+
+    def test_full_run_issues_no_query_in_steady_state(self, fresh_legislation_snapshot, django_assert_num_queries):
+        from succession_engine.core.calculator import SuccessionCalculator
+        from succession_engine.schemas import (
+            SimulationInput, Asset, FamilyMember, HeirRelation, OwnershipMode, AssetOrigin
+        )
+
+        input_data = SimulationInput(
+            matrimonial_regime="SEPARATION",
+            assets=[Asset(id="maison", estimated_value=400_000,
+                          ownership_mode=OwnershipMode.FULL_OWNERSHIP,
+                          asset_origin=AssetOrigin.PERSONAL_PROPERTY)],
+            members=[
+                FamilyMember(id="e1", birth_date=date(1990, 1, 1), relationship=HeirRelation.CHILD),
+                FamilyMember(id="e2", birth_date=date(1992, 1, 1), relationship=HeirRelation.CHILD),
+            ],
+        )
+        calculator = SuccessionCalculator()
+        calculator.run(input_data)  # Warm-up: compiles the snapshot
+
+        with django_assert_num_queries(0):
+            result = calculator.run(input_data)
+
+        assert result.global_metrics.total_tax_amount > 0
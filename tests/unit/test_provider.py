@@ -0,0 +1,126 @@
+"""
+Unit tests for the engine providers (services.provider).
+
+Tests for:
+- StaticProvider: packaged legislation, explicit snapshots, settings
+- Installing a provider (the engine reads its legislation and settings)
+- Running the engine in a process without Django
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from succession_engine.core.cache import get_stage_cache, reset_stage_cache
+from succession_engine.services.legislation import (
+    get_legislation_snapshot, get_legislation_snapshot_by_id, invalidate_legislation_snapshot
+)
+from succession_engine.services.provider import (
+    DjangoProvider, EngineProvider, StaticProvider, get_engine_provider, set_engine_provider
+)
+from tests.unit.test_legislation_snapshot import make_snapshot
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def restore_provider():
+    provider = get_engine_provider()
+    yield
+    set_engine_provider(provider)
+    reset_stage_cache()
+    invalidate_legislation_snapshot()
+
+
+class TestStaticProvider:
+
+    def test_packaged_legislation_by_default(self):
+        legislation = StaticProvider().load_active_legislation()
+
+        assert legislation.name == "Loi de Finances 2024"
+        assert legislation.get_allowance('CHILD') == 100_000.0
+
+    def test_explicit_legislations(self):
+        active, draft = make_snapshot(legislation_id=1), make_snapshot(legislation_id=2, name="Projet")
+        provider = StaticProvider(active, others=[draft])
+
+        assert provider.load_active_legislation() is active
+        assert provider.load_legislation(2) is draft
+        with pytest.raises(ValueError):
+            provider.load_legislation(3)
+
+    def test_provider_must_implement_legislation_loading(self):
+        class SettingsOnly(EngineProvider):
+            def setting(self, name, default=None):
+                return default
+
+        with pytest.raises(TypeError):
+            SettingsOnly()
+
+    def test_installed_provider_feeds_the_engine(self, restore_provider):
+        draft = make_snapshot(legislation_id=2, name="Projet")
+        set_engine_provider(
+            StaticProvider(make_snapshot(), others=[draft], settings={'SIMULATION_STAGE_CACHE_SIZE': 0})
+        )
+        reset_stage_cache()
+
+        assert get_legislation_snapshot().name == "Test"
+        assert get_legislation_snapshot_by_id(2) is draft
+        assert get_stage_cache() is None
+
+    def test_invalidation_during_cached_read_returns_the_snapshot(self, restore_provider, monkeypatch):
+        """The fast path reads snapshot and load time together: an invalidation in between never yields None."""
+        from succession_engine.services import legislation
+
+        set_engine_provider(StaticProvider(make_snapshot()))
+        snapshot = get_legislation_snapshot()
+
+        def invalidated_meanwhile():
+            invalidate_legislation_snapshot()
+            return None
+
+        monkeypatch.setattr(legislation, "_snapshot_ttl", invalidated_meanwhile)
+
+        assert get_legislation_snapshot() is snapshot
+
+    def test_invalidation_during_load_is_not_overwritten(self, restore_provider):
+        """A snapshot loaded across an invalidation is returned but not cached."""
+        drafts = iter([make_snapshot(legislation_id=2, name="Avant"), make_snapshot(legislation_id=2, name="Après")])
+
+        class EditedDuringLoad(StaticProvider):
+            def load_legislation(self, legislation_id):
+                snapshot = next(drafts)
+                invalidate_legislation_snapshot()
+                return snapshot
+
+        set_engine_provider(EditedDuringLoad(make_snapshot()))
+
+        assert get_legislation_snapshot_by_id(2).name == "Avant"
+        assert get_legislation_snapshot_by_id(2).name == "Après"
+
+
+def test_django_app_installs_the_django_provider():
+    assert isinstance(get_engine_provider(), DjangoProvider)
+
+
+def test_engine_runs_without_django():
+    """A golden scenario computed in a fresh interpreter without settings uses the packaged legislation."""
+    script = (
+        "import json, sys\n"
+        "from succession_engine.core.calculator import SuccessionCalculator\n"
+        "from succession_engine.schemas import SimulationInput\n"
+        "scenario = json.load(open('tests/golden_scenarios.json'))['scenarios'][0]\n"
+        "result = SuccessionCalculator().run(SimulationInput(**scenario['input']))\n"
+        "print(json.dumps({'tax': result.global_metrics.total_tax_amount,"
+        " 'django': [m for m in sys.modules if m.startswith('django')]}))\n"
+    )
+    env = {name: value for name, value in os.environ.items() if name != 'DJANGO_SETTINGS_MODULE'}
+    completed = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, cwd=ROOT)
+    outcome = json.loads(completed.stdout)
+
+    with open(ROOT / 'tests' / 'golden_scenarios.json', encoding='utf-8') as f:
+        expected = json.load(f)['scenarios'][0]['expected_output']['total_tax_amount']
+    assert outcome == {'tax': pytest.approx(expected), 'django': []}
@@ -0,0 +1,98 @@
+"""
+Tests du générateur de scénarios synthétiques (services.scenario_generator).
+"""
+from collections import Counter
+
+import pytest
+
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.rules.life_insurance import LifeInsuranceCalculator
+from succession_engine.schemas import HeirRelation, OwnershipMode, SimulationInput, DetailLevel
+from succession_engine.services.scenario_generator import (
+    ScenarioGenerator, GeneratorConfig, generate_simulation_input, FAMILIES
+)
+
+
+class TestDeterminism:
+
+    def test_same_seed_same_input(self):
+        config = GeneratorConfig(assets=50, donations=10, heirs=15, bequests=5)
+
+        first = ScenarioGenerator(seed=3).payload(config)
+        second = ScenarioGenerator(seed=3).payload(config)
+
+        assert first == second
+
+    def test_other_seed_other_input(self):
+        assert generate_simulation_input(seed=1) != generate_simulation_input(seed=2)
+
+    def test_unknown_family_rejected(self):
+        with pytest.raises(ValueError):
+            GeneratorConfig(family="cousins_germains")
+
+
+class TestStructure:
+
+    def test_requested_sizes(self):
+        simulation_input = generate_simulation_input(
+            seed=0, assets=5000, donations=500, debts=300, heirs=200, bequests=100
+        )
+
+        assert isinstance(simulation_input, SimulationInput)
+        assert len(simulation_input.assets) == 5000
+        assert len(simulation_input.donations) == 500
+        assert len(simulation_input.debts) == 300
+        assert len(simulation_input.wishes.specific_bequests) == 100
+        heirs = [m for m in simulation_input.members if m.relationship != HeirRelation.SPOUSE]
+        assert len(heirs) == 200
+        assert len({m.id for m in simulation_input.members}) == len(simulation_input.members)
+
+    def test_representation_chains(self):
+        simulation_input = generate_simulation_input(seed=0, heirs=200, representation_ratio=0.5)
+        members = {m.id: m for m in simulation_input.members}
+
+        grandchildren = [m for m in members.values() if m.relationship == HeirRelation.GRANDCHILD]
+        great_grandchildren = [m for m in members.values() if m.relationship == HeirRelation.GREAT_GRANDCHILD]
+        assert grandchildren and great_grandchildren
+        # Predeceased children are absent, great-grandchildren represent a grandchild member
+        assert all(m.represented_heir_id not in members for m in grandchildren)
+        assert all(members[m.represented_heir_id].relationship == HeirRelation.GRANDCHILD for m in great_grandchildren)
+
+    def test_collaterals_fente_lines(self):
+        simulation_input = generate_simulation_input(seed=0, family="collaterals", heirs=40)
+        lines = Counter(m.paternal_line for m in simulation_input.members)
+
+        assert not any(m.relationship == HeirRelation.SPOUSE for m in simulation_input.members)
+        assert lines[True] and lines[False]
+
+    def test_indivision_and_life_insurance_clauses(self):
+        simulation_input = generate_simulation_input(seed=0, assets=500)
+        member_ids = {m.id for m in simulation_input.members}
+
+        indivision = [a for a in simulation_input.assets if a.ownership_mode == OwnershipMode.INDIVISION]
+        contracts = [a for a in simulation_input.assets if LifeInsuranceCalculator.is_life_insurance(a)]
+        assert indivision and all(a.indivision_details.othersShare for a in indivision)
+        assert contracts
+        assert all(
+            b.beneficiary_id in member_ids
+            for contract in contracts for b in contract.life_insurance_beneficiaries
+        )
+        assert any(
+            b.ownership_type == OwnershipMode.USUFRUCT
+            for contract in contracts for b in contract.life_insurance_beneficiaries
+        )
+
+
+@pytest.mark.django_db
+class TestEngineRuns:
+
+    @pytest.mark.parametrize("family", FAMILIES)
+    def test_generated_input_is_computed(self, family, fresh_legislation_snapshot):
+        simulation_input = generate_simulation_input(
+            seed=5, family=family, assets=300, donations=40, debts=40, heirs=40, bequests=20
+        )
+
+        result = SuccessionCalculator(use_stage_cache=False).run(simulation_input, detail_level=DetailLevel.SUMMARY)
+
+        assert result.global_metrics.total_estate_value > 0
+        assert len(result.heirs_breakdown) == len(simulation_input.members)
@@ -0,0 +1,122 @@
+"""
+Unit tests for the per-run lookups (core.index).
+"""
+from datetime import date
+
+import pytest
+
+from succession_engine.core.devolution import process_specific_bequests
+from succession_engine.core.estate import get_reportable_donations, reconstitute_estate
+from succession_engine.core.index import MemberIndex, SimulationIndex, index_by_id, group_by
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import AssetOrigin, Debt, FamilyMember, HeirRelation, SimulationInput, DetailLevel
+from succession_engine.services.scenario_generator import generate_simulation_input
+
+
+def member(member_id, relationship, **kwargs):
+    return FamilyMember(id=member_id, birth_date=date(1980, 1, 1), relationship=relationship, **kwargs)
+
+
+class TestMemberIndex:
+
+    def test_groups_keep_input_order(self):
+        members = MemberIndex([
+            member("c2", HeirRelation.CHILD),
+            member("s", HeirRelation.SPOUSE),
+            member("c1", HeirRelation.CHILD),
+            member("p", HeirRelation.PARENT),
+        ])
+
+        assert [m.id for m in members.of(HeirRelation.CHILD)] == ["c2", "c1"]
+        assert [m.id for m in members.of(HeirRelation.PARENT, HeirRelation.CHILD)] == ["c2", "c1", "p"]
+        assert members.of(HeirRelation.SIBLING) == []
+        assert members.spouse.id == "s"
+
+    def test_partner_is_the_spouse(self):
+        members = MemberIndex([member("c", HeirRelation.CHILD), member("pacs", HeirRelation.PARTNER)])
+
+        assert members.spouse.id == "pacs"
+
+    def test_first_item_wins_on_duplicate_ids(self):
+        first, second = member("x", HeirRelation.CHILD), member("x", HeirRelation.SIBLING)
+
+        assert index_by_id([first, second])["x"] is first
+        assert MemberIndex([first, second]).get("x") is first
+        assert MemberIndex([first]).get("unknown") is None
+
+    def test_group_by(self):
+        assert group_by([1, 2, 3, 4], lambda n: n % 2) == {1: [1, 3], 0: [2, 4]}
+
+
+class TestSimulationIndex:
+
+    def test_donations_by_beneficiary(self):
+        simulation_input = generate_simulation_input(seed=2, donations=60, heirs=10)
+        reportable, _ = get_reportable_donations(simulation_input.donations)
+
+        index = SimulationIndex.build(simulation_input, reportable)
+
+        for heir in simulation_input.members:
+            assert index.donations_of(heir.id) == [d for d in reportable if d.beneficiary_id == heir.id]
+
+    def test_donation_totals(self):
+        simulation_input = generate_simulation_input(seed=2, donations=60, heirs=10)
+        reportable, _ = get_reportable_donations(simulation_input.donations)
+
+        index = SimulationIndex.build(simulation_input, reportable)
+
+        for heir in simulation_input.members:
+            donations = index.donations_of(heir.id)
+            totals = index.donation_totals_of(heir.id)
+            assert totals.value == sum(d.value for d in donations)
+            assert totals.declared_value == sum(d.value for d in donations if d.is_declared_to_tax)
+
+    def test_bequests_same_with_and_without_index(self):
+        simulation_input = generate_simulation_input(seed=4, assets=200, heirs=20, bequests=80)
+        index = SimulationIndex.build(simulation_input)
+        args = (simulation_input.assets, simulation_input.wishes, simulation_input.members)
+
+        assert process_specific_bequests(*args, index=index) == process_specific_bequests(*args)
+
+    def test_debts_same_with_and_without_index(self):
+        simulation_input = generate_simulation_input(seed=4, assets=300, debts=150)
+        index = SimulationIndex.build(simulation_input)
+        args = (1_000_000.0, 0.0, simulation_input.debts, simulation_input.assets)
+
+        assert reconstitute_estate(*args, index=index) == reconstitute_estate(*args)
+
+    def test_debts_fast_mode_same_figures_without_warnings(self):
+        debts = [
+            Debt(id="obseques", amount=5000, debt_type="FUNERAL", asset_origin=AssetOrigin.PERSONAL_PROPERTY),
+            Debt(id="pret", amount=1000, debt_type="prêt", is_deductible=False, proof_provided=True,
+                 asset_origin=AssetOrigin.PERSONAL_PROPERTY),
+        ]
+        args = (1_000_000.0, 0.0, debts, [])
+
+        net, deductible, warnings = reconstitute_estate(*args)
+        fast_net, fast_deductible, fast_warnings = reconstitute_estate(*args, explain=False)
+
+        assert warnings
+        assert (fast_net, fast_deductible, fast_warnings) == (net, deductible, [])
+
+
+@pytest.mark.django_db
+def test_great_grandchildren_join_the_root_souche(fresh_legislation_snapshot):
+    simulation_input = SimulationInput(
+        matrimonial_regime="SEPARATION",
+        assets=[{"id": "a", "estimated_value": 600_000, "ownership_mode": "FULL_OWNERSHIP",
+                 "asset_origin": "PERSONAL_PROPERTY"}],
+        members=[
+            {"id": "c1", "birth_date": "1960-01-01", "relationship": "CHILD"},
+            {"id": "gc1", "birth_date": "1985-01-01", "relationship": "GRANDCHILD", "represented_heir_id": "c2"},
+            {"id": "ggc1", "birth_date": "2010-01-01", "relationship": "GREAT_GRANDCHILD",
+             "represented_heir_id": "gc1"},
+        ]
+    )
+
+    result = SuccessionCalculator(use_stage_cache=False).run(simulation_input, detail_level=DetailLevel.SUMMARY)
+    shares = {h.id: h.legal_share_percent for h in result.heirs_breakdown}
+
+    assert shares["c1"] == pytest.approx(50.0)
+    assert shares["gc1"] == pytest.approx(25.0)
+    assert shares["ggc1"] == pytest.approx(25.0)
@@ -0,0 +1,144 @@
+"""
+Unit tests for the stage cache (LRU + canonical content hash).
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+
+from succession_engine.core.cache import LRUCache, canonical_hash, get_stage_cache, reset_stage_cache
+from succession_engine.core.calculator import SuccessionCalculator
+from succession_engine.schemas import SimulationInput
+
+
+def golden_input(scenario_id):
+    path = Path(__file__).parent.parent / "golden_scenarios.json"
+    with open(path, "r", encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    return next(s["input"] for s in scenarios if s["id"] == scenario_id)
+
+
+@pytest.fixture
+def fresh_stage_cache():
+    reset_stage_cache()
+    yield
+    reset_stage_cache()
+
+
+class TestLRUCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_evicts_beyond_max_weight(self):
+        cache = LRUCache(maxsize=10, max_weight=100)
+        cache.set("a", 1, weight=40)
+        cache.set("b", 2, weight=40)
+        cache.get("a")
+        cache.set("c", 3, weight=40)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.total_weight == 80
+
+    def test_entry_heavier_than_max_weight_not_stored(self):
+        cache = LRUCache(maxsize=10, max_weight=100)
+        cache.set("a", 1, weight=40)
+        cache.set("big", 2, weight=101)
+
+        assert "big" not in cache
+        assert "a" in cache
+        assert cache.total_weight == 40
+
+    def test_replacing_entry_updates_weight(self):
+        cache = LRUCache(maxsize=10, max_weight=100)
+        cache.set("a", 1, weight=60)
+        cache.set("a", 2, weight=30)
+        cache.delete("a")
+
+        assert cache.total_weight == 0
+
+    def test_zero_size_stores_nothing(self):
+        cache = LRUCache(maxsize=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+
+class TestCanonicalHash:
+
+    def test_independent_of_payload_key_order(self):
+        raw = golden_input("SC005")
+        reordered = {key: raw[key] for key in reversed(list(raw))}
+        reordered["assets"] = [dict(reversed(list(a.items()))) for a in raw["assets"]]
+
+        assert canonical_hash(SimulationInput(**raw)) == canonical_hash(SimulationInput(**reordered))
+
+    def test_content_change_changes_key(self):
+        raw = golden_input("SC005")
+        changed = json.loads(json.dumps(raw))
+        changed["assets"][0]["estimated_value"] += 1
+
+        assert canonical_hash(SimulationInput(**raw)) != canonical_hash(SimulationInput(**changed))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_stage_cache")
+class TestCalculatorStageCache:
+
+    def test_liquidation_reused_when_only_debts_change(self):
+        raw = golden_input("SC005")
+        edited = json.loads(json.dumps(raw))
+        edited["debts"] = [{"id": "credit", "amount": 10000, "debt_type": "emprunt immobilier", "asset_origin": "PERSONAL_PROPERTY"}]
+        calculator = SuccessionCalculator()
+        cache = get_stage_cache()
+
+        calculator.run(SimulationInput(**raw))
+        assert cache.hits == 0
+        result = calculator.run(SimulationInput(**edited))
+
+        assert cache.hits == 1  # liquidation reused, reconstitution recomputed
+        uncached = SuccessionCalculator(use_stage_cache=False).run(SimulationInput(**edited))
+        assert result.model_dump() == uncached.model_dump()
+
+    def test_cached_runs_are_independent(self):
+        input_data = SimulationInput(**golden_input("SC016"))
+        calculator = SuccessionCalculator()
+
+        first = calculator.run(input_data)
+        second = calculator.run(input_data)
+
+        assert get_stage_cache().hits == 1
+        assert first.model_dump() == second.model_dump()
+        assert len(first.alerts) == len(second.alerts)
+
+    def test_byte_budget_bounds_calculator_entries(self):
+        calculator = SuccessionCalculator()
+        cache = get_stage_cache()
+        input_data = SimulationInput(**golden_input("SC005"))
+        calculator.run(input_data)
+        one_run = cache.total_weight
+        reset_stage_cache()
+
+        with override_settings(SIMULATION_STAGE_CACHE_MAX_BYTES=one_run):
+            calculator = SuccessionCalculator()
+            cache = get_stage_cache()
+            calculator.run(input_data)
+            calculator.run(SimulationInput(**golden_input("SC016")))
+
+            assert 0 < cache.total_weight <= one_run
+            assert len(cache) < 4
+
+    @override_settings(SIMULATION_STAGE_CACHE_SIZE=0)
+    def test_disabled_by_setting(self):
+        assert get_stage_cache() is None
+        assert SuccessionCalculator().stage_cache is None
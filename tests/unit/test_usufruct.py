@@ -8,6 +8,9 @@ Tests for:
 import pytest
 from datetime import date
 
+# Rates are read from the active legislation snapshot (compiled once from the DB)
+pytestmark = pytest.mark.django_db
+
 
 class TestUsufructRates:
     """Tests for usufruct rates by age (Art. 669 CGI)."""
@@ -139,3 +142,73 @@ class TestTemporaryUsufruct:
         assert rate == 0.23
         assert usufruct_value == pytest.approx(46000, rel=0.01)
 
+
+class TestUsufructRateTable:
+    """Tests for the precomputed age -> rate table."""
+    
+    def test_table_covers_0_to_120(self):
+        """One entry per age, boundaries of Art. 669 CGI respected."""
+        from succession_engine.services.legislation import DEFAULT_USUFRUCT_RATES
+        
+        assert len(DEFAULT_USUFRUCT_RATES) == 121
+        assert DEFAULT_USUFRUCT_RATES[20] == 0.90
+        assert DEFAULT_USUFRUCT_RATES[21] == 0.80
+        assert DEFAULT_USUFRUCT_RATES[90] == 0.20
+        assert DEFAULT_USUFRUCT_RATES[91] == 0.10
+    
+    def test_out_of_range_ages_are_clamped(self):
+        """Negative ages and ages above 120 use the table bounds."""
+        from succession_engine.rules.usufruct import UsufructValuator
+        
+        assert UsufructValuator.get_usufruct_rate(-3) == 0.90
+        assert UsufructValuator.get_usufruct_rate(130) == 0.10
+    
+    def test_legislation_scale_overrides_default(self):
+        """A legislation scale is used first, uncovered ages fall back to the default."""
+        from succession_engine.rules.usufruct import UsufructValuator
+        from succession_engine.services.legislation import LegislationSnapshot
+        
+        snapshot = LegislationSnapshot(
+            legislation_id=None, name="Test", year=2025,
+            usufruct_scale=((21, 0.85), (51, 0.55))
+        )
+        
+        assert UsufructValuator.get_usufruct_rate(20, snapshot) == 0.85
+        assert UsufructValuator.get_usufruct_rate(45, snapshot) == 0.55
+        assert UsufructValuator.get_usufruct_rate(65, snapshot) == 0.40
+    
+    def test_dismemberment_scenario_issues_no_query(self, django_assert_num_queries):
+        """Spouse usufruct + dismembered life insurance: no DB hit once the snapshot is warm."""
+        from succession_engine.core.calculator import SuccessionCalculator
+        from succession_engine.schemas import (
+            SimulationInput, Asset, FamilyMember, HeirRelation, OwnershipMode, AssetOrigin,
+            LifeInsuranceBeneficiary, Wishes, SpouseChoice, SpouseChoiceType
+        )
+        
+        input_data = SimulationInput(
+            matrimonial_regime="SEPARATION",
+            assets=[
+                Asset(id="maison", estimated_value=300_000,
+                      ownership_mode=OwnershipMode.FULL_OWNERSHIP,
+                      asset_origin=AssetOrigin.PERSONAL_PROPERTY),
+                Asset(id="av", estimated_value=200_000, premiums_before_70=200_000,
+                      ownership_mode=OwnershipMode.FULL_OWNERSHIP,
+                      asset_origin=AssetOrigin.PERSONAL_PROPERTY,
+                      life_insurance_beneficiaries=[
+                          LifeInsuranceBeneficiary(beneficiary_id="conjoint", ownership_type=OwnershipMode.USUFRUCT),
+                          LifeInsuranceBeneficiary(beneficiary_id="enfant", ownership_type=OwnershipMode.BARE_OWNERSHIP),
+                      ]),
+            ],
+            members=[
+                FamilyMember(id="conjoint", birth_date=date(1955, 6, 1), relationship=HeirRelation.SPOUSE),
+                FamilyMember(id="enfant", birth_date=date(1985, 1, 1), relationship=HeirRelation.CHILD),
+            ],
+            wishes=Wishes(spouse_choice=SpouseChoice(choice=SpouseChoiceType.USUFRUCT)),
+        )
+        calculator = SuccessionCalculator()
+        calculator.run(input_data)  # Warm-up
+        
+        with django_assert_num_queries(0):
+            result = calculator.run(input_data)
+        
+        assert result.spouse_details.has_usufruct is True
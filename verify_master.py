@@ -3,7 +3,6 @@ import os
 import django
 from django.conf import settings
 from datetime import date
-from unittest.mock import MagicMock, patch
 
 # Configure minimal Django settings
 if not settings.configured:
@@ -74,44 +73,30 @@ buckets_nephew = [ # Neveux/Nièces (55%)
 ]
 
 
-# Mock Legislation
-class MockLegislation:
-    id = 1
-    
-# Mock QuerySets / Managers
-class MockQuerySet(list):
-    def first(self):
-        return self[0] if self else None
-    def order_by(self, *args):
-        return self
-    def exists(self):
-        return len(self) > 0
-
-def mock_allowance_filter(**kwargs):
-    # Return filtered allowances based on relationship
-    rel = kwargs.get('relationship')
-    return MockQuerySet([x for x in allowances_data if x.relationship == rel])
-
-def mock_bracket_filter(**kwargs):
-    rel = kwargs.get('relationship')
-    if rel == 'CHILD': return MockQuerySet(buckets_direct)
-    if rel == 'SIBLING': return MockQuerySet(buckets_sibling)
-    if rel == 'NEPHEW_NIECE': return MockQuerySet(buckets_nephew)
-    return MockQuerySet(buckets_other) # Fallback
-
-# Apply Patches
-patch_leg = patch('succession_engine.models.Legislation.objects.get', return_value=MockLegislation())
-patch_allow = patch('succession_engine.models.Allowance.objects.filter', side_effect=mock_allowance_filter)
-patch_bracket = patch('succession_engine.models.TaxBracket.objects.filter', side_effect=mock_bracket_filter)
-
-patch_leg.start()
-patch_allow.start()
-patch_bracket.start()
+# Mock Legislation: compiled snapshot injected into the calculator (no ORM access)
+from succession_engine.services.legislation import LegislationSnapshot, BracketRow
+
+def _rows(buckets):
+    return tuple(BracketRow(min_amount=b.min_amount, max_amount=b.max_amount, rate=b.rate) for b in buckets)
+
+MOCK_LEGISLATION = LegislationSnapshot(
+    legislation_id=1,
+    name="Barème 2024 simplifié",
+    year=2024,
+    allowances={a.relationship: a.amount for a in allowances_data},
+    brackets={
+        'CHILD': _rows(buckets_direct),
+        'SIBLING': _rows(buckets_sibling),
+        'NEPHEW_NIECE': _rows(buckets_nephew),
+        'OTHER': _rows(buckets_other),
+        'RELATIVES_UP_TO_4TH_DEGREE': _rows(buckets_other),  # Former mock fallback
+    },
+)
 
 
 print('=== 🛡️ GOD MODE VERIFICATION SUITE (14 Scenarios) ===')
 
-calc = SuccessionCalculator()
+calc = SuccessionCalculator(legislation=MOCK_LEGISLATION)
 
 def run_test(name, input_data, checks):
     print(f"\n🔹 [Test] {name}")